@@ -1,45 +1,78 @@
+import argparse
 import gradio as gr
 from pharmassist_agents.drug_profile_agent import render_tab as drug_tab
 from pharmassist_agents.regulatory_agent import render_tab as regulatory_tab
 from pharmassist_agents.outreach_agent import render_tab as outreach_tab
-from pharmassist_agents.trial_agent import render_tab as trial_tab
+from pharmassist_agents.trial_agent import render_tab as trial_tab, render_load_test_endpoint as trial_load_test_endpoint
+from pharmassist_agents.trial_portfolio import render_portfolio as trial_portfolio
 from pharmassist_agents.ops_team_agent import render_tab as ops_tab
 from pharmassist_agents.creator_agent import render_tab as creator_tab
+from pharmassist_agents.data_watcher import start_data_watcher
+from pharmassist_agents.model_routing import render_report as model_routing_report
+from pharmassist_agents.profiling import render_admin as profiling_admin
 
-with gr.Blocks(title="Pharmassist: Drug Launch Assistant") as demo:
-    gr.Markdown("""
-    # 🏥 Pharmassist: Drug Launch Assistant
-    
-    **Agentic AI for Pharmaceutical Development**
+
+def build_app(load_test: bool = False) -> gr.Blocks:
+    """Build the Gradio app; load_test adds the internal synthetic ranking endpoint"""
+    with gr.Blocks(title="Pharmassist: Drug Launch Assistant") as demo:
+        gr.Markdown("""
+        # 🏥 Pharmassist: Drug Launch Assistant
     
-    Demonstrating concepts from [The Complete Agentic AI Engineering Course (2025)] by Ed Donner
+        **Agentic AI for Pharmaceutical Development**
     
-    ### Implemented Agents:
-    - **Drug Profile** - Conversational AI with tool calling
-    - **Clinical Trials** - Data visualization and trial protocol analysis
-    - **Ops Team** - Multi-agent team coordination
-    - **Doctor Outreach** - Multi-agent email generation system
+        Demonstrating concepts from [The Complete Agentic AI Engineering Course (2025)] by Ed Donner
     
-    ### Planned Agents:
-    - Regulatory Brief, Flow Creator
-    """)
+        ### Implemented Agents:
+        - **Drug Profile** - Conversational AI with tool calling
+        - **Clinical Trials** - Data visualization and trial protocol analysis
+        - **Ops Team** - Multi-agent team coordination
+        - **Doctor Outreach** - Multi-agent email generation system
+        - **Regulatory Brief** - Parallel section generation from the drug profile
+        - **Flow Creator** - Create and run YAML-defined flows
+        """)
     
-    with gr.Tab("Drug Profile"): 
-        drug_tab()
+        with gr.Tab("Drug Profile"): 
+            drug_tab()
     
-    with gr.Tab("Regulatory Brief"): 
-        regulatory_tab()
+        with gr.Tab("Regulatory Brief"): 
+            regulatory_tab()
     
-    with gr.Tab("Clinical Trials"): 
-        trial_tab()
+        with gr.Tab("Clinical Trials"): 
+            trial_tab()
+            trial_portfolio()
     
-    with gr.Tab("Doctor Outreach"): 
-        outreach_tab()
+        with gr.Tab("Doctor Outreach"): 
+            outreach_tab()
     
-    with gr.Tab("Ops Team"): 
-        ops_tab()
+        with gr.Tab("Ops Team"): 
+            ops_tab()
     
-    with gr.Tab("Flow Creator"): 
-        creator_tab()
+        with gr.Tab("Flow Creator"): 
+            creator_tab()
+
+        model_routing_report()
+        profiling_admin()
+        if load_test:
+            trial_load_test_endpoint()
+    return demo
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run Pharmassist")
+    parser.add_argument("--host", help="Interface to listen on (default: Gradio's)")
+    parser.add_argument("--port", type=int, help="Port to listen on (default: Gradio's)")
+    parser.add_argument("--no-share", action="store_true", help="Don't create a public share link")
+    parser.add_argument("--no-prewarm", action="store_true", help="Don't run the data watcher in this process")
+    parser.add_argument("--load-test", action="store_true",
+                        help="Serve the synthetic site ranking endpoint used by loadtest_serving.py")
+    args = parser.parse_args()
+
+    # Pre-warm reports in the background whenever files in data/ change
+    start_data_watcher(prewarm=False if args.no_prewarm else None)
+
+    # Serving mode (python -m pharmassist_agents.serve) runs several of these on local ports
+    build_app(args.load_test).launch(server_name=args.host, server_port=args.port, share=not args.no_share)
+
 
-demo.launch(share=True)
\ No newline at end of file
+if __name__ == "__main__":
+    main()
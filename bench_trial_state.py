@@ -0,0 +1,173 @@
+#!/usr/bin/env python
+"""Memory benchmark for the trial graph state at 10k and 100k sites
+
+Each site count runs in a fresh subprocess so peak RSS is measured per size.
+LLM nodes are answered by an offline stand-in, so the numbers isolate data
+loading, node bodies and LangGraph state handling/checkpointing.
+
+    python bench_trial_state.py > bench_output.txt
+"""
+
+import argparse
+import json
+import os
+import resource
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+import numpy as np
+import pandas as pd
+from pathlib import Path
+
+os.environ.setdefault("OPENAI_API_KEY", "offline-benchmark")
+
+data_dir = Path("data")
+SITE_COUNTS = [10_000, 100_000]
+
+
+def current_rss_mb() -> float:
+    """Current resident set size (Linux /proc; falls back to peak RSS elsewhere)"""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 1e6
+    except OSError:
+        return peak_rss_mb()
+
+
+def peak_rss_mb() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / 1e6 if sys.platform == "darwin" else peak / 1e3
+
+
+def write_synthetic_program(path: Path, n: int, seed: int = 11):
+    """Write a trials.csv with n sites plus the sample drug profile"""
+    rng = np.random.default_rng(seed)
+    target = rng.integers(40, 150, n)
+    pd.DataFrame({
+        "site_id": [f"SITE-{i:06d}" for i in range(n)],
+        "site_name": [f"Synthetic Site {i}" for i in range(n)],
+        "country": rng.choice(["Germany", "Malaysia", "Singapore"], n),
+        "enrollment_target": target,
+        "enrolled": (target * rng.uniform(0.7, 1.0, n)).astype(int),
+        "completion_pct": rng.integers(50, 95, n),
+        "dropout_rate": rng.integers(2, 18, n),
+        "protocol_violations": rng.integers(0, 6, n),
+        "adverse_events_total": rng.integers(0, 20, n),
+        "serious_adverse_events": rng.integers(0, 4, n),
+        "efficacy_lvef_improvement": [f"{v:.1f}%" for v in rng.uniform(8, 13, n)],
+        "status": rng.choice(["Active", "Ongoing", "Delayed"], n),
+    }).to_csv(path / "trials.csv", index=False)
+    shutil.copy(data_dir / "drug_profile.json", path / "drug_profile.json")
+
+
+def offline_structured(route, schema, messages):
+    """Returns fixed structured outputs instead of calling the API"""
+    from pharmassist_agents import trial_agent
+    if schema is trial_agent.RiskAssessment:
+        return schema(risk_level="HIGH", risk_factors=["benchmark"], mitigation_strategy="n/a")
+    if schema is trial_agent.SafetyReview:
+        return schema(safety_status="ACCEPTABLE", adverse_events_summary="n/a",
+                      monitoring_recommendations=["n/a"])
+    return schema(go_no_go="GO", confidence_level="HIGH", critical_actions=["n/a"],
+                  executive_summary="n/a")
+
+
+def run_one(n: int) -> dict:
+    """Measure one site count inside this process"""
+    from langgraph.checkpoint.sqlite import SqliteSaver
+    import sqlite3
+    from pharmassist_agents import trial_agent
+
+    node_stats = {}
+
+    def timed(name, node):
+        # tracemalloc runs once for the whole invoke: risk and safety run in parallel
+        # threads, so per-node start/stop would reset each other's counters. Each node
+        # reports the traced-memory delta across its body; overlapping nodes share it.
+        def wrapper(state):
+            before, _ = tracemalloc.get_traced_memory()
+            start = time.perf_counter()
+            result = node(state)
+            elapsed = time.perf_counter() - start
+            after, _ = tracemalloc.get_traced_memory()
+            node_stats[name] = {"ms": round(elapsed * 1000, 2), "alloc_delta_kb": round((after - before) / 1024, 1)}
+            return result
+        return wrapper
+
+    trial_agent.invoke_structured = offline_structured
+    for name in ["trial_analyzer", "risk_assessment", "safety_review", "final_recommendation"]:
+        attr = f"{name}_node"
+        setattr(trial_agent, attr, timed(name, getattr(trial_agent, attr)))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        program = Path(tmp)
+        write_synthetic_program(program, n)
+        rss_before = current_rss_mb()
+
+        start = time.perf_counter()
+        trial_data = trial_agent.load_trial_data(program)
+        load_ms = (time.perf_counter() - start) * 1000
+        drug_profile = trial_agent.load_drug_profile(program)
+
+        checkpointer = SqliteSaver(sqlite3.connect(program / "checkpoints.sqlite", check_same_thread=False),
+                                   serde=trial_agent._serializer())
+        graph = trial_agent.create_trial_graph(checkpointer=checkpointer)
+        config = {"configurable": {"thread_id": "bench"}}
+
+        tracemalloc.start()
+        start = time.perf_counter()
+        graph.invoke(trial_agent.build_initial_state(trial_data, drug_profile), config)
+        invoke_ms = (time.perf_counter() - start) * 1000
+        _, invoke_peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        serde = trial_agent._serializer()
+        state_bytes = len(serde.dumps_typed(trial_data)[1])
+        records = pd.read_csv(program / "trials.csv").to_dict("records")
+        legacy_bytes = len(serde.dumps_typed({**trial_data, "sites": records})[1])
+
+    node_ms = sum(stats["ms"] for stats in node_stats.values())
+    return {
+        "sites": n,
+        "load_ms": round(load_ms, 1),
+        "invoke_ms": round(invoke_ms, 1),
+        "graph_overhead_ms": round(invoke_ms - node_ms, 1),
+        "invoke_alloc_peak_kb": round(invoke_peak / 1024, 1),
+        "nodes": node_stats,
+        "trial_data_kb": round(state_bytes / 1024, 1),
+        "legacy_trial_data_kb": round(legacy_bytes / 1024, 1),
+        "rss_delta_mb": round(current_rss_mb() - rss_before, 1),
+        "peak_rss_mb": round(peak_rss_mb(), 1),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sites", type=int, help="Measure a single site count in this process")
+    args = parser.parse_args()
+
+    if args.sites:
+        print(json.dumps(run_one(args.sites)))
+        return
+
+    print("📊 TRIAL GRAPH STATE MEMORY BENCHMARK\n")
+    for n in SITE_COUNTS:
+        output = subprocess.run([sys.executable, __file__, "--sites", str(n)],
+                                capture_output=True, text=True, check=True).stdout
+        stats = json.loads(output.strip().splitlines()[-1])
+        print(f"{n:,} sites")
+        print(f"  Peak RSS:            {stats['peak_rss_mb']} MB (+{stats['rss_delta_mb']} MB for the run)")
+        print(f"  load_trial_data:     {stats['load_ms']} ms")
+        print(f"  graph.invoke:        {stats['invoke_ms']} ms ({stats['graph_overhead_ms']} ms outside node bodies), "
+              f"{stats['invoke_alloc_peak_kb']} KB peak traced")
+        print(f"  trial_data in state: {stats['trial_data_kb']} KB (with per-site records: {stats['legacy_trial_data_kb']} KB)")
+        for name, node in stats["nodes"].items():
+            print(f"    {name:<22}{node['ms']:>8} ms  {node['alloc_delta_kb']:>+9} KB net traced")
+        print()
+
+
+if __name__ == "__main__":
+    main()
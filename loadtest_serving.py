@@ -0,0 +1,180 @@
+#!/usr/bin/env python
+"""Load test for serving mode: throughput vs worker count
+
+Starts `python -m pharmassist_agents.serve` with 1, 2 and 4 workers and drives it
+with concurrent clients mixing three LLM-free requests:
+
+- a fast-path chat question
+- the cached Clinical Trials report (written to the shared cache once by this
+  process, so every worker serves it without recomputing)
+- ranking a large synthetic trials.csv export held by each worker: uncached,
+  CPU-bound pandas parsing and scoring, the request only extra processes can
+  speed up. The workers serve this endpoint only when started with --load-test,
+  and the client picks one of a fixed set of table sizes, never a file.
+
+    python loadtest_serving.py --workers 1 2 4 --clients 16 --duration 15
+    python loadtest_serving.py --cpu-only     # ranking requests only
+
+The first two are light and mostly limited by Gradio's per-process concurrency,
+so they scale even on one core. Ranking throughput can only scale up to the
+number of CPU cores, which is printed next to each speedup.
+"""
+
+import argparse
+import http.client
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import numpy as np
+from pathlib import Path
+from urllib.parse import urlsplit
+
+os.environ.setdefault("OPENAI_API_KEY", "offline-loadtest")
+
+CHAT_QUESTIONS = [
+    "What's the enrollment percentage?",
+    "Which sites have >10% dropout?",
+    "When is the EMA submission?",
+    "How many SAEs so far?",
+]
+BASE_PORT = 7960
+READY_TIMEOUT_SECONDS = 240
+RANKING_SITES = 50_000
+RANKING_SIZES = [1_000, 10_000, 50_000, 100_000]  # trial_agent.LOAD_TEST_SIZES
+
+
+def start_server(workers: int, port: int, cache_dir: Path) -> subprocess.Popen:
+    env = {**os.environ, "PHARMASSIST_CACHE_DIR": str(cache_dir)}
+    server = subprocess.Popen(
+        [sys.executable, "-m", "pharmassist_agents.serve", "--workers", str(workers), "--port", str(port),
+         "--no-prewarm", "--load-test"],
+        env=env, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True,
+    )
+    deadline = time.monotonic() + READY_TIMEOUT_SECONDS
+    for line in server.stdout:
+        if line.startswith("✅ Serving"):
+            threading.Thread(target=server.stdout.read, daemon=True).start()  # keep draining
+            return server
+        if time.monotonic() > deadline or line.startswith("❌"):
+            break
+    server.terminate()
+    raise RuntimeError(f"Serving mode with {workers} workers did not start")
+
+
+def prefill_trial_report(cache_dir: Path):
+    """Write the trial report for the current data into the shared cache, as one worker would"""
+    script = (
+        "from pharmassist_agents.data_snapshot import report_store\n"
+        "from pharmassist_agents.trial_agent import TRIAL_REPORT, trial_data_version\n"
+        "report_store.put(TRIAL_REPORT, trial_data_version(), 'Load test report\\n' + 'x' * 4000)\n"
+    )
+    env = {**os.environ, "PHARMASSIST_CACHE_DIR": str(cache_dir)}
+    subprocess.run([sys.executable, "-c", script], env=env, check=True, capture_output=True)
+
+
+def assigned_worker(entry_port: int) -> int:
+    """Ask the entry point for a worker, as a browser following the redirect would"""
+    conn = http.client.HTTPConnection("127.0.0.1", entry_port, timeout=10)
+    conn.request("GET", "/")
+    response = conn.getresponse()
+    response.read()
+    conn.close()
+    return urlsplit(response.getheader("Location")).port
+
+
+def call(conn: http.client.HTTPConnection, api: str, data: list) -> str:
+    """Gradio REST call: submit, then read the event stream until it completes"""
+    conn.request("POST", f"/call/{api}", json.dumps({"data": data}), {"Content-Type": "application/json"})
+    event_id = json.loads(conn.getresponse().read())["event_id"]
+    conn.request("GET", f"/call/{api}/{event_id}")
+    body = conn.getresponse().read().decode()
+    if "event: complete" not in body:
+        raise RuntimeError(body[:200])
+    return body
+
+
+def client_loop(entry_port: int, stop: threading.Event, latencies: dict, errors: list, seed: int,
+                sites: int, cpu_only: bool):
+    conn = http.client.HTTPConnection("127.0.0.1", assigned_worker(entry_port), timeout=60)
+    i = seed
+    while not stop.is_set():
+        kind = "rank" if cpu_only else ("chat", "report", "rank")[i % 3]
+        start = time.perf_counter()
+        try:
+            if kind == "chat":
+                call(conn, "chat", [CHAT_QUESTIONS[i % len(CHAT_QUESTIONS)], []])
+            elif kind == "report":
+                call(conn, "run_trial_analysis", [])
+            else:
+                call(conn, "rank_synthetic_sites", [sites])
+            latencies[kind].append(time.perf_counter() - start)
+        except Exception as e:
+            errors.append(str(e))
+            conn.close()
+        i += 1
+
+
+def run(workers: int, clients: int, duration: float, port: int, sites: int, cpu_only: bool) -> dict:
+    with tempfile.TemporaryDirectory() as tmp:
+        cache_dir = Path(tmp)
+        server = start_server(workers, port, cache_dir)
+        try:
+            prefill_trial_report(cache_dir)
+            stop = threading.Event()
+            latencies, errors = {"chat": [], "report": [], "rank": []}, []
+            threads = [threading.Thread(target=client_loop, args=(port, stop, latencies, errors, i, sites, cpu_only))
+                       for i in range(clients)]
+            for thread in threads:
+                thread.start()
+            time.sleep(2)  # warm-up: sessions, first report load from SQLite
+            for samples in latencies.values():
+                samples.clear()
+            start = time.perf_counter()
+            time.sleep(duration)
+            completed = {kind: len(samples) for kind, samples in latencies.items()}
+            elapsed = time.perf_counter() - start
+            stop.set()
+            for thread in threads:
+                thread.join()
+        finally:
+            server.terminate()
+            server.wait(timeout=30)
+
+    everything = [latency for samples in latencies.values() for latency in samples]
+    p50, p95 = np.percentile(everything, [50, 95]) * 1000 if everything else (0, 0)
+    rank_p50 = np.percentile(latencies["rank"], 50) * 1000 if latencies["rank"] else 0
+    return {"workers": workers, "rps": sum(completed.values()) / elapsed, "rank_rps": completed["rank"] / elapsed,
+            "p50_ms": p50, "p95_ms": p95, "rank_p50_ms": rank_p50, "errors": len(errors)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--clients", type=int, default=16)
+    parser.add_argument("--duration", type=float, default=15)
+    parser.add_argument("--sites", type=int, default=RANKING_SITES, choices=RANKING_SIZES,
+                        help="Sites in the ranking export")
+    parser.add_argument("--cpu-only", action="store_true", help="Send only the CPU-bound ranking request")
+    args = parser.parse_args()
+
+    cores = os.cpu_count() or 1
+    mix = "ranking only" if args.cpu_only else "chat + cached report + ranking"
+    print(f"📊 SERVING MODE LOAD TEST ({cores} CPU cores, {args.clients} clients, {args.duration:g}s per run, {mix})\n")
+    print(f"{'Workers':>7} {'Req/s':>8} {'Speedup':>8} {'Rank/s':>8} {'Rank speedup':>13} "
+          f"{'Ideal (cores)':>14} {'p50 ms':>8} {'p95 ms':>8} {'Rank p50':>9} {'Errors':>7}")
+    baseline = rank_baseline = None
+    for n in args.workers:
+        result = run(n, args.clients, args.duration, BASE_PORT + n * 10, args.sites, args.cpu_only)
+        baseline = baseline or result["rps"]
+        rank_baseline = rank_baseline or result["rank_rps"]
+        rank_speedup = result["rank_rps"] / rank_baseline if rank_baseline else 0.0
+        print(f"{n:>7} {result['rps']:>8.1f} {result['rps'] / baseline:>7.2f}x {result['rank_rps']:>8.1f} "
+              f"{rank_speedup:>12.2f}x {min(n, cores):>13}x {result['p50_ms']:>8.1f} {result['p95_ms']:>8.1f} "
+              f"{result['rank_p50_ms']:>9.1f} {result['errors']:>7}", flush=True)
+
+if __name__ == "__main__":
+    main()
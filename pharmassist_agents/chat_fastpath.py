@@ -0,0 +1,303 @@
+"""Deterministic fast path for factual metric questions in the Drug Profile chat
+
+Direct lookups ("what's the enrollment percentage?", "which sites have >10%
+dropout?", "when is the EMA submission?") are answered from precomputed
+aggregates of data/ in microseconds. Anything the matcher is unsure about -
+no intent, several competing intents, an open-ended question, or a scope the
+cohort-wide aggregates cannot answer (one site, one country, a superlative, a
+range, a negation, or a subgroup, arm, status or event type) - returns None so
+the caller falls through to the LLM.
+"""
+
+import re
+import threading
+import time
+import numpy as np
+from collections import Counter, deque
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Deque, Dict, List, NamedTuple, Optional, Pattern
+
+from .data_files import file_key
+from .ops_analytics import fact_sheet, load_kols, load_profile, load_trials
+
+data_dir = Path("data")
+
+SOURCE_FILES = ["trials.csv", "doctors.csv", "drug_profile.json"]
+DEFAULT_DROPOUT_THRESHOLD = 10.0
+MAX_QUESTION_WORDS = 20
+LATENCY_SAMPLES = 1000
+
+# Open-ended questions always go to the LLM, even when they mention a metric
+OPEN_ENDED = re.compile(
+    r"\b(why|should|could|would|recommend|suggest|strategy|strategies|compare|explain|improve|"
+    r"plan|impact|risk of|what if|how (?:can|do|should|would|to))\b"
+)
+
+# Intents answer cohort-wide lists and totals; narrower or ranked scopes go to the LLM
+NARROW_SCOPE = re.compile(r"\bsite-\d+|\b(lowest|highest|most|(?<!at )least|best|worst|between)\b")
+REGION_NAMES = ["europe", "asia", "apac"]
+
+# Negated questions ("no violations", "10% or less", "not above") invert the list an intent would give
+NEGATION = re.compile(
+    r"(?<![/-])\b(no|not|none|without|never|excluding|except)\b(?!-)|n't\b|"
+    r"\bor (?:less|fewer|lower|below|under)\b|\b(?:at most|up to)\b"
+)
+# Subgroups, arms, site statuses and event types the aggregates do not break down by;
+# the statuses and event names in data/ are added in _aggregates
+QUALIFIERS = [
+    "placebo", "control", "arms?", "dos(?:e|es|ing)", "cohorts?", "subgroups?", "elderly", "older", "younger",
+    "aged?", "women", "men", "male", "female", "gender", "sex", "pediatric", "diabetic", "patients (?:with|over|under)",
+    "cardiac", "cardiovascular", "renal", "hepatic", "(?:drug|treatment)-related", "fatal", "deaths?",
+    "types?", "kinds?", "categor(?:y|ies)", "by (?:site|country|month|region)", "breakdown",
+    "terminated", "closed", "suspended", "paused", "withdrawn", "completed", "finished", "recruiting",
+]
+
+# ============================================================================
+# Precomputed aggregates (rebuilt only when a source file's mtime/size changes)
+# ============================================================================
+
+@lru_cache(maxsize=4)
+def _aggregates(data_path: Path, stamps: tuple) -> Dict[str, Any]:
+    trials = load_trials(data_path)
+    profile = load_profile(data_path)
+    kols = load_kols(data_path)
+
+    sites = trials.sort_values("dropout_rate", ascending=False, kind="stable")
+    recommended = kols[kols["recommended_for_phase_iii"].astype(bool)]
+    places = set(trials["country"]) | set(kols["country"]) | set(profile.get("target_market", []))
+    places |= {site.get("country", "") for site in profile.get("phase_iib_trial_sites", [])}
+    places = sorted({place.lower() for place in places if place} | set(REGION_NAMES), key=len, reverse=True)
+    safety = profile.get("safety_profile", {})
+    events = [event.get("event", "") for event in safety.get("serious_adverse_events", [])]
+    events += [re.sub(r"\s*\(.*\)", "", event) for event in safety.get("common_adverse_events", [])]
+    qualifiers = {re.escape(word.lower()) for word in list(trials["status"]) + events if word} | set(QUALIFIERS)
+    return {
+        "places": re.compile(r"\b(" + "|".join(re.escape(place) for place in places) + r")\b"),
+        "qualifiers": re.compile(r"\b(" + "|".join(sorted(qualifiers, key=len, reverse=True)) + r")\b"),
+        "facts": fact_sheet(data_path),
+        "site_ids": sites["site_id"].tolist(),
+        "site_names": sites["site_name"].tolist(),
+        "dropout": sites["dropout_rate"].to_numpy(dtype=float),
+        "violations": dict(zip(trials["site_id"], trials["protocol_violations"].astype(int))),
+        "timeline": profile.get("regulatory_operations", {}).get("regulatory_timeline", {}),
+        "regulatory": profile.get("regulatory_operations", {}),
+        "manufacturing": profile.get("manufacturing_operations", {}),
+        "phase_iii": profile.get("clinical_operations", {}).get("phase_iii_requirements", {}),
+        "safety": safety,
+        "efficacy": profile.get("efficacy_signals", {}).get("phase_iib_results", {}),
+        "top_kols": recommended.nlargest(3, "influence_score")[["name", "country", "influence_score"]]
+                               .to_records(index=False).tolist(),
+        "recommended_kols": len(recommended),
+    }
+
+def aggregates(data_path: Path = data_dir) -> Dict[str, Any]:
+    return _aggregates(data_path, tuple(file_key(data_path / name) for name in SOURCE_FILES))
+
+# ============================================================================
+# Intents
+# ============================================================================
+
+class Intent(NamedTuple):
+    name: str
+    all_of: List[Pattern]
+    none_of: List[Pattern]
+    answer: Callable[[Dict[str, Any], str], Optional[str]]  # None when the question is out of reach
+
+def _intent(name: str, all_of: List[str], answer: Callable[[Dict[str, Any], str], Optional[str]],
+            none_of: Optional[List[str]] = None) -> Intent:
+    return Intent(name, [re.compile(p) for p in all_of], [re.compile(p) for p in none_of or []], answer)
+
+PHASE_III = r"phase\s*(?:iii|3)\b"
+
+def _enrollment(agg, question):
+    f = agg["facts"]
+    return f"Enrollment is **{f['enrolled']}/{f['enrollment_target']} patients ({f['enrollment_pct']}%)** across {f['site_count']} sites."
+
+def _dropout_sites(agg, question):
+    match = re.search(r"(?:[<>]=?|above|over|below|under|than|least|exceeding)\s*(\d+(?:\.\d+)?)|(\d+(?:\.\d+)?)\s*%", question)
+    threshold = float(match.group(1) or match.group(2)) if match else DEFAULT_DROPOUT_THRESHOLD
+    # A number we could not read as the threshold ("0 dropout", "5 and 8%") means we misread the question
+    if len(re.findall(r"\d+(?:\.\d+)?", question)) != (1 if match else 0):
+        return None
+    below = re.search(r"<|below|under|less than|lower than", question)
+    inclusive = re.search(r">=|at least|or more", question)
+    dropout = agg["dropout"]
+    if below:
+        selected = np.flatnonzero(dropout < threshold)
+        phrase = f"below {threshold:g}%"
+    else:
+        selected = np.flatnonzero(dropout >= threshold if inclusive else dropout > threshold)
+        phrase = f"{'at least' if inclusive else 'above'} {threshold:g}%"
+    if selected.size == 0:
+        return f"No sites have a dropout rate {phrase}."
+    lines = [f"- {agg['site_ids'][i]} {agg['site_names'][i]}: {dropout[i]:g}%" for i in selected]
+    return f"**{selected.size} site(s)** have a dropout rate {phrase}:\n" + "\n".join(lines)
+
+def _violations(agg, question):
+    with_violations = {site: n for site, n in agg["violations"].items() if n > 0}
+    ranked = sorted(with_violations.items(), key=lambda item: -item[1])
+    lines = [f"- {site}: {n}" for site, n in ranked]
+    return (f"**{len(with_violations)} of {len(agg['violations'])} sites** reported protocol violations "
+            f"({sum(with_violations.values())} total):\n" + "\n".join(lines))
+
+def _saes(agg, question):
+    f = agg["facts"]
+    return (f"There are **{f['total_saes']} serious adverse events** in the Phase IIb sites "
+            f"(SAE rate {f['sae_rate_pct']}% of enrolled patients).")
+
+def _site_count(agg, question):
+    return f"The Phase IIb trial runs at **{agg['facts']['site_count']} sites**."
+
+def _submissions(agg, question):
+    timeline = agg["timeline"]
+    approval = re.search(r"approv", question)
+    lines = []
+    for agency in ("ema", "fda"):
+        if agency in question or not re.search(r"\b(ema|fda)\b", question):
+            key = f"expected_{agency}_approval" if approval else f"{agency}_submission"
+            lines.append(f"- {agency.upper()} {'approval (expected)' if approval else 'submission'}: **{timeline.get(key, 'n/a')}**")
+    return "\n".join(lines)
+
+def _phase_iii_start(agg, question):
+    return f"Phase III initiation is planned for **{agg['timeline'].get('phase_iii_initiation', 'n/a')}**."
+
+def _phase_iii_requirements(agg, question):
+    req = agg["phase_iii"]
+    cost = req.get("estimated_cost_usd")
+    patients = req.get("patients_needed")
+    patients = f"{patients:,}" if isinstance(patients, int) else "n/a"
+    return (f"Phase III needs **{patients} patients across {req.get('sites_required', 'n/a')} sites** "
+            f"over {req.get('duration_months', 'n/a')} months"
+            + (f" (estimated cost ${cost / 1e6:g}M)." if cost else "."))
+
+def _pathway(agg, question):
+    return f"Approval pathway: **{agg['regulatory'].get('approval_pathway', 'n/a')}**."
+
+def _cmc(agg, question):
+    return f"CMC status: **{agg['regulatory'].get('cmc_status', 'n/a')}**."
+
+def _capacity(agg, question):
+    f = agg["facts"]
+    facility = agg["manufacturing"].get("current_capacity", {}).get("facility", "n/a")
+    return (f"Current capacity is **{f['current_capacity']} tablets/month** ({facility}); Phase III needs "
+            f"**{f['required_capacity']}/month** ({f['expansion_factor']}), a {f['scaling_months']}-month scale-up "
+            f"costing ${f['expansion_investment']}.")
+
+def _kols(agg, question):
+    f = agg["facts"]
+    top = ", ".join(f"{name} ({country}, {score})" for name, country, score in agg["top_kols"])
+    return (f"We track **{f['kol_count']} KOLs**, {agg['recommended_kols']} recommended for Phase III "
+            f"and {f['investigators']} Phase IIb investigators. Most influential recommended: {top}.")
+
+def _discontinuation(agg, question):
+    return f"The discontinuation rate is **{agg['safety'].get('discontinuation_rate', 'n/a')}**."
+
+def _go_no_go(agg, question):
+    return f"The go/no-go decision date is **{agg['facts']['decision_date']}**."
+
+def _efficacy(agg, question):
+    results = agg["efficacy"]
+    return (f"Phase IIb LVEF improvement: mean **{results.get('lvef_improvement_mean', 'n/a')}**, "
+            f"range {results.get('lvef_improvement_range', 'n/a')} ({results.get('statistical_significance', 'n/a')}).")
+
+INTENTS: List[Intent] = [
+    _intent("enrollment", [r"\benrol", r"percent|%|progress|status|so far|total|how many|complete|where are we"],
+            _enrollment, none_of=[PHASE_III, r"deadline|site"]),
+    _intent("dropout_sites", [r"drop-?out", r"\bsites?\b|which|where"], _dropout_sites),
+    _intent("protocol_violations", [r"violation"], _violations),
+    _intent("sae_count", [r"\bsaes?\b|serious adverse", r"how many|count|total|number|rate"], _saes,
+            none_of=[r"\bsites?\b.*\bmost\b"]),
+    _intent("site_count", [r"how many|number of|count", r"\bsites?\b"], _site_count,
+            none_of=[PHASE_III, r"drop-?out|violation|need|requir|sae|adverse"]),
+    _intent("submission_dates", [r"\b(ema|fda)\b", r"submi|approv|fil(e|ing)|when|date"], _submissions),
+    _intent("phase_iii_start", [PHASE_III, r"start|initiat|begin|kick.?off|when"], _phase_iii_start,
+            none_of=[r"patients|how many|cost"]),
+    _intent("phase_iii_requirements", [PHASE_III, r"patients|how many|need|requir|cost|budget|duration|how long"],
+            _phase_iii_requirements, none_of=[r"capacity|tablets|manufactur"]),
+    _intent("approval_pathway", [r"pathway|designation"], _pathway),
+    _intent("cmc_status", [r"\bcmc\b"], _cmc),
+    _intent("manufacturing_capacity", [r"capacity|tablets|production"], _capacity),
+    _intent("kols", [r"\bkols?\b|key opinion|opinion leaders", r"how many|number|count|who|top|list|which"], _kols),
+    _intent("discontinuation_rate", [r"discontinu"], _discontinuation),
+    _intent("go_no_go_date", [r"go.?no.?go"], _go_no_go),
+    _intent("efficacy", [r"\blvef\b|efficacy", r"improve|result|mean|average|range|how much|what"], _efficacy,
+            none_of=[PHASE_III]),
+]
+
+# ============================================================================
+# Matcher
+# ============================================================================
+
+class FastPath:
+    """Intent matcher with hit-rate and latency counters"""
+
+    def __init__(self, data_path: Path = data_dir, intents: List[Intent] = INTENTS):
+        self.data_path = data_path
+        self.intents = intents
+        self.questions = 0
+        self.by_intent: Counter = Counter()
+        self.hit_latencies: Deque[float] = deque(maxlen=LATENCY_SAMPLES)
+        self.miss_latencies: Deque[float] = deque(maxlen=LATENCY_SAMPLES)
+        self._lock = threading.Lock()
+
+    def warm(self):
+        """Build the aggregates ahead of the first question"""
+        aggregates(self.data_path)
+
+    def match(self, question: str) -> Optional[Intent]:
+        """The single intent the question asks for, or None when unsure"""
+        question = question.lower()
+        if len(question.split()) > MAX_QUESTION_WORDS or OPEN_ENDED.search(question):
+            return None
+        if NARROW_SCOPE.search(question) or NEGATION.search(question):
+            return None
+        agg = aggregates(self.data_path)
+        if agg["places"].search(question) or agg["qualifiers"].search(question):
+            return None
+        matches = [
+            intent for intent in self.intents
+            if all(p.search(question) for p in intent.all_of) and not any(p.search(question) for p in intent.none_of)
+        ]
+        return matches[0] if len(matches) == 1 else None
+
+    def answer(self, question: str) -> Optional[str]:
+        """Deterministic answer for a factual question, or None to fall through to the LLM"""
+        start = time.perf_counter()
+        intent = self.match(question)
+        text = intent.answer(aggregates(self.data_path), question.lower()) if intent else None
+        if text is None:
+            intent = None
+        elapsed = time.perf_counter() - start
+
+        with self._lock:
+            self.questions += 1
+            if intent:
+                self.by_intent[intent.name] += 1
+                self.hit_latencies.append(elapsed)
+            else:
+                self.miss_latencies.append(elapsed)
+        if intent:
+            print(f"⚡ Fast path: {intent.name} answered in {elapsed * 1e6:.0f} µs")
+        return text
+
+    def report(self) -> str:
+        """Markdown summary of hit rate and latency"""
+        with self._lock:
+            if not self.questions:
+                return "No questions answered yet."
+            hits = sum(self.by_intent.values())
+            lines = [
+                f"**Hit rate:** {hits}/{self.questions} ({hits / self.questions * 100:.0f}%) answered without an LLM call",
+            ]
+            if self.hit_latencies:
+                p50, p95 = np.percentile(self.hit_latencies, [50, 95]) * 1e6
+                lines.append(f"**Fast-path latency:** p50 {p50:.0f} µs · p95 {p95:.0f} µs")
+            if self.miss_latencies:
+                lines.append(f"**Matcher overhead on LLM fall-through:** p50 {np.percentile(self.miss_latencies, 50) * 1e6:.0f} µs")
+            if self.by_intent:
+                lines.append("**By intent:** " + ", ".join(f"{name} {count}" for name, count in self.by_intent.most_common()))
+        return "\n\n".join(lines)
+
+
+fast_path = FastPath()
@@ -1,21 +1,49 @@
 import gradio as gr
-import os, pathlib, yaml
+import os, yaml
 
-CONFIG_DIR = pathlib.Path("config/agents")
-CONFIG_DIR.mkdir(parents=True, exist_ok=True)
+from .flow_registry import CONFIG_DIR, FlowBusyError, flow_executor, flow_file_name, flow_registry
+from .ops_team_tools import TOOL_REGISTRY
 
 def create_flow(name, goal, tools):
     if not name: return "name required"
     cfg = {"name": name, "goal": goal, "tools": [t.strip() for t in tools.split(",") if t.strip()]}
-    path = CONFIG_DIR / f"{name.lower().replace(' ','_')}.yaml"
-    with open(path, "w", encoding="utf-8") as f: yaml.safe_dump(cfg, f)
+    unknown = [t for t in cfg["tools"] if t not in TOOL_REGISTRY]
+    if unknown: return f"Unknown tools {unknown}; available: {', '.join(sorted(TOOL_REGISTRY))}"
+    CONFIG_DIR.mkdir(parents=True, exist_ok=True)
+    path = CONFIG_DIR / flow_file_name(name)
+    # Write-then-rename so the registry never sees a half-written file
+    tmp = path.with_suffix(".yaml.tmp")
+    with open(tmp, "w", encoding="utf-8") as f: yaml.safe_dump(cfg, f)
+    os.replace(tmp, path)
     return f"Created {path}"
 
+def run_flow(name, request):
+    if not name: return "❌ Select a flow"
+    try:
+        return flow_executor.run(name, request)
+    except (KeyError, FlowBusyError) as e:
+        return f"❌ {e}"
+    except Exception as e:
+        return f"❌ Error running flow: {str(e)}"
+
+def refresh_flows():
+    return gr.update(choices=flow_registry.names())
+
 def render_tab():
     with gr.Row():
         name = gr.Textbox(label="Agent name")
         goal = gr.Textbox(label="Goal")
-    tools = gr.Textbox(label="Tools (comma-separated)", value="files,datastore,http")
+    tools = gr.Textbox(label="Tools (comma-separated)", value="analyze_site_performance,read_regulatory_timeline")
     out = gr.Textbox(label="Result", interactive=False)
     btn = gr.Button("Create Flow")
     btn.click(create_flow, [name, goal, tools], out)
+
+    gr.Markdown("### ▶️ Run a Flow")
+    with gr.Row():
+        flow = gr.Dropdown(label="Flow", choices=flow_registry.names())
+        refresh = gr.Button("🔄 Refresh")
+    request = gr.Textbox(label="Request (optional, defaults to the flow's goal)")
+    run_btn = gr.Button("Run Flow", variant="primary")
+    result = gr.Markdown()
+    refresh.click(refresh_flows, None, flow)
+    run_btn.click(run_flow, [flow, request], result)
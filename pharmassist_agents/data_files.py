@@ -0,0 +1,24 @@
+"""Helpers shared by the modules that read and render files under data/"""
+
+from pathlib import Path
+from typing import Any
+
+
+def file_key(path: Path) -> tuple:
+    """(path, mtime, size) of a file, for caches that must notice edits"""
+    stat = path.stat()
+    return str(path), stat.st_mtime_ns, stat.st_size
+
+
+def readable(key: str) -> str:
+    """JSON key as words, e.g. 'phase_iib_status' -> 'phase iib status'"""
+    return key.replace("_", " ")
+
+
+def flatten(value: Any) -> str:
+    """Render a JSON subtree as compact 'key: value' text"""
+    if isinstance(value, dict):
+        return "; ".join(f"{readable(k)}: {flatten(v)}" for k, v in value.items())
+    if isinstance(value, list):
+        return " | ".join(flatten(item) for item in value)
+    return str(value)
@@ -0,0 +1,119 @@
+"""Data versioning and local cache locations shared across agents"""
+
+import hashlib
+import os
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, Optional
+from pydantic import BaseModel
+
+from .shared_cache import SharedCache
+
+CACHE_DIR = Path(os.getenv("PHARMASSIST_CACHE_DIR", ".cache"))
+
+REPORTS_NAMESPACE = "reports"
+# Long enough for a full Ops crew run; a crashed worker's lease is reclaimed after this
+COMPUTE_LEASE_SECONDS = 900
+LEASE_POLL_SECONDS = 0.5
+
+
+def cache_path(filename: str) -> Path:
+    """Path of a file inside the local cache directory (created on first use)"""
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    return CACHE_DIR / filename
+
+
+def data_version(*paths: Path) -> str:
+    """Content hash of the given data files; changes whenever any of them changes"""
+    digest = hashlib.sha256()
+    for path in paths:
+        digest.update(path.name.encode())
+        digest.update(path.read_bytes())
+    return digest.hexdigest()[:16]
+
+
+class PrecomputedReport(BaseModel):
+    """A report computed ahead of time for one data version"""
+    kind: str
+    data_version: str
+    text: str
+    computed_at: datetime
+
+    def stamp(self) -> str:
+        """Header line telling the user which data the report reflects"""
+        return f"🗂️ Data version {self.data_version} · computed {self.computed_at:%Y-%m-%d %H:%M:%S}"
+
+
+class ReportStore:
+    """
+    Thread-safe store of the latest precomputed report per kind.
+
+    With a SharedCache the reports also live in SQLite, so a report computed by one
+    worker process is served by every other worker without recomputing it.
+    """
+
+    def __init__(self, shared: Optional[SharedCache] = None):
+        self.shared = shared
+        self._reports: Dict[str, PrecomputedReport] = {}
+        self._compute_locks: Dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def get(self, kind: str, version: str) -> Optional[PrecomputedReport]:
+        """Return the stored report only if it was computed for this data version"""
+        with self._lock:
+            report = self._reports.get(kind)
+        if report and report.data_version == version:
+            return report
+        if self.shared is None:
+            return None
+
+        stored = self.shared.get(REPORTS_NAMESPACE, kind)
+        report = PrecomputedReport.model_validate_json(stored) if stored else None
+        if not report or report.data_version != version:
+            return None
+        with self._lock:
+            self._reports[kind] = report
+        return report
+
+    def put(self, kind: str, version: str, text: str) -> PrecomputedReport:
+        report = PrecomputedReport(kind=kind, data_version=version, text=text, computed_at=datetime.now())
+        with self._lock:
+            self._reports[kind] = report
+        if self.shared is not None:
+            self.shared.put(REPORTS_NAMESPACE, kind, report.model_dump_json())
+        return report
+
+    def get_or_compute(self, kind: str, version: str, compute: Callable[[], str]) -> PrecomputedReport:
+        """
+        Return the report for this data version, computing it if needed.
+
+        Computations are serialized per kind, so a user request that arrives while the
+        background watcher is already computing the same version waits for that result
+        instead of paying for a second run. Across processes the same holds through a
+        lease in the shared cache.
+        """
+        report = self.get(kind, version)
+        if report:
+            return report
+        with self._lock:
+            compute_lock = self._compute_locks.setdefault(kind, threading.Lock())
+        with compute_lock:
+            report = self.get(kind, version)
+            if report or self.shared is None:
+                return report or self.put(kind, version, compute())
+
+            lease_key = f"{kind}@{version}"
+            while not self.shared.claim(REPORTS_NAMESPACE, lease_key, COMPUTE_LEASE_SECONDS):
+                time.sleep(LEASE_POLL_SECONDS)
+                report = self.get(kind, version)
+                if report:
+                    return report
+            try:
+                return self.get(kind, version) or self.put(kind, version, compute())
+            finally:
+                self.shared.release(REPORTS_NAMESPACE, lease_key)
+
+
+report_store = ReportStore(SharedCache(CACHE_DIR / "shared_cache.sqlite"))
@@ -0,0 +1,121 @@
+"""Background watcher that pre-warms analyses when files in data/ change"""
+
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Optional, Set, Tuple
+
+from .chat_fastpath import fast_path
+from .ops_team_agent import build_ops_report
+from .profile_index import profile_retriever
+from .trial_agent import build_trial_report, data_dir
+
+POLL_INTERVAL_SECONDS = 2.0
+DEBOUNCE_SECONDS = 5.0
+LOW_PRIORITY_NICENESS = 10
+
+# Which pre-warmed reports depend on which data files
+WATCHED_FILES: Dict[str, Set[str]] = {
+    "trials.csv": {"chat_fastpath", "profile_index", "trial_analysis", "ops_readiness"},
+    "doctors.csv": {"chat_fastpath", "ops_readiness"},
+    "drug_profile.json": {"chat_fastpath", "profile_index", "trial_analysis", "ops_readiness"},
+}
+
+# Cheap jobs first, so the trial report is ready long before the multi-minute crew run ends
+PREWARM_JOBS: Dict[str, Callable[[], object]] = {
+    "chat_fastpath": fast_path.warm,
+    "profile_index": profile_retriever.refresh,
+    "trial_analysis": build_trial_report,
+    "ops_readiness": build_ops_report,
+}
+
+# Warmed on every app start: local, no LLM calls. The trial graph and Ops crew make
+# paid API calls, so they only re-run when their data actually changes
+STARTUP_JOBS: Set[str] = {"chat_fastpath", "profile_index"}
+
+
+def lower_thread_priority(niceness: int = LOW_PRIORITY_NICENESS):
+    """Lower the scheduling priority of the calling thread (Linux per-thread nice; no-op elsewhere)"""
+    try:
+        os.setpriority(os.PRIO_PROCESS, threading.get_native_id(), niceness)
+    except (AttributeError, OSError):
+        pass
+
+
+class DataWatcher(threading.Thread):
+    """
+    Polls file mtimes under data/, debounces bursts of changes and re-runs the
+    affected reports at low priority so the UI can serve them immediately.
+
+    Re-running the trial report goes through the checkpointed graph, so only LLM
+    nodes whose inputs changed are actually recomputed.
+    """
+
+    def __init__(self, data_path: Path = data_dir, poll_interval: float = POLL_INTERVAL_SECONDS,
+                 debounce: float = DEBOUNCE_SECONDS, startup_jobs: Iterable[str] = STARTUP_JOBS):
+        super().__init__(name="pharmassist-data-watcher", daemon=True)
+        self.data_path = data_path
+        self.poll_interval = poll_interval
+        self.debounce = debounce
+        self.startup_jobs = set(startup_jobs)
+        self._stop_event = threading.Event()
+
+    def _snapshot(self) -> Dict[str, Optional[Tuple[int, int]]]:
+        """(mtime, size) per watched file, None if it is missing"""
+        snapshot = {}
+        for filename in WATCHED_FILES:
+            try:
+                stat = (self.data_path / filename).stat()
+                snapshot[filename] = (stat.st_mtime_ns, stat.st_size)
+            except FileNotFoundError:
+                snapshot[filename] = None
+        return snapshot
+
+    def _prewarm(self, jobs: Set[str]):
+        for name, build in PREWARM_JOBS.items():
+            if name not in jobs or self._stop_event.is_set():
+                continue
+            print(f"🔥 Pre-warming {name}...")
+            start = time.perf_counter()
+            try:
+                build()
+                print(f"✅ Pre-warmed {name} in {time.perf_counter() - start:.1f}s")
+            except Exception as e:
+                print(f"❌ Pre-warming {name} failed: {e}")
+
+    def run(self):
+        lower_thread_priority()
+        last_seen = self._snapshot()
+        pending: Set[str] = set(self.startup_jobs)
+        last_change = float("-inf")
+
+        while not self._stop_event.is_set():
+            current = self._snapshot()
+            changed = [filename for filename in WATCHED_FILES if current[filename] != last_seen[filename]]
+            if changed:
+                print(f"📂 Data changed: {', '.join(changed)}")
+                for filename in changed:
+                    pending |= WATCHED_FILES[filename]
+                last_change = time.monotonic()
+                last_seen = current
+
+            if pending and time.monotonic() - last_change >= self.debounce:
+                jobs, pending = pending, set()
+                self._prewarm(jobs)
+
+            self._stop_event.wait(self.poll_interval)
+
+    def stop(self):
+        self._stop_event.set()
+
+
+def start_data_watcher(prewarm: Optional[bool] = None, **kwargs) -> Optional[DataWatcher]:
+    """Start the pre-warming watcher; prewarm=None defers to PHARMASSIST_PREWARM"""
+    if prewarm is None:
+        prewarm = os.getenv("PHARMASSIST_PREWARM", "true").lower() not in ("0", "false", "no")
+    if not prewarm:
+        return None
+    watcher = DataWatcher(**kwargs)
+    watcher.start()
+    return watcher
@@ -3,31 +3,47 @@ import gradio as gr
 from dotenv import load_dotenv
 from openai import OpenAI
 
+from .chat_fastpath import fast_path
+from .model_routing import model_router
+from .profiling import profiled
+from .profile_index import format_context, profile_retriever
+from .prompt_builder import PromptBuilder
+
 load_dotenv()
 client = OpenAI()
 
+# Static system prompt only: retrieved facts change every turn, so they ride in the
+# final user message and the system prompt plus history stay a cacheable prefix
+advisor_prompt = PromptBuilder(
+    "You are a pharmaceutical development strategy advisor. Help users think through drug development strategies, clinical trials, and regulatory pathways.",
+    include_brief=False,
+)
+
+@profiled("respond")
 def respond(message, history):
     """Simple chat with OpenAI"""
     try:
-        # Build messages from history
-        messages = [
-            {"role": "system", "content": "You are a pharmaceutical development strategy advisor. Help users think through drug development strategies, clinical trials, and regulatory pathways."}
-        ]
-        
-        # Add conversation history
-        for user_msg, assistant_msg in history:
-            messages.append({"role": "user", "content": user_msg})
-            messages.append({"role": "assistant", "content": assistant_msg})
-        
-        # Add current message
-        messages.append({"role": "user", "content": message})
+        # Direct metric lookups are answered from precomputed aggregates, no LLM call
+        answer = fast_path.answer(message)
+        if answer is not None:
+            return answer
+
+        # Ground the turn in the few profile/trial chunks relevant to this question
+        hits = profile_retriever.search(message)
+        request = message
+        if hits:
+            request = f"Relevant facts about our program (cite them when useful):\n{format_context(hits)}\n\nQuestion: {message}"
+
+        messages = advisor_prompt.messages(request, history)
         
         # Get response
-        response = client.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=messages,
-            max_tokens=500
-        )
+        with model_router.track("drug_profile.respond") as call:
+            response = client.chat.completions.create(
+                model=call.model,
+                messages=messages,
+                max_tokens=500
+            )
+            call.record_usage(response)
         
         return response.choices[0].message.content
         
@@ -51,4 +67,9 @@ def render_tab():
         respond,
         chatbot=gr.Chatbot(height=500),
         textbox=gr.Textbox(placeholder="Ask about drug development strategies..."),
-    )
\ No newline at end of file
+    )
+
+    with gr.Accordion("⚡ Fast Path Stats", open=False):
+        stats = gr.Markdown(fast_path.report())
+        refresh = gr.Button("🔄 Refresh")
+        refresh.click(fast_path.report, None, stats)
\ No newline at end of file
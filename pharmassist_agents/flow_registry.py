@@ -0,0 +1,223 @@
+"""Registry of Flow Creator flows: parsed once, hot-reloaded by mtime, run on a bounded pool
+
+Each YAML file in config/agents/ (written by the Flow Creator tab) is compiled
+into a CompiledFlow bound to tools from the Ops tool registry. Lookups stat the
+config directory and the requested file only - a directory whose mtime has not
+changed is never rescanned, and an unchanged file is never re-parsed.
+"""
+
+import json
+import os
+import threading
+import time
+import yaml
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from crewai.tools import BaseTool
+
+from .model_routing import chat_model, model_router
+from .ops_team_tools import resolve_tools
+
+CONFIG_DIR = Path("config/agents")
+
+FLOW_WORKERS = int(os.getenv("PHARMASSIST_FLOW_WORKERS", "4"))
+FLOW_QUEUE_DEPTH = 16
+MAX_TOOL_OUTPUT_CHARS = 4000
+
+# libyaml's loader is several times faster when PyYAML was built with it
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+class FlowBusyError(RuntimeError):
+    """Raised when the worker pool and its queue are full"""
+
+
+def flow_file_name(name: str) -> str:
+    return f"{name.lower().replace(' ', '_')}.yaml"
+
+# ============================================================================
+# Compiled flows
+# ============================================================================
+
+class CompiledFlow:
+    """A parsed flow with its tools resolved and its prompt prefix built once"""
+
+    def __init__(self, name: str, goal: str, tools: List[BaseTool], source: Path):
+        self.name = name
+        self.goal = goal
+        self.tools = tools
+        self.source = source
+        tool_lines = "\n".join(f"- {tool.name}: {tool.description}" for tool in tools) or "- none"
+        self.prompt_prefix = f"""You are the "{name}" flow in a pharmaceutical launch assistant.
+
+Goal: {goal}
+
+Tools that were run for you:
+{tool_lines}
+"""
+
+    def run(self, request: str = "") -> str:
+        """Run every bound tool, then answer the goal from their outputs"""
+        outputs = {tool.name: str(tool.run())[:MAX_TOOL_OUTPUT_CHARS] for tool in self.tools}
+        return synthesize(self, request, outputs)
+
+
+def synthesize(flow: CompiledFlow, request: str, outputs: Dict[str, str]) -> str:
+    """LLM step of a flow: answer the goal using the tool outputs"""
+    prompt = f"""{flow.prompt_prefix}
+Tool outputs (JSON):
+{json.dumps(outputs, indent=1)}
+
+Request: {request or flow.goal}
+
+Answer in Markdown, citing figures from the tool outputs."""
+    with model_router.track("flows.run") as call:
+        response = chat_model(call.model).invoke(prompt)
+        call.record_usage(response)
+    return response.content
+
+
+def compile_flow(path: Path) -> CompiledFlow:
+    """Parse one flow YAML; raises ValueError/KeyError on invalid configs"""
+    with open(path, encoding="utf-8") as f:
+        config = yaml.load(f, Loader=YAML_LOADER) or {}
+    if not isinstance(config, dict) or not config.get("name"):
+        raise ValueError(f"{path.name}: flow config needs a 'name'")
+    # Flows are looked up by file name, so a name that maps to another file could never be run
+    if flow_file_name(config["name"]) != path.name:
+        raise ValueError(f"{path.name}: flow '{config['name']}' must be saved as {flow_file_name(config['name'])}")
+    return CompiledFlow(config["name"], config.get("goal", ""), resolve_tools(config.get("tools") or []), path)
+
+# ============================================================================
+# Registry
+# ============================================================================
+
+class FlowEntry(NamedTuple):
+    stamp: Tuple[int, int]
+    flow: Optional[CompiledFlow]
+    error: Optional[str]
+
+
+class FlowRegistry:
+    """Flows keyed by file stem, recompiled only when their file's mtime/size changes"""
+
+    def __init__(self, config_dir: Path = CONFIG_DIR):
+        self.config_dir = config_dir
+        self._entries: Dict[str, FlowEntry] = {}
+        self._dir_mtime: Optional[int] = None
+        self._lock = threading.Lock()
+        self.compiles = 0
+
+    def _compile(self, stem: str, path: Path, stamp: Tuple[int, int]):
+        try:
+            entry = FlowEntry(stamp, compile_flow(path), None)
+        except (OSError, ValueError, KeyError, yaml.YAMLError) as e:
+            print(f"⚠️ Flow {path.name} not loaded: {e}")
+            entry = FlowEntry(stamp, None, str(e))
+        self._entries[stem] = entry
+        self.compiles += 1
+
+    def _sync_dir(self):
+        """Rescan the directory only when its mtime changed (files added, removed or renamed)"""
+        try:
+            dir_mtime = self.config_dir.stat().st_mtime_ns
+        except FileNotFoundError:
+            self._entries.clear()
+            self._dir_mtime = None
+            return
+        if dir_mtime == self._dir_mtime:
+            return
+
+        seen = set()
+        with os.scandir(self.config_dir) as it:
+            for item in it:
+                if not item.name.endswith(".yaml"):
+                    continue
+                stem = item.name[:-5]
+                seen.add(stem)
+                stat = item.stat()
+                stamp = (stat.st_mtime_ns, stat.st_size)
+                entry = self._entries.get(stem)
+                if entry is None or entry.stamp != stamp:
+                    self._compile(stem, Path(item.path), stamp)
+        for stem in set(self._entries) - seen:
+            del self._entries[stem]
+        self._dir_mtime = dir_mtime
+
+    def _sync_file(self, stem: str):
+        """Pick up in-place edits of one file (these do not change the directory mtime)"""
+        path = self.config_dir / f"{stem}.yaml"
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            self._entries.pop(stem, None)
+            return
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        entry = self._entries.get(stem)
+        if entry is None or entry.stamp != stamp:
+            self._compile(stem, path, stamp)
+
+    def get(self, name: str) -> CompiledFlow:
+        """Compiled flow by name or file stem; raises KeyError if missing or invalid"""
+        stem = flow_file_name(name)[:-5]
+        with self._lock:
+            self._sync_dir()
+            self._sync_file(stem)
+            entry = self._entries.get(stem)
+        if entry is None:
+            raise KeyError(f"Unknown flow '{name}'")
+        if entry.flow is None:
+            raise KeyError(f"Flow '{name}' is invalid: {entry.error}")
+        return entry.flow
+
+    def names(self) -> List[str]:
+        """Names of all valid flows"""
+        with self._lock:
+            self._sync_dir()
+            return sorted(entry.flow.name for entry in self._entries.values() if entry.flow)
+
+    def errors(self) -> Dict[str, str]:
+        with self._lock:
+            self._sync_dir()
+            return {stem: entry.error for stem, entry in self._entries.items() if entry.error}
+
+# ============================================================================
+# Bounded execution
+# ============================================================================
+
+class FlowExecutor:
+    """Runs flows on a fixed worker pool; rejects work beyond the queue depth"""
+
+    def __init__(self, registry: FlowRegistry, workers: int = FLOW_WORKERS, queue_depth: int = FLOW_QUEUE_DEPTH):
+        self.registry = registry
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="flow-worker")
+        self._slots = threading.BoundedSemaphore(workers + queue_depth)
+
+    def submit(self, name: str, request: str = "") -> Future:
+        flow = self.registry.get(name)
+        if not self._slots.acquire(blocking=False):
+            raise FlowBusyError("All flow workers are busy; try again shortly")
+        try:
+            return self._pool.submit(self._run, flow, request)
+        except BaseException:
+            self._slots.release()
+            raise
+
+    def _run(self, flow: CompiledFlow, request: str) -> str:
+        # The slot is freed before the future resolves, so callers can resubmit immediately
+        try:
+            start = time.perf_counter()
+            result = flow.run(request)
+            print(f"🔁 Flow {flow.name} finished in {time.perf_counter() - start:.1f}s")
+            return result
+        finally:
+            self._slots.release()
+
+    def run(self, name: str, request: str = "") -> str:
+        return self.submit(name, request).result()
+
+
+flow_registry = FlowRegistry()
+flow_executor = FlowExecutor(flow_registry)
@@ -0,0 +1,209 @@
+"""Per-call-site model routing with latency SLO fallback and cost reporting"""
+
+import os
+import threading
+import time
+import yaml
+import gradio as gr
+import numpy as np
+from collections import defaultdict, deque
+from contextlib import contextmanager
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Deque, Dict, Iterator, Optional
+
+routes_file = Path(__file__).parent / "model_routes.yaml"
+
+LATENCY_SAMPLES = 200
+MIN_SAMPLES_FOR_SLO = 5
+
+
+def load_routes(path: Optional[Path] = None) -> Dict[str, Any]:
+    """Load the routing config, honoring PHARMASSIST_MODEL_ROUTES"""
+    path = path or Path(os.getenv("PHARMASSIST_MODEL_ROUTES", routes_file))
+    with open(path, "r") as f:
+        return yaml.safe_load(f)
+
+
+class RouteCall:
+    """One in-flight call on a route; records token usage from the API response"""
+
+    def __init__(self, route: str, tier: str, model: str):
+        self.route = route
+        self.tier = tier
+        self.model = model
+        self.input_tokens = 0
+        self.cached_tokens = 0
+        self.output_tokens = 0
+
+    def record_usage(self, response: Any):
+        """Accept a LangChain AIMessage, an OpenAI SDK response or a CrewAI usage dict"""
+        if isinstance(response, dict):
+            self.input_tokens += response.get("prompt_tokens", 0) or 0
+            self.cached_tokens += response.get("cached_prompt_tokens", 0) or 0
+            self.output_tokens += response.get("completion_tokens", 0) or 0
+            return
+        usage_metadata = getattr(response, "usage_metadata", None)
+        if usage_metadata:
+            self.input_tokens += usage_metadata.get("input_tokens", 0)
+            self.cached_tokens += (usage_metadata.get("input_token_details") or {}).get("cache_read", 0) or 0
+            self.output_tokens += usage_metadata.get("output_tokens", 0)
+            return
+        usage = getattr(response, "usage", None)
+        if usage:
+            self.input_tokens += getattr(usage, "prompt_tokens", 0) or 0
+            self.cached_tokens += getattr(getattr(usage, "prompt_tokens_details", None), "cached_tokens", 0) or 0
+            self.output_tokens += getattr(usage, "completion_tokens", 0) or 0
+
+
+class RouteStats:
+    """Latency, token and cost counters for one (route, model) pair"""
+
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.input_tokens = 0
+        self.cached_tokens = 0
+        self.output_tokens = 0
+        self.cost_usd = 0.0
+        self.latencies: Deque[float] = deque(maxlen=LATENCY_SAMPLES)
+
+
+class ModelRouter:
+    """
+    Maps call-site routes to model tiers.
+
+    Each route keeps a window of recent latencies on its primary tier; when the
+    p90 breaches the route's SLO the route is served by the tier's fallback for a
+    cooldown period, then the primary tier is tried again.
+    """
+
+    def __init__(self, config: Dict[str, Any]):
+        self.tiers = config["tiers"]
+        self.defaults = config.get("defaults", {})
+        self.routes = config.get("routes", {})
+        self._stats: Dict[tuple, RouteStats] = defaultdict(RouteStats)
+        self._windows: Dict[str, Deque[float]] = {}
+        self._degraded_until: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def _setting(self, route: str, key: str) -> Any:
+        return self.routes.get(route, {}).get(key, self.defaults.get(key))
+
+    def primary_tier(self, route: str) -> str:
+        env_key = "PHARMASSIST_ROUTE_" + route.upper().replace(".", "_")
+        return os.getenv(env_key) or self._setting(route, "tier")
+
+    def tier_for(self, route: str) -> str:
+        """Tier to use right now, taking SLO fallback into account"""
+        tier = self.primary_tier(route)
+        with self._lock:
+            degraded = self._degraded_until.get(route, 0) > time.monotonic()
+        if degraded:
+            return self.tiers[tier].get("fallback", tier)
+        return tier
+
+    def model_for(self, route: str) -> str:
+        return self.tiers[self.tier_for(route)]["model"]
+
+    @contextmanager
+    def track(self, route: str) -> Iterator[RouteCall]:
+        """Pick the model for a route and record latency, tokens and cost of the call"""
+        tier = self.tier_for(route)
+        call = RouteCall(route, tier, self.tiers[tier]["model"])
+        start = time.perf_counter()
+        try:
+            yield call
+        except Exception:
+            self._record(call, time.perf_counter() - start, error=True)
+            raise
+        self._record(call, time.perf_counter() - start, error=False)
+
+    def record_call(self, route: str, model: str, latency: float, usage: Any = None, error: bool = False):
+        """
+        Record a call timed outside track(), e.g. one made by a CrewAI agent.
+
+        The tier is the route's primary one when it serves this model, so only
+        primary-tier latencies count toward the SLO, as with track().
+        """
+        tier = self.primary_tier(route)
+        if self.tiers[tier]["model"] != model:
+            tier = next((name for name, settings in self.tiers.items() if settings["model"] == model), tier)
+        call = RouteCall(route, tier, model)
+        if usage:
+            call.record_usage(usage)
+        self._record(call, latency, error)
+
+    def _record(self, call: RouteCall, latency: float, error: bool):
+        tier = self.tiers[call.tier]
+        with self._lock:
+            stats = self._stats[(call.route, call.model)]
+            stats.calls += 1
+            stats.errors += int(error)
+            stats.latencies.append(latency)
+            stats.input_tokens += call.input_tokens
+            stats.cached_tokens += call.cached_tokens
+            stats.output_tokens += call.output_tokens
+            # Cached input tokens are part of input_tokens, billed at the cached rate
+            input_rate = tier.get("input_cost_per_1m", 0)
+            stats.cost_usd += ((call.input_tokens - call.cached_tokens) * input_rate
+                               + call.cached_tokens * tier.get("cached_input_cost_per_1m", input_rate)
+                               + call.output_tokens * tier.get("output_cost_per_1m", 0)) / 1e6
+
+            if call.tier != self.primary_tier(call.route):
+                return
+            window = self._windows.setdefault(call.route, deque(maxlen=self._setting(call.route, "window")))
+            window.append(latency)
+            slo = self._setting(call.route, "latency_slo_ms") / 1000
+            if len(window) >= MIN_SAMPLES_FOR_SLO and np.percentile(window, 90) > slo:
+                self._degraded_until[call.route] = time.monotonic() + self._setting(call.route, "cooldown_seconds")
+                window.clear()
+                print(f"⚠️ Route {call.route} breached its {slo:.1f}s latency SLO - "
+                      f"falling back to {tier.get('fallback', call.tier)}")
+
+    def report(self) -> str:
+        """Markdown table of per-route latency, prompt cache hits and cost"""
+        with self._lock:
+            rows = sorted(self._stats.items())
+            if not rows:
+                return "No LLM calls recorded yet."
+            lines = [
+                "| Route | Model | Calls | Errors | p50 (s) | p95 (s) | Input tok | Cached tok | Output tok | Cost (USD) |",
+                "|---|---|---:|---:|---:|---:|---:|---:|---:|---:|",
+            ]
+            total_cost = 0.0
+            total_input = total_cached = 0
+            for (route, model), stats in rows:
+                p50, p95 = np.percentile(stats.latencies, [50, 95]) if stats.latencies else (0.0, 0.0)
+                total_cost += stats.cost_usd
+                total_input += stats.input_tokens
+                total_cached += stats.cached_tokens
+                lines.append(
+                    f"| {route} | {model} | {stats.calls} | {stats.errors} | {p50:.2f} | {p95:.2f} | "
+                    f"{stats.input_tokens:,} | {stats.cached_tokens:,} | {stats.output_tokens:,} | {stats.cost_usd:.4f} |"
+                )
+            degraded = [route for route, until in self._degraded_until.items() if until > time.monotonic()]
+        lines.append(f"\n**Total cost:** ${total_cost:.4f}")
+        if total_input:
+            lines.append(f"**Prompt cache hit rate:** {total_cached / total_input:.0%} of input tokens")
+        if degraded:
+            lines.append(f"**Degraded (serving fallback tier):** {', '.join(sorted(degraded))}")
+        return "\n".join(lines)
+
+
+model_router = ModelRouter(load_routes())
+
+
+@lru_cache(maxsize=None)
+def chat_model(model: str):
+    """Shared LangChain chat model per model name"""
+    from langchain_openai import ChatOpenAI
+    return ChatOpenAI(model=model)
+
+
+def render_report():
+    """Render the routing report panel"""
+    with gr.Accordion("⏱️ Model Routing Report", open=False):
+        report = gr.Markdown(model_router.report())
+        refresh = gr.Button("🔄 Refresh")
+        refresh.click(model_router.report, None, report)
@@ -0,0 +1,481 @@
+"""Deterministic pandas/NumPy analytics behind the Ops Team tools
+
+Every function returns a small JSON-ready dict, so agents get precomputed
+answers instead of reasoning over raw data dumps.
+"""
+
+import json
+import re
+import numpy as np
+import pandas as pd
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from .data_files import file_key
+from .trial_scoring import Sites, compute_risk_scores, site_metrics
+
+data_dir = Path("data")
+
+MAX_LISTED_ROWS = 10
+
+# ============================================================================
+# Cached loaders (re-read only when the file's mtime or size changes)
+# ============================================================================
+
+@lru_cache(maxsize=16)
+def _read_csv(path: str, mtime_ns: int, size: int) -> pd.DataFrame:
+    return pd.read_csv(path)
+
+@lru_cache(maxsize=16)
+def _read_json(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    with open(path) as f:
+        return json.load(f)
+
+def load_trials(data_path: Path = data_dir) -> pd.DataFrame:
+    return _read_csv(*file_key(data_path / "trials.csv"))
+
+def load_kols(data_path: Path = data_dir) -> pd.DataFrame:
+    return _read_csv(*file_key(data_path / "doctors.csv"))
+
+def load_profile(data_path: Path = data_dir) -> Dict[str, Any]:
+    return _read_json(*file_key(data_path / "drug_profile.json"))
+
+# ============================================================================
+# Parsing helpers for the free-text fields in drug_profile.json
+# ============================================================================
+
+def parse_percent(text: Any) -> Optional[float]:
+    """First percentage in a string, e.g. '75% complete' -> 75.0"""
+    match = re.search(r"(\d+(?:\.\d+)?)\s*%", str(text))
+    return float(match.group(1)) if match else None
+
+def parse_number(text: Any) -> Optional[float]:
+    """First number in a string, e.g. '50,000 tablets/month' -> 50000.0"""
+    match = re.search(r"\d[\d,]*(?:\.\d+)?", str(text))
+    return float(match.group(0).replace(",", "")) if match else None
+
+def quarter_index(text: str) -> Optional[int]:
+    """'Q2 2026' -> a monotonically increasing quarter number"""
+    match = re.search(r"Q([1-4])\s*(\d{4})", str(text))
+    return int(match.group(2)) * 4 + int(match.group(1)) - 1 if match else None
+
+def _records(df: pd.DataFrame, limit: int = MAX_LISTED_ROWS) -> List[Dict[str, Any]]:
+    return json.loads(df.head(limit).to_json(orient="records"))
+
+# ============================================================================
+# Clinical
+# ============================================================================
+
+def site_scorecard(trials: pd.DataFrame, limit: int = MAX_LISTED_ROWS) -> Dict[str, Any]:
+    """Sites ranked by composite risk score (rank 1 = best performing)"""
+    metrics = site_metrics(trials)
+    composite, _ = compute_risk_scores(metrics)
+    card = pd.DataFrame({
+        "site_id": trials["site_id"],
+        "site_name": trials["site_name"],
+        "country": trials["country"],
+        "status": trials["status"],
+        "risk_score": composite.round(2),
+        "completion_pct": trials["completion_pct"],
+        "dropout_rate": trials["dropout_rate"],
+        "protocol_violations": trials["protocol_violations"],
+        "sae_rate_pct": metrics["sae_rate"].round(2),
+        "enrollment_shortfall_pct": metrics["enrollment_shortfall"].round(1),
+    }).sort_values("risk_score", kind="stable").reset_index(drop=True)
+    card.insert(0, "rank", np.arange(1, len(card) + 1))
+
+    return {
+        "total_sites": len(card),
+        "best_sites": _records(card, limit),
+        "worst_sites": _records(card.iloc[::-1], min(limit, len(card))) if len(card) > limit else [],
+        "delayed_sites": card.loc[card["status"] == "Delayed", "site_id"].tolist()[:limit],
+    }
+
+def riskiest_site(trials: pd.DataFrame) -> Optional[Dict[str, Any]]:
+    """The site with the highest composite risk score, or None for an empty table"""
+    if trials.empty:
+        return None
+    composite, _ = compute_risk_scores(site_metrics(trials))
+    return _records(trials.iloc[[int(np.argmax(composite))]])[0]
+
+def lvef_improvement(trials: Sites) -> pd.Series:
+    """Per-site LVEF improvement in percent; unparseable or missing values are dropped"""
+    if "efficacy_lvef_improvement" not in trials.columns:
+        return pd.Series(dtype=float)
+    values = pd.Series(trials["efficacy_lvef_improvement"]).astype(str).str.rstrip("%")
+    return pd.to_numeric(values, errors="coerce").dropna()
+
+def enrollment_projection(trials: pd.DataFrame, profile: Dict[str, Any]) -> Dict[str, Any]:
+    """Current enrollment, per-country breakdown and Phase III scale-up projection"""
+    enrolled = int(trials["enrolled"].sum())
+    target = int(trials["enrollment_target"].sum())
+    retained = float((trials["enrolled"] * (1 - trials["dropout_rate"] / 100)).sum())
+
+    by_country = trials.groupby("country").agg(
+        sites=("site_id", "count"), enrolled=("enrolled", "sum"), target=("enrollment_target", "sum"))
+    by_country["enrollment_pct"] = (by_country["enrolled"] / by_country["target"] * 100).astype(float).round(1)
+
+    shortfall = (trials["enrollment_target"] - trials["enrolled"]) / trials["enrollment_target"] * 100
+    at_risk = trials[(shortfall > 10) | (trials["status"] == "Delayed")]
+
+    phase_iii = profile.get("clinical_operations", {}).get("phase_iii_requirements", {})
+    patients_needed = phase_iii.get("patients_needed")
+    sites_required = phase_iii.get("sites_required")
+    patients_per_site = enrolled / max(len(trials), 1)
+    retention = retained / max(enrolled, 1)
+
+    projection = {}
+    if patients_needed:
+        enrolled_needed = patients_needed / max(retention, 1e-9)
+        projection = {
+            "patients_needed": patients_needed,
+            "sites_planned": sites_required,
+            "patients_per_site_phase_iib": round(patients_per_site, 1),
+            "expected_retention_pct": round(retention * 100, 1),
+            "enrollment_needed_for_retention": int(np.ceil(enrolled_needed)),
+            "sites_needed_at_phase_iib_rate": int(np.ceil(enrolled_needed / max(patients_per_site, 1e-9))),
+            "patients_per_planned_site": round(enrolled_needed / sites_required, 1) if sites_required else None,
+        }
+
+    return {
+        "enrolled": enrolled,
+        "target": target,
+        "enrollment_pct": round(enrolled / max(target, 1) * 100, 1),
+        "expected_completers": int(round(retained)),
+        "by_country": json.loads(by_country.reset_index().to_json(orient="records")),
+        "at_risk_sites": at_risk["site_id"].tolist()[:MAX_LISTED_ROWS],
+        "phase_iii_projection": projection,
+    }
+
+def sae_rates(trials: pd.DataFrame, profile: Dict[str, Any]) -> Dict[str, Any]:
+    """Serious adverse event totals and rates, overall and per country"""
+    total = int(trials["serious_adverse_events"].sum())
+    enrolled = int(trials["enrolled"].sum())
+    overall_rate = total / max(enrolled, 1) * 100
+
+    by_country = trials.groupby("country").agg(
+        saes=("serious_adverse_events", "sum"), enrolled=("enrolled", "sum"))
+    by_country["sae_rate_pct"] = (by_country["saes"] / by_country["enrolled"] * 100).astype(float).round(2)
+
+    site_rate = site_metrics(trials)["sae_rate"]
+    elevated = trials.loc[site_rate > 2 * overall_rate, ["site_id", "serious_adverse_events"]]
+
+    safety = profile.get("safety_profile", {})
+    return {
+        "total_saes": total,
+        "total_adverse_events": int(trials["adverse_events_total"].sum()),
+        "sae_rate_pct": round(overall_rate, 2),
+        "by_country": json.loads(by_country.reset_index().to_json(orient="records")),
+        "sites_above_2x_rate": _records(elevated),
+        "known_serious_events": safety.get("serious_adverse_events", []),
+        "regulatory_signals": safety.get("regulatory_signals"),
+    }
+
+# ============================================================================
+# Regulatory
+# ============================================================================
+
+def regulatory_timeline(profile: Dict[str, Any]) -> Dict[str, Any]:
+    """Regulatory milestones with the gap in months to the next one"""
+    regulatory = profile.get("regulatory_operations", {})
+    milestones = sorted(
+        ((name, when) for name, when in regulatory.get("regulatory_timeline", {}).items()
+         if quarter_index(when) is not None),
+        key=lambda item: quarter_index(item[1]),
+    )
+    timeline = []
+    for i, (name, when) in enumerate(milestones):
+        entry = {"milestone": name, "quarter": when}
+        if i + 1 < len(milestones):
+            entry["months_to_next"] = (quarter_index(milestones[i + 1][1]) - quarter_index(when)) * 3
+        timeline.append(entry)
+
+    return {
+        "approval_pathway": regulatory.get("approval_pathway"),
+        "timeline": timeline,
+        "submission_readiness_pct": parse_percent(regulatory.get("submission_readiness")),
+        "submission_blocker": regulatory.get("submission_readiness"),
+    }
+
+def cmc_readiness(profile: Dict[str, Any]) -> Dict[str, Any]:
+    """CMC, submission and GMP readiness as numbers with the remaining gap"""
+    regulatory = profile.get("regulatory_operations", {})
+    manufacturing = profile.get("manufacturing_operations", {})
+    cmc_pct = parse_percent(regulatory.get("cmc_status"))
+    return {
+        "cmc_complete_pct": cmc_pct,
+        "cmc_gap_pct": round(100 - cmc_pct, 1) if cmc_pct is not None else None,
+        "submission_readiness_pct": parse_percent(regulatory.get("submission_readiness")),
+        "manufacturing_readiness_pct": parse_percent(manufacturing.get("manufacturing_readiness")),
+        "gmp_inspection": manufacturing.get("regulatory_inspections_pending"),
+        "critical_path_items": profile.get("operational_readiness_summary", {}).get("critical_path_items", []),
+    }
+
+def regulatory_risk_flags(profile: Dict[str, Any], trials: pd.DataFrame) -> Dict[str, Any]:
+    """Declared regulatory risks plus sites whose data could block submission"""
+    violations = trials.sort_values("protocol_violations", ascending=False, kind="stable")
+    flagged = violations[(violations["protocol_violations"] > 2) | (violations["status"] == "Delayed")]
+    return {
+        "declared_risks": profile.get("regulatory_operations", {}).get("regulatory_risks", []),
+        "total_protocol_violations": int(trials["protocol_violations"].sum()),
+        "sites_flagged_for_inspection": _records(
+            flagged[["site_id", "site_name", "protocol_violations", "dropout_rate", "serious_adverse_events", "status"]]),
+    }
+
+# ============================================================================
+# Manufacturing
+# ============================================================================
+
+def production_capacity(profile: Dict[str, Any]) -> Dict[str, Any]:
+    """Current vs required monthly output and the implied expansion factor"""
+    manufacturing = profile.get("manufacturing_operations", {})
+    current = manufacturing.get("current_capacity", {})
+    required = manufacturing.get("phase_iii_requirements", {})
+    current_output = parse_number(current.get("phase_iib_production"))
+    required_output = parse_number(required.get("production_needed"))
+    utilization = parse_percent(current.get("current_utilization"))
+    return {
+        "facility": current.get("facility"),
+        "current_tablets_per_month": current_output,
+        "required_tablets_per_month": required_output,
+        "expansion_factor": round(required_output / current_output, 1) if current_output and required_output else None,
+        "current_utilization_pct": utilization,
+        "current_headroom_tablets": round(current_output * (1 - utilization / 100)) if current_output and utilization is not None else None,
+        "expansion_investment_usd": required.get("expansion_investment_usd"),
+        "readiness_pct": parse_percent(manufacturing.get("manufacturing_readiness")),
+    }
+
+def supply_chain_risk(profile: Dict[str, Any]) -> Dict[str, Any]:
+    """Stock coverage vs lead time for each constrained component"""
+    components = []
+    for item in profile.get("manufacturing_operations", {}).get("supply_chain_constraints", []):
+        lead_weeks = item.get("lead_time_weeks") or 0
+        stock_weeks = (parse_number(item.get("current_stock")) or 0) * 52 / 12
+        components.append({
+            "component": item.get("component"),
+            "supplier": item.get("supplier"),
+            "lead_time_weeks": lead_weeks,
+            "stock_weeks": round(stock_weeks, 1),
+            "coverage_ratio": round(stock_weeks / lead_weeks, 2) if lead_weeks else None,
+            "single_source": "single-source" in str(item.get("risk", "")).lower(),
+            "risk": item.get("risk"),
+            "mitigation": item.get("mitigation"),
+        })
+    components.sort(key=lambda c: c["coverage_ratio"] if c["coverage_ratio"] is not None else float("inf"))
+    return {
+        "components": components,
+        "highest_risk_component": components[0]["component"] if components else None,
+    }
+
+def expansion_timeline(profile: Dict[str, Any]) -> Dict[str, Any]:
+    """Whether the scale-up fits before Phase III initiation and the GMP audit"""
+    manufacturing = profile.get("manufacturing_operations", {})
+    scaling_months = parse_number(manufacturing.get("phase_iii_requirements", {}).get("scaling_timeline"))
+    phase_iii_start = profile.get("regulatory_operations", {}).get("regulatory_timeline", {}).get("phase_iii_initiation")
+    gmp_audit = manufacturing.get("regulatory_inspections_pending")
+    decision_date = profile.get("operational_readiness_summary", {}).get("go_no_go_decision_date")
+
+    months_to_phase_iii = None
+    if decision_date and quarter_index(phase_iii_start) is not None:
+        decision = pd.Timestamp(decision_date)
+        start_quarter = quarter_index(phase_iii_start)
+        start = pd.Timestamp(year=start_quarter // 4, month=(start_quarter % 4) * 3 + 1, day=1)
+        months_to_phase_iii = (start.year - decision.year) * 12 + start.month - decision.month
+
+    return {
+        "scaling_timeline_months": scaling_months,
+        "go_no_go_decision_date": decision_date,
+        "phase_iii_initiation": phase_iii_start,
+        "months_from_decision_to_phase_iii": months_to_phase_iii,
+        "schedule_slack_months": (months_to_phase_iii - scaling_months)
+                                 if months_to_phase_iii is not None and scaling_months else None,
+        "gmp_audit": gmp_audit,
+        "expansion_investment_usd": manufacturing.get("phase_iii_requirements", {}).get("expansion_investment_usd"),
+    }
+
+# ============================================================================
+# Commercial
+# ============================================================================
+
+def kol_coverage(kols: pd.DataFrame) -> Dict[str, Any]:
+    """KOL counts, influence and patient reach per geographic region"""
+    recommended = kols["recommended_for_phase_iii"].astype(bool)
+    by_region = kols.assign(recommended=recommended).groupby("geographic_region").agg(
+        kols=("doctor_id", "count"),
+        recommended=("recommended", "sum"),
+        investigators=("phase_iib_investigator", "sum"),
+        avg_influence=("influence_score", "mean"),
+        patient_volume=("patient_volume_annual", "sum"),
+    ).sort_values("patient_volume", ascending=False)
+    by_region["avg_influence"] = by_region["avg_influence"].round(1)
+
+    return {
+        "total_kols": len(kols),
+        "recommended": int(recommended.sum()),
+        "phase_iib_investigators": int(kols["phase_iib_investigator"].astype(bool).sum()),
+        "influence_range": [int(kols["influence_score"].min()), int(kols["influence_score"].max())],
+        "total_patient_volume": int(kols["patient_volume_annual"].sum()),
+        "by_region": json.loads(by_region.reset_index().to_json(orient="records")),
+        "regions_without_recommended_kol": by_region.index[by_region["recommended"] == 0].tolist(),
+    }
+
+def kol_recommendations(kols: pd.DataFrame, limit: int = MAX_LISTED_ROWS) -> Dict[str, Any]:
+    """KOLs ranked by a weighted score of influence, experience, output and reach"""
+    def normalized(column: pd.Series) -> pd.Series:
+        span = column.max() - column.min()
+        return (column - column.min()) / span if span else column * 0.0
+
+    score = (
+        0.40 * normalized(kols["influence_score"])
+        + 0.20 * kols["phase_iib_investigator"].astype(float)
+        + 0.15 * normalized(kols["publications_count"])
+        + 0.10 * normalized(kols["conference_presentations"])
+        + 0.15 * normalized(kols["patient_volume_annual"])
+    ) * 100
+    ranked = kols.assign(score=score.round(1)).sort_values("score", ascending=False, kind="stable")
+    ranked = ranked[["doctor_id", "name", "geographic_region", "influence_score", "phase_iib_investigator",
+                     "recommended_for_phase_iii", "research_interest", "score"]]
+    tiers = pd.cut(ranked["score"], bins=[-np.inf, 40, 70, np.inf], labels=["marginal", "secondary", "priority"])
+
+    return {
+        "ranked": _records(ranked[ranked["recommended_for_phase_iii"].astype(bool)], limit),
+        "tier_counts": tiers.value_counts().to_dict(),
+        "not_recommended": _records(ranked[~ranked["recommended_for_phase_iii"].astype(bool)][
+            ["doctor_id", "name", "geographic_region", "influence_score"]]),
+    }
+
+def market_strategy(profile: Dict[str, Any], kols: pd.DataFrame) -> Dict[str, Any]:
+    """Pricing position vs competitors and KOL reach in the launch markets"""
+    commercial = profile.get("commercial_operations", {})
+    target_price = commercial.get("pricing_strategy", {}).get("target_price_usd")
+    competitors = [
+        {
+            "drug": c.get("drug"),
+            "market_share_pct": parse_percent(c.get("market_share")),
+            "price_per_month_usd": c.get("price_per_month_usd"),
+            "our_premium_pct": round((target_price / c["price_per_month_usd"] - 1) * 100, 1)
+                               if target_price and c.get("price_per_month_usd") else None,
+        }
+        for c in commercial.get("competitor_landscape", [])
+    ]
+    recommended = kols[kols["recommended_for_phase_iii"].astype(bool)]
+    by_country = recommended.groupby("country")["patient_volume_annual"].agg(["count", "sum"])
+
+    return {
+        "launch_sequence": commercial.get("market_entry_strategy", {}),
+        "target_price_usd": target_price,
+        "reimbursement": commercial.get("pricing_strategy", {}).get("reimbursement_status"),
+        "competitors": competitors,
+        "recommended_kols_by_country": {
+            country: {"kols": int(row["count"]), "patient_volume": int(row["sum"])}
+            for country, row in by_country.iterrows()
+        },
+        "commercial_readiness_pct": parse_percent(commercial.get("commercial_readiness")),
+        "marketing_materials_pct": parse_percent(commercial.get("marketing_materials_status")),
+    }
+
+# ============================================================================
+# Fact sheet for the Ops task prompts
+# ============================================================================
+
+def _find_component(profile: Dict[str, Any], *keywords: str) -> Dict[str, Any]:
+    for item in profile.get("manufacturing_operations", {}).get("supply_chain_constraints", []):
+        if any(keyword.lower() in str(item.get("component", "")).lower() for keyword in keywords):
+            return item
+    return {}
+
+def _compact_number(value: Optional[float]) -> str:
+    """50000 -> '50K', 8500000 -> '8.5M'"""
+    if value is None:
+        return "n/a"
+    for threshold, suffix in ((1e6, "M"), (1e3, "K")):
+        if abs(value) >= threshold:
+            return f"{value / threshold:.1f}".rstrip("0").rstrip(".") + suffix
+    return f"{value:g}"
+
+def fact_sheet(data_path: Path = data_dir) -> Dict[str, Any]:
+    """
+    Current figures referenced by the Ops task prompts, keyed by placeholder name.
+
+    Computed from trials.csv, doctors.csv and drug_profile.json so the prompts
+    never drift from the data.
+    """
+    trials = load_trials(data_path)
+    kols = load_kols(data_path)
+    profile = load_profile(data_path)
+
+    enrollment = enrollment_projection(trials, profile)
+    saes = sae_rates(trials, profile)
+    cmc = cmc_readiness(profile)
+    capacity = production_capacity(profile)
+    expansion = expansion_timeline(profile)
+    regulatory = profile.get("regulatory_operations", {}).get("regulatory_timeline", {})
+    phase_iii = profile.get("clinical_operations", {}).get("phase_iii_requirements", {})
+    commercial = profile.get("commercial_operations", {})
+
+    risk = riskiest_site(trials) or {}
+    lvef = lvef_improvement(trials)
+    api = _find_component(profile, "API", "Ingredient")
+    packaging = _find_component(profile, "Packag")
+
+    return {
+        "site_count": len(trials),
+        "enrolled": enrollment["enrolled"],
+        "enrollment_target": enrollment["target"],
+        "enrollment_pct": enrollment["enrollment_pct"],
+        "risk_site": risk.get("site_id", "n/a"),
+        "risk_site_dropout": f"{risk['dropout_rate']:g}" if risk else "n/a",
+        "risk_site_violations": risk.get("protocol_violations", "n/a"),
+        "risk_site_saes": risk.get("serious_adverse_events", "n/a"),
+        "risk_site_status": risk.get("status", "n/a"),
+        "lvef_min": f"{lvef.min():g}" if len(lvef) else "n/a",
+        "lvef_max": f"{lvef.max():g}" if len(lvef) else "n/a",
+        "total_saes": saes["total_saes"],
+        "sae_rate_pct": saes["sae_rate_pct"],
+        "cmc_pct": f"{cmc['cmc_complete_pct']:g}" if cmc["cmc_complete_pct"] is not None else "n/a",
+        "ema_submission": regulatory.get("ema_submission", "n/a"),
+        "fda_submission": regulatory.get("fda_submission", "n/a"),
+        "gmp_audit": cmc["gmp_inspection"] or "n/a",
+        "phase_iii_start": regulatory.get("phase_iii_initiation", "n/a"),
+        "current_capacity": _compact_number(capacity["current_tablets_per_month"]),
+        "required_capacity": _compact_number(capacity["required_tablets_per_month"]),
+        "expansion_factor": f"{capacity['expansion_factor']:g}x" if capacity["expansion_factor"] else "n/a",
+        "scaling_months": f"{expansion['scaling_timeline_months']:g}" if expansion["scaling_timeline_months"] else "n/a",
+        "months_to_phase_iii": expansion["months_from_decision_to_phase_iii"]
+                               if expansion["months_from_decision_to_phase_iii"] is not None else "n/a",
+        "expansion_investment": _compact_number(capacity["expansion_investment_usd"]),
+        "api_supplier": str(api.get("supplier", "n/a")).split(",")[0],
+        "api_lead_weeks": api.get("lead_time_weeks", "n/a"),
+        "packaging_supplier": str(packaging.get("supplier", "n/a")).split(",")[0],
+        "packaging_lead_weeks": packaging.get("lead_time_weeks", "n/a"),
+        "packaging_stock": packaging.get("current_stock", "n/a"),
+        "kol_count": len(kols),
+        "influence_min": int(kols["influence_score"].min()),
+        "influence_max": int(kols["influence_score"].max()),
+        "investigators": int(kols["phase_iib_investigator"].astype(bool).sum()),
+        "not_recommended": int((~kols["recommended_for_phase_iii"].astype(bool)).sum()),
+        "kol_avg_patients": int(round(kols["patient_volume_annual"].mean())),
+        "kol_total_patients": _compact_number(kols["patient_volume_annual"].sum()),
+        "phase_iii_patients": f"{phase_iii.get('patients_needed', 0):,}",
+        "phase_iii_sites": phase_iii.get("sites_required", "n/a"),
+        "target_price": commercial.get("pricing_strategy", {}).get("target_price_usd", "n/a"),
+        "marketing_pct": f"{parse_percent(commercial.get('marketing_materials_status')):g}"
+                         if parse_percent(commercial.get("marketing_materials_status")) is not None else "n/a",
+        "decision_date": profile.get("operational_readiness_summary", {}).get("go_no_go_decision_date", "n/a"),
+    }
+
+def format_fact_sheet(facts: Dict[str, Any]) -> str:
+    """Compact multi-line summary of the fact sheet for synthesis prompts"""
+    return "\n".join([
+        f"- Enrollment: {facts['enrolled']}/{facts['enrollment_target']} ({facts['enrollment_pct']}%) across {facts['site_count']} sites",
+        f"- Highest-risk site: {facts['risk_site']} ({facts['risk_site_dropout']}% dropout, "
+        f"{facts['risk_site_violations']} protocol violations, {facts['risk_site_saes']} SAEs, {facts['risk_site_status']})",
+        f"- Safety: {facts['total_saes']} SAEs ({facts['sae_rate_pct']}%); efficacy {facts['lvef_min']}-{facts['lvef_max']}% LVEF improvement",
+        f"- Regulatory: CMC {facts['cmc_pct']}% complete; EMA {facts['ema_submission']}, FDA {facts['fda_submission']}; {facts['gmp_audit']}",
+        f"- Manufacturing: {facts['current_capacity']} -> {facts['required_capacity']} tablets/month ({facts['expansion_factor']}), "
+        f"{facts['scaling_months']}-month scale-up, ${facts['expansion_investment']} capex",
+        f"- Commercial: {facts['kol_count']} KOLs ({facts['investigators']} Phase IIb investigators), "
+        f"${facts['target_price']}/month target price, marketing materials {facts['marketing_pct']}% complete",
+        f"- Phase III: {facts['phase_iii_patients']} patients across {facts['phase_iii_sites']} sites from {facts['phase_iii_start']}",
+    ])
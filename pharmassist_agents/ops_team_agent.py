@@ -1,11 +1,21 @@
 import os
+import re
 import json
+import threading
 import yaml
 import gradio as gr
+from functools import lru_cache
 from pathlib import Path
-from crewai import Agent, Task, Crew
+from typing import Any, Dict, Tuple
+from crewai import Agent, Task, Crew, LLM
+from crewai.events import crewai_event_bus
+from crewai.events.types.llm_events import LLMCallCompletedEvent, LLMCallFailedEvent, LLMCallStartedEvent
 from dotenv import load_dotenv
-from .ops_team_tools import read_trials_data, read_drug_profile, read_kol_database
+from .ops_analytics import fact_sheet, format_fact_sheet
+from .ops_team_tools import data_dir, resolve_tools
+from .model_routing import ModelRouter, model_router
+from .profiling import profiled
+from .data_snapshot import PrecomputedReport, data_version, report_store
 
 load_dotenv()
 
@@ -21,29 +31,93 @@ def load_yaml(filename):
 agents_config = load_yaml("agents.yaml")
 tasks_config = load_yaml("tasks.yaml")
 
+def ops_data_version() -> str:
+    """Version of every data file the crew's tools read"""
+    return data_version(data_dir / "trials.csv", data_dir / "doctors.csv", data_dir / "drug_profile.json")
+
+PLACEHOLDER = re.compile(r"\{(\w+)\}")
+
+def fill_placeholders(text: str, facts: Dict[str, Any]) -> str:
+    """Replace {name} for known fact names only; other braces (e.g. JSON examples) are kept as written"""
+    return PLACEHOLDER.sub(lambda match: str(facts[match.group(1)]) if match.group(1) in facts else match.group(0), text)
+
+def _render(config: Dict[str, Dict[str, Any]], facts: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    """Fill {placeholders} in every string field of a YAML config"""
+    return {
+        name: {key: fill_placeholders(value, facts) if isinstance(value, str) else value for key, value in entry.items()}
+        for name, entry in config.items()
+    }
+
+@lru_cache(maxsize=4)
+def render_configs(version: str) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """
+    Render agents.yaml and tasks.yaml with the fact sheet for one data version.
+
+    Cached per data hash, so the fact sheet is computed once per data version and
+    agents start from current figures instead of re-deriving them with tools.
+    """
+    facts = fact_sheet(data_dir)
+    facts["fact_sheet"] = "\n" + format_fact_sheet(facts) + "\n"
+    return _render(agents_config, facts), _render(tasks_config, facts)
+
+class CrewCallTracker:
+    """
+    Records the crew's LLM calls on their ops_crew.* routes.
+
+    CrewAI makes the calls itself, so latency and usage come from its event bus:
+    a started and a completed (or failed) event sharing a call_id make one call.
+    Handlers run on the bus's thread pool, so either event may arrive first.
+    """
+
+    def __init__(self, router: ModelRouter):
+        self.router = router
+        self.routes: Dict[str, str] = {}  # agent role -> route
+        self._pending: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+
+    def register(self, role: str, route: str):
+        self.routes[role] = route
+
+    def on_event(self, source: Any, event: Any):
+        with self._lock:
+            other = self._pending.pop(event.call_id, None)
+            if other is None:
+                self._pending[event.call_id] = event
+                return
+        started, finished = (other, event) if isinstance(other, LLMCallStartedEvent) else (event, other)
+        route = self.routes.get(started.agent_role)
+        if route is None:
+            return
+        self.router.record_call(
+            route,
+            started.model,
+            (finished.timestamp - started.timestamp).total_seconds(),
+            usage=getattr(finished, "usage", None),
+            error=isinstance(finished, LLMCallFailedEvent),
+        )
+
+crew_calls = CrewCallTracker(model_router)
+for event_type in (LLMCallStartedEvent, LLMCallCompletedEvent, LLMCallFailedEvent):
+    crewai_event_bus.on(event_type)(crew_calls.on_event)
+
 def create_ops_crew():
     """Create and return the Ops Team crew"""
+    agents_config, tasks_config = render_configs(ops_data_version())
+    
     # Create agents from config
     agents = {}
     for agent_name, agent_config in agents_config.items():
-        # Assign tools based on agent role
-        tools = []
-        if "clinical" in agent_name.lower():
-            tools = [read_trials_data, read_drug_profile]
-        elif "regulatory" in agent_name.lower():
-            tools = [read_drug_profile]
-        elif "manufacturing" in agent_name.lower():
-            tools = [read_drug_profile]
-        elif "commercial" in agent_name.lower():
-            tools = [read_kol_database, read_drug_profile]
-        elif "ops_manager" in agent_name.lower():
-            tools = [read_trials_data, read_drug_profile, read_kol_database]
-        
+        route = f"ops_crew.{agent_name}"
+        crew_calls.register(agent_config["role"], route)
         agents[agent_name] = Agent(
             role=agent_config["role"],
             goal=agent_config["goal"],
             backstory=agent_config["backstory"],
-            tools=tools,
+            # Tools are resolved from the names declared in agents.yaml
+            tools=resolve_tools(agent_config.get("tools", [])),
+            # Each agent gets the model tier routed for it in model_routes.yaml (or its
+            # fallback while the route breaches its SLO); crew_calls records its calls
+            llm=LLM(model=model_router.model_for(route)),
             verbose=True,
             allow_delegation=False
         )
@@ -77,6 +151,12 @@ def create_ops_crew():
     )
     return crew
 
+OPS_REPORT = "ops_readiness"
+
+def build_ops_report() -> PrecomputedReport:
+    """Return the crew report for the current data version, running the crew if needed"""
+    return report_store.get_or_compute(OPS_REPORT, ops_data_version(), lambda: str(create_ops_crew().kickoff()))
+
 def render_tab():
     """Render the Ops Team tab in Gradio"""
     with gr.Group():
@@ -103,12 +183,12 @@ def render_tab():
             placeholder="Click 'Assess Phase III Readiness' to generate report..."
         )
         
+        @profiled("assess_readiness")
         def assess_readiness():
             """Execute crew and return report"""
             try:
-                crew = create_ops_crew()
-                result = crew.kickoff()
-                return str(result)
+                report = build_ops_report()
+                return f"{report.stamp()}\n\n{report.text}"
             except Exception as e:
                 return f"❌ Error: {str(e)}"
         
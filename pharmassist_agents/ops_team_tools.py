@@ -3,7 +3,10 @@
 import json
 import pandas as pd
 from pathlib import Path
-from crewai.tools import tool
+from typing import Dict, List
+from crewai.tools import BaseTool, tool
+
+from . import ops_analytics as analytics
 
 data_dir = Path("data")
 
@@ -25,6 +28,86 @@ def read_kol_database():
     df = pd.read_csv(data_dir / "doctors.csv")
     return df.to_json(orient="records")
 
+# Analytic tools: compact, precomputed answers instead of raw dumps
+
+@tool
+def analyze_site_performance():
+    """Site performance scorecard: sites ranked by composite risk (completion, dropout, protocol violations, SAE rate, enrollment shortfall)"""
+    return json.dumps(analytics.site_scorecard(analytics.load_trials(data_dir)))
+
+@tool
+def assess_enrollment_risk():
+    """Enrollment status by country, at-risk sites and the projected Phase III site/enrollment need"""
+    return json.dumps(analytics.enrollment_projection(analytics.load_trials(data_dir), analytics.load_profile(data_dir)))
+
+@tool
+def summarize_sae_rates():
+    """Serious adverse event totals and rates overall, per country and for sites above twice the cohort rate"""
+    return json.dumps(analytics.sae_rates(analytics.load_trials(data_dir), analytics.load_profile(data_dir)))
+
+@tool
+def read_regulatory_timeline():
+    """Regulatory milestones (Phase III start, interim analysis, EMA/FDA submission and approval) with months between them"""
+    return json.dumps(analytics.regulatory_timeline(analytics.load_profile(data_dir)))
+
+@tool
+def assess_cmc_readiness():
+    """CMC, submission and manufacturing readiness percentages, GMP inspection status and critical path items"""
+    return json.dumps(analytics.cmc_readiness(analytics.load_profile(data_dir)))
+
+@tool
+def flag_regulatory_risks():
+    """Declared regulatory risks plus trial sites with protocol violations or delays that could block submission"""
+    return json.dumps(analytics.regulatory_risk_flags(analytics.load_profile(data_dir), analytics.load_trials(data_dir)))
+
+@tool
+def analyze_production_capacity():
+    """Current vs Phase III monthly tablet output, expansion factor, utilization headroom and capex"""
+    return json.dumps(analytics.production_capacity(analytics.load_profile(data_dir)))
+
+@tool
+def assess_supply_chain_risk():
+    """Stock coverage vs supplier lead time per component, highest-risk component first"""
+    return json.dumps(analytics.supply_chain_risk(analytics.load_profile(data_dir)))
+
+@tool
+def estimate_expansion_timeline():
+    """Manufacturing scale-up duration vs time from go/no-go decision to Phase III start, with schedule slack"""
+    return json.dumps(analytics.expansion_timeline(analytics.load_profile(data_dir)))
+
+@tool
+def score_kol_recommendations():
+    """KOLs ranked by weighted influence, investigator experience, publications and patient reach, with tiers"""
+    return json.dumps(analytics.kol_recommendations(analytics.load_kols(data_dir)))
+
+@tool
+def analyze_kol_coverage():
+    """KOL counts, recommended KOLs, investigators, influence and patient volume per geographic region"""
+    return json.dumps(analytics.kol_coverage(analytics.load_kols(data_dir)))
+
+@tool
+def develop_market_strategy():
+    """Launch sequence, price premium vs competitors, reimbursement and recommended-KOL reach per launch country"""
+    return json.dumps(analytics.market_strategy(analytics.load_profile(data_dir), analytics.load_kols(data_dir)))
+
+# Registry of every tool an agent can declare by name in ops_team_config/agents.yaml
+TOOL_REGISTRY: Dict[str, BaseTool] = {
+    t.name: t for t in [
+        read_trials_data, read_drug_profile, read_kol_database,
+        analyze_site_performance, assess_enrollment_risk, summarize_sae_rates,
+        read_regulatory_timeline, assess_cmc_readiness, flag_regulatory_risks,
+        analyze_production_capacity, assess_supply_chain_risk, estimate_expansion_timeline,
+        score_kol_recommendations, analyze_kol_coverage, develop_market_strategy,
+    ]
+}
+
+def resolve_tools(names: List[str]) -> List[BaseTool]:
+    """Look up declared tool names in the registry, failing loudly on typos"""
+    unknown = [name for name in names if name not in TOOL_REGISTRY]
+    if unknown:
+        raise KeyError(f"Unknown tools {unknown}; available: {sorted(TOOL_REGISTRY)}")
+    return [TOOL_REGISTRY[name] for name in names]
+
 # Test the tools
 if __name__ == "__main__":
     print("Testing tools...\n")
@@ -42,4 +125,10 @@ if __name__ == "__main__":
     kols_df = pd.read_csv(data_dir / "doctors.csv")
     print(f"   Loaded {len(kols_df)} KOLs")
     
+    print(f"\n✅ {len(TOOL_REGISTRY)} tools registered:")
+    for name, registered in TOOL_REGISTRY.items():
+        if registered in (read_trials_data, read_drug_profile, read_kol_database):
+            continue
+        print(f"   {name}: {len(registered.run())} chars")
+    
     print("\n✅ All tools are ready for Crew agents!")
\ No newline at end of file
@@ -7,7 +7,11 @@ from pydantic import BaseModel, Field
 from typing import Dict
 import asyncio
 
-load_dotenv(override=True)
+from .model_routing import model_router
+from .profiling import profiled
+from .prompt_builder import PromptBuilder
+
+load_dotenv()
 
 # Initialize OpenAI client
 client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
@@ -50,68 +54,62 @@ You write warm, conversational emails that build rapport while remaining profess
 Your tone is friendly and enthusiastic, highlighting practical patient benefits.
 Make the email feel personal and relevant to the physician's daily practice."""
 
+# Instructions, drug brief and schema form a prefix shared by every doctor in a
+# campaign; only the doctor's details vary, and they go last
+EMAIL_TASK = """Write an outreach email introducing CardioRelief to the physician named in the user message.
+Use only the facts in the drug brief below. {focus}"""
+
+formal_prompt = PromptBuilder(
+    formal_instructions + "\n\n" + EMAIL_TASK.format(focus="Focus on clinical data and efficacy."),
+    schema=EmailOutput,
+)
+scientific_prompt = PromptBuilder(
+    scientific_instructions + "\n\n" + EMAIL_TASK.format(
+        focus="Emphasize trial data, LVEF improvement, and mechanisms of action."),
+    schema=EmailOutput,
+)
+engaging_prompt = PromptBuilder(
+    engaging_instructions + "\n\n" + EMAIL_TASK.format(
+        focus="Keep it friendly, focusing on patient benefits and practical value."),
+    schema=EmailOutput,
+)
+select_prompt = PromptBuilder(
+    """You are an Outreach Manager evaluating three email approaches (formal, scientific, engaging)
+for the doctor in the user message.
+Which email is BEST for this doctor? Reply with ONLY the word: formal, scientific, or engaging""",
+    include_brief=False,
+)
+
+def doctor_details(doctor_name: str, specialty: str) -> str:
+    return f"""Doctor: Dr. {doctor_name}
+Specialty: {specialty}"""
+
+def generate_email(route: str, prompt: PromptBuilder, doctor_name: str, specialty: str) -> EmailOutput:
+    """Generate one outreach email on its route using OpenAI API"""
+    with model_router.track(route) as call:
+        response = client.beta.chat.completions.parse(
+            model=call.model,
+            messages=prompt.messages(doctor_details(doctor_name, specialty)),
+            response_format=EmailOutput
+        )
+        call.record_usage(response)
+    return response.choices[0].message.parsed
+
 def generate_formal_email(doctor_name: str, specialty: str) -> EmailOutput: 
     """Generate formal outreach email using OpenAI API"""
-    prompt = f"""Generate a formal, professional outreach email for:
-Doctor: Dr. {doctor_name}
-Specialty: {specialty}
-
-Introduce CardioRelief, a new drug for chronic heart failure. Focus on clinical data and efficacy.
-Return as JSON with 'subject' and 'body' fields."""
-    
-    response = client.beta.chat.completions.parse(
-        model="gpt-4o-mini",
-        messages=[
-            {"role": "system", "content": formal_instructions},
-            {"role": "user", "content": prompt}
-        ],
-        response_format=EmailOutput
-    )
-    return response.choices[0].message.parsed
+    return generate_email("outreach.formal_email", formal_prompt, doctor_name, specialty)
 
 def generate_scientific_email(doctor_name: str, specialty: str) -> EmailOutput:
     """Generate scientific outreach email using OpenAI API"""
-    prompt = f"""Generate a scientific, research-focused outreach email for:
-Doctor: Dr. {doctor_name}
-Specialty: {specialty}
-
-Introduce CardioRelief, emphasizing trial data, LVEF improvement, and mechanisms of action.
-Return as JSON with 'subject' and 'body' fields."""
-    
-    response = client.beta.chat.completions.parse(
-        model="gpt-4o-mini",
-        messages=[
-            {"role": "system", "content": scientific_instructions},
-            {"role": "user", "content": prompt}
-        ],
-        response_format=EmailOutput
-    )
-    return response.choices[0].message.parsed
+    return generate_email("outreach.scientific_email", scientific_prompt, doctor_name, specialty)
 
 def generate_engaging_email(doctor_name: str, specialty: str) -> EmailOutput:
     """Generate engaging outreach email using OpenAI API"""
-    prompt = f"""Generate an engaging, warm outreach email for:
-Doctor: Dr. {doctor_name}
-Specialty: {specialty}
-
-Introduce CardioRelief in a friendly way, focusing on patient benefits and practical value.
-Return as JSON with 'subject' and 'body' fields."""
-    
-    response = client.beta.chat.completions.parse(
-        model="gpt-4o-mini",
-        messages=[
-            {"role": "system", "content": engaging_instructions},
-            {"role": "user", "content": prompt}
-        ],
-        response_format=EmailOutput
-    )
-    return response.choices[0].message.parsed
+    return generate_email("outreach.engaging_email", engaging_prompt, doctor_name, specialty)
 
 def select_best_email(doctor_name: str, specialty: str, formal: EmailOutput, scientific: EmailOutput, engaging: EmailOutput) -> tuple:
     """Use OpenAI to evaluate and select the best email"""
-    prompt = f"""You are an Outreach Manager evaluating three email approaches for:
-Doctor: Dr. {doctor_name}
-Specialty: {specialty}
+    request = f"""{doctor_details(doctor_name, specialty)}
 
 Formal Email:
 Subject: {formal.subject}
@@ -123,14 +121,14 @@ Body: {scientific.body}
 
 Engaging Email:
 Subject: {engaging.subject}
-Body: {engaging.body}
-
-Which email is BEST for this doctor? Reply with ONLY the word: formal, scientific, or engaging"""
+Body: {engaging.body}"""
     
-    response = client.chat.completions.create(
-        model="gpt-4o-mini",
-        messages=[{"role": "user", "content": prompt}]
-    )
+    with model_router.track("outreach.select_best_email") as call:
+        response = client.chat.completions.create(
+            model=call.model,
+            messages=select_prompt.messages(request)
+        )
+        call.record_usage(response)
     
     choice = response.choices[0].message.content.strip().lower()
     
@@ -221,6 +219,7 @@ def render_tab():
 
         output = gr.Markdown(label="Generated Email")
 
+        @profiled("run_outreach")
         def run_outreach(name, spec):
             """Wrapper to run async function in Gradio"""
             if not name or not spec:
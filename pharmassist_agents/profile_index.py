@@ -0,0 +1,259 @@
+"""Local retrieval index over the drug profile and trial sites for the Drug Profile chat
+
+Chunks are embedded offline with a hashed TF-IDF vectorizer into sparse rows
+(bucket indices plus weights), persisted compressed under the cache directory and
+rebuilt incrementally: only chunks whose text changed are re-tokenized when a
+source file is edited. Trial sites are summarized per country plus the highest-risk
+sites, so the index stays small however many sites a program has.
+"""
+
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+import zlib
+import numpy as np
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from .data_snapshot import cache_path
+from .data_files import file_key, flatten, readable
+from .ops_analytics import load_profile, load_trials
+from .trial_scoring import compute_risk_scores, site_metrics
+
+data_dir = Path("data")
+
+SOURCE_FILES = ["drug_profile.json", "trials.csv"]
+N_FEATURES = 2 ** 14
+DEFAULT_TOP_K = 4
+MIN_SCORE = 0.05
+INDEX_FORMAT = 2
+MAX_SITE_CHUNKS = 10
+MAX_SITES_PER_COUNTRY = 10
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9][a-z0-9\-\.%]*[a-z0-9%]|[a-z0-9]")
+
+# ============================================================================
+# Chunking
+# ============================================================================
+
+def profile_chunks(profile: Dict[str, Any]) -> List[Tuple[str, str]]:
+    """One chunk per second-level profile entry, plus an overview of the top-level fields"""
+    chunks = []
+    overview = {key: value for key, value in profile.items() if not isinstance(value, (dict, list))}
+    if overview:
+        chunks.append(("profile.overview", f"Drug overview - {flatten(overview)}"))
+
+    for section, value in profile.items():
+        title = readable(section).title()
+        if isinstance(value, dict):
+            for key, item in value.items():
+                chunks.append((f"profile.{section}.{key}", f"{title} > {readable(key)}: {flatten(item)}"))
+        elif isinstance(value, list):
+            chunks.append((f"profile.{section}", f"{title}: {flatten(value)}"))
+    return chunks
+
+def _site_text(row) -> str:
+    return (f"Trial site {row.site_id} {row.site_name} ({row.country}), status {row.status}: "
+            f"enrolled {row.enrolled}/{row.enrollment_target}, completion {row.completion_pct}%, "
+            f"dropout rate {row.dropout_rate}%, protocol violations {row.protocol_violations}, "
+            f"adverse events {row.adverse_events_total} ({row.serious_adverse_events} serious), "
+            f"LVEF improvement {row.efficacy_lvef_improvement}")
+
+def trial_site_chunks(trials) -> List[Tuple[str, str]]:
+    """One summary chunk per country plus one per highest-risk site, bounded in site count"""
+    if len(trials) == 0:
+        return []
+    composite, _ = compute_risk_scores(site_metrics(trials))
+    ranked = trials.assign(risk_score=composite).sort_values("risk_score", ascending=False, kind="stable")
+
+    chunks = []
+    for country, sites in ranked.groupby("country", sort=True):
+        named = ", ".join(f"{row.site_id} {row.site_name}" for row in sites.head(MAX_SITES_PER_COUNTRY).itertuples())
+        more = f" and {len(sites) - MAX_SITES_PER_COUNTRY} more" if len(sites) > MAX_SITES_PER_COUNTRY else ""
+        chunks.append((
+            f"trials.country.{country}",
+            f"Trial sites in {country}: {len(sites)} sites, enrolled {sites['enrolled'].sum()}/"
+            f"{sites['enrollment_target'].sum()}, average dropout rate {sites['dropout_rate'].mean():.1f}%, "
+            f"{sites['protocol_violations'].sum()} protocol violations, "
+            f"{sites['serious_adverse_events'].sum()} serious adverse events. "
+            f"Sites by risk: {named}{more}",
+        ))
+    chunks.extend((f"trials.{row.site_id}", _site_text(row))
+                  for row in ranked.head(MAX_SITE_CHUNKS).itertuples(index=False))
+    return chunks
+
+def build_chunks(data_path: Path = data_dir) -> List[Tuple[str, str]]:
+    return profile_chunks(load_profile(data_path)) + trial_site_chunks(load_trials(data_path))
+
+# ============================================================================
+# Hashed TF-IDF vectorizer
+# ============================================================================
+
+def tokenize(text: str) -> List[str]:
+    """Lowercased word unigrams plus bigrams"""
+    words = TOKEN_PATTERN.findall(text.lower())
+    return words + [f"{a} {b}" for a, b in zip(words, words[1:])]
+
+def term_counts(text: str) -> Tuple[np.ndarray, np.ndarray]:
+    """Hashed bucket indices and sublinear term frequencies (stable across runs)"""
+    buckets = np.fromiter((zlib.crc32(token.encode()) % N_FEATURES for token in tokenize(text)), dtype=np.int32)
+    indices, counts = np.unique(buckets, return_counts=True)
+    return indices.astype(np.int32), np.log1p(counts).astype(np.float32)
+
+def _digest(text: str) -> str:
+    return hashlib.sha256(text.encode()).hexdigest()[:16]
+
+# ============================================================================
+# Index
+# ============================================================================
+
+class ProfileIndex:
+    """
+    Sparse TF-IDF rows over profile and trial-site chunks.
+
+    Row i's term buckets are indices[indptr[i]:indptr[i + 1]] with sublinear term
+    frequencies in tf; IDF comes from per-bucket document frequencies, so no dense
+    N_FEATURES-wide row is ever stored.
+    """
+
+    def __init__(self, ids: List[str], texts: List[str], digests: List[str],
+                 indptr: np.ndarray, indices: np.ndarray, tf: np.ndarray):
+        self.ids = ids
+        self.texts = texts
+        self.digests = digests
+        self.indptr = indptr
+        self.indices = indices
+        self.tf = tf
+        self.document_frequency = np.bincount(indices, minlength=N_FEATURES)
+        self.idf = (np.log((1 + len(ids)) / (1 + self.document_frequency)) + 1).astype(np.float32)
+        self._rows = np.repeat(np.arange(len(ids)), np.diff(indptr))
+        weights = tf * self.idf[indices]
+        norms = np.sqrt(np.bincount(self._rows, weights=weights ** 2, minlength=len(ids)))
+        self.weights = (weights / np.where(norms > 0, norms, 1)[self._rows]).astype(np.float32)
+
+    def row(self, i: int) -> Tuple[np.ndarray, np.ndarray]:
+        start, end = self.indptr[i], self.indptr[i + 1]
+        return self.indices[start:end], self.tf[start:end]
+
+    @classmethod
+    def build(cls, chunks: List[Tuple[str, str]], previous: Optional["ProfileIndex"] = None) -> Tuple["ProfileIndex", int]:
+        """Build from chunks, reusing term counts of unchanged chunks. Returns (index, chunks re-embedded)"""
+        reusable = {}
+        if previous is not None:
+            reusable = {digest: row for row, digest in enumerate(previous.digests)}
+
+        ids, texts, digests, indices, tfs = [], [], [], [], []
+        embedded = 0
+        for chunk_id, text in chunks:
+            digest = _digest(text)
+            if digest in reusable:
+                row_indices, row_tf = previous.row(reusable[digest])
+            else:
+                row_indices, row_tf = term_counts(text)
+                embedded += 1
+            ids.append(chunk_id)
+            texts.append(text)
+            digests.append(digest)
+            indices.append(row_indices)
+            tfs.append(row_tf)
+
+        indptr = np.zeros(len(ids) + 1, dtype=np.int64)
+        np.cumsum([len(row) for row in indices], out=indptr[1:])
+        return cls(ids, texts, digests, indptr,
+                   np.concatenate(indices) if indices else np.zeros(0, dtype=np.int32),
+                   np.concatenate(tfs) if tfs else np.zeros(0, dtype=np.float32)), embedded
+
+    def search(self, query: str, k: int = DEFAULT_TOP_K) -> List[Dict[str, Any]]:
+        """Top-k chunks by cosine similarity"""
+        if not self.ids:
+            return []
+        query_indices, query_tf = term_counts(query)
+        query_vector = np.zeros(N_FEATURES, dtype=np.float32)
+        query_vector[query_indices] = query_tf * self.idf[query_indices]
+        norm = np.linalg.norm(query_vector)
+        if norm == 0:
+            return []
+        scores = np.bincount(self._rows, weights=self.weights * query_vector[self.indices],
+                             minlength=len(self.ids)) / norm
+        k = min(k, len(scores))
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top], kind="stable")]
+        return [
+            {"id": self.ids[i], "text": self.texts[i], "score": round(float(scores[i]), 3)}
+            for i in top if scores[i] >= MIN_SCORE
+        ]
+
+    def save(self, path: Path, sources: List[Any]):
+        # Per-process temp name: serving-mode workers may rebuild the same index at once
+        tmp = path.with_name(f"{path.stem}.{os.getpid()}.tmp.npz")
+        np.savez_compressed(
+            tmp, ids=np.array(self.ids), texts=np.array(self.texts), digests=np.array(self.digests),
+            indptr=self.indptr, indices=self.indices, tf=self.tf,
+            meta=np.array(json.dumps({"format": INDEX_FORMAT, "n_features": N_FEATURES, "sources": sources})),
+        )
+        tmp.replace(path)
+
+    @classmethod
+    def load(cls, path: Path) -> Tuple[Optional["ProfileIndex"], List[Any]]:
+        """Load a persisted index and the source stamps it was built from"""
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                meta = json.loads(str(data["meta"]))
+                if meta.get("format") != INDEX_FORMAT or meta.get("n_features") != N_FEATURES:
+                    return None, []
+                index = cls(data["ids"].tolist(), data["texts"].tolist(), data["digests"].tolist(),
+                            data["indptr"], data["indices"], data["tf"])
+                return index, meta["sources"]
+        except (OSError, KeyError, ValueError):
+            return None, []
+
+
+class ProfileRetriever:
+    """Keeps the index in sync with the source files; safe to share across chat sessions"""
+
+    def __init__(self, data_path: Path = data_dir, index_file: str = "profile_index.npz"):
+        self.data_path = data_path
+        self.index_file = index_file
+        self._index: Optional[ProfileIndex] = None
+        self._sources: List[Any] = []
+        self._lock = threading.Lock()
+
+    def _stamps(self) -> List[Any]:
+        return [list(file_key(self.data_path / name)) for name in SOURCE_FILES]
+
+    def refresh(self) -> ProfileIndex:
+        """Return an index matching the current files, rebuilding changed chunks only"""
+        stamps = self._stamps()
+        with self._lock:
+            if self._index is not None and self._sources == stamps:
+                return self._index
+
+            path = cache_path(self.index_file)
+            previous = self._index
+            if previous is None:
+                previous, persisted = ProfileIndex.load(path)
+                if previous is not None and persisted == stamps:
+                    self._index, self._sources = previous, stamps
+                    return previous
+
+            start = time.perf_counter()
+            index, embedded = ProfileIndex.build(build_chunks(self.data_path), previous)
+            index.save(path, stamps)
+            self._index, self._sources = index, stamps
+            print(f"🔎 Profile index: {len(index.ids)} chunks ({embedded} re-embedded) "
+                  f"in {(time.perf_counter() - start) * 1000:.1f} ms")
+            return index
+
+    def search(self, query: str, k: int = DEFAULT_TOP_K) -> List[Dict[str, Any]]:
+        return self.refresh().search(query, k)
+
+
+profile_retriever = ProfileRetriever()
+
+
+def format_context(hits: List[Dict[str, Any]]) -> str:
+    """Render retrieved chunks for the chat turn"""
+    return "\n".join(f"[{hit['id']}] {hit['text']}" for hit in hits)
@@ -0,0 +1,264 @@
+"""On-demand per-request CPU profiling for the slow tab handlers
+
+Enable with PHARMASSIST_PROFILE=sample (stack sampling, low overhead) or
+PHARMASSIST_PROFILE=deterministic (cProfile), or from the Profiling panel, which
+is only shown when PHARMASSIST_PROFILE_ADMIN=true. Each profiled request writes
+to PHARMASSIST_PROFILE_DIR (default .cache/profiles), keeping the newest
+PHARMASSIST_PROFILE_KEEP requests:
+
+- <request>.folded  collapsed stacks of every thread for flamegraph.pl / speedscope,
+                    rooted at [on-cpu] or [off-cpu] so network and lock waits stand apart
+- <request>.prof    cProfile stats of the request thread (deterministic mode; open with snakeviz)
+- <request>.json    wall time split into process CPU and I/O-wait, plus hottest frames
+
+When profiling is off the wrapper costs one attribute check per call.
+"""
+
+import cProfile
+import functools
+import json
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+import gradio as gr
+
+from .data_snapshot import CACHE_DIR
+
+MODES = ("off", "sample", "deterministic")
+SAMPLE_INTERVAL_SECONDS = 0.005
+TOP_FRAMES = 15
+RECENT_PROFILES = 10
+MAX_STORED_PROFILES = 200
+REQUEST_THREAD_TAG = " (request)"
+
+
+def _frame_label(code) -> str:
+    path = Path(code.co_filename)
+    return f"{code.co_name} ({path.parent.name}/{path.name}:{code.co_firstlineno})"
+
+
+def _thread_cpu_time(thread_id: int) -> Optional[float]:
+    try:
+        return time.clock_gettime(time.pthread_getcpuclockid(thread_id))
+    except (AttributeError, OSError):
+        return None
+
+
+class StackSampler(threading.Thread):
+    """
+    Samples the Python stack of every thread in the process at a fixed interval.
+
+    Work a request hands to thread pools (LLM calls, tool runs, parallel report
+    sections) runs outside the request thread, so all threads are sampled and
+    each stack is rooted at its thread name, the request thread's suffixed with
+    REQUEST_THREAD_TAG. Each sample is tagged on-CPU or
+    off-CPU by how far that thread's CPU clock advanced since the previous
+    sample, so waits on the network, subprocesses or locks show up as their own
+    branch of the flame graph.
+    """
+
+    def __init__(self, request_thread_id: int, interval: float = SAMPLE_INTERVAL_SECONDS):
+        super().__init__(name="profiling-sampler", daemon=True)
+        self.request_thread_id = request_thread_id
+        self.interval = interval
+        self.stacks: Counter = Counter()
+        self._stop_event = threading.Event()
+        self._last_cpu: Dict[int, Optional[float]] = {}
+
+    def run(self):
+        last_wall = time.perf_counter()
+        for thread in threading.enumerate():
+            self._last_cpu[thread.ident] = _thread_cpu_time(thread.ident)
+        while not self._stop_event.wait(self.interval):
+            frames = sys._current_frames()
+            wall = time.perf_counter()
+            names = {thread.ident: thread.name for thread in threading.enumerate()}
+            for thread_id, frame in frames.items():
+                if thread_id == self.ident:
+                    continue
+                cpu, last_cpu = _thread_cpu_time(thread_id), self._last_cpu.get(thread_id)
+                self._last_cpu[thread_id] = cpu
+                if cpu is None:
+                    state = "[sampled]"
+                elif last_cpu is None:
+                    continue  # thread started since the last sample
+                else:
+                    state = "[on-cpu]" if cpu - last_cpu >= 0.5 * (wall - last_wall) else "[off-cpu]"
+
+                stack = []
+                while frame is not None:
+                    stack.append(_frame_label(frame.f_code))
+                    frame = frame.f_back
+                thread_name = names.get(thread_id, f"thread-{thread_id}")
+                if thread_id == self.request_thread_id:
+                    thread_name += REQUEST_THREAD_TAG
+                stack += [thread_name, state]
+                self.stacks[";".join(reversed(stack))] += 1
+            last_wall = wall
+
+    def stop(self) -> Counter:
+        self._stop_event.set()
+        self.join()
+        return self.stacks
+
+
+class RequestProfiler:
+    """Process-wide profiling switch and the per-request recorder"""
+
+    def __init__(self, mode: str = "off", output_dir: Path = CACHE_DIR / "profiles",
+                 keep: int = MAX_STORED_PROFILES):
+        self.output_dir = output_dir
+        self.keep = keep
+        self.mode = "off"
+        self.enabled = False
+        self._lock = threading.Lock()
+        self.set_mode(mode)
+
+    def set_mode(self, mode: str):
+        if mode not in MODES:
+            raise ValueError(f"Profiling mode must be one of {MODES}, got {mode!r}")
+        self.mode = mode
+        self.enabled = mode != "off"
+
+    def profile(self, name: str, fn: Callable, *args, **kwargs) -> Any:
+        """Run fn under the current mode and save its profile"""
+        mode = self.mode
+        sampler = profile = None
+        if mode == "sample":
+            sampler = StackSampler(threading.get_ident())
+            sampler.start()
+        elif mode == "deterministic":
+            profile = cProfile.Profile()
+
+        started_at = datetime.now()
+        wall_start, cpu_start, thread_start = time.perf_counter(), time.process_time(), time.thread_time()
+        try:
+            if profile is not None:
+                return profile.runcall(fn, *args, **kwargs)
+            return fn(*args, **kwargs)
+        finally:
+            wall = time.perf_counter() - wall_start
+            cpu = time.process_time() - cpu_start
+            thread_cpu = time.thread_time() - thread_start
+            stacks = sampler.stop() if sampler else None
+            try:
+                self._save(name, mode, started_at, wall, cpu, thread_cpu, stacks, profile)
+                self._prune()
+            except OSError as e:
+                print(f"⚠️ Could not save profile for {name}: {e}")
+
+    def _save(self, name: str, mode: str, started_at: datetime, wall: float, cpu: float,
+              thread_cpu: float, stacks: Optional[Counter], profile: Optional[cProfile.Profile]):
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        stem = self.output_dir / f"{started_at:%Y%m%d-%H%M%S-%f}-{name}-{os.getpid()}"
+
+        summary: Dict[str, Any] = {
+            "request": name,
+            "mode": mode,
+            "started_at": started_at.isoformat(timespec="milliseconds"),
+            "wall_s": round(wall, 4),
+            # Process CPU covers the request's helper threads, and any concurrent requests
+            "on_cpu_s": round(cpu, 4),
+            "io_wait_s": round(max(wall - cpu, 0.0), 4),
+            "request_thread_cpu_s": round(thread_cpu, 4),
+        }
+
+        if stacks is not None:
+            stem.with_suffix(".folded").write_text("".join(f"{stack} {count}\n" for stack, count in stacks.items()))
+            leaves: Counter = Counter()
+            for stack, count in stacks.items():
+                frames = stack.split(";")
+                # Other threads only count while on CPU, so idle pools and server threads stay out
+                if frames[0] != "[off-cpu]" or frames[1].endswith(REQUEST_THREAD_TAG):
+                    leaves[f"{frames[0]} {frames[-1]}"] += count
+            summary["samples"] = sum(stacks.values())
+            summary["on_cpu_samples"] = sum(c for s, c in stacks.items() if s.startswith("[on-cpu]"))
+            summary["top_frames"] = [{"frame": frame, "samples": count} for frame, count in leaves.most_common(TOP_FRAMES)]
+
+        if profile is not None:
+            profile.dump_stats(stem.with_suffix(".prof"))
+            stats = sorted(profile.getstats(), key=lambda entry: entry.totaltime, reverse=True)
+            summary["top_frames"] = [
+                {"frame": entry.code if isinstance(entry.code, str) else _frame_label(entry.code),
+                 "self_s": round(entry.inlinetime, 4), "total_s": round(entry.totaltime, 4)}
+                for entry in stats[:TOP_FRAMES]
+            ]
+
+        stem.with_suffix(".json").write_text(json.dumps(summary, indent=2))
+        print(f"🩺 Profiled {name}: {wall:.2f}s wall, {cpu:.2f}s on-CPU, "
+              f"{max(wall - cpu, 0.0):.2f}s waiting -> {stem}.*")
+
+    def _prune(self):
+        """Delete all files of the oldest requests beyond the newest `keep`"""
+        for summary in sorted(self.output_dir.glob("*.json"), reverse=True)[self.keep:]:
+            for suffix in (".json", ".folded", ".prof"):
+                summary.with_suffix(suffix).unlink(missing_ok=True)
+
+    def recent(self, limit: int = RECENT_PROFILES) -> List[Dict[str, Any]]:
+        if not self.output_dir.exists():
+            return []
+        summaries = sorted(self.output_dir.glob("*.json"), reverse=True)[:limit]
+        return [json.loads(path.read_text()) for path in summaries]
+
+    def report(self) -> str:
+        rows = self.recent()
+        if not rows:
+            return f"Profiling is **{self.mode}**. No profiles saved yet."
+        lines = [
+            f"Profiling is **{self.mode}** · output in `{self.output_dir}`",
+            "",
+            "| Started | Request | Mode | Wall (s) | On-CPU (s) | I/O wait (s) | Hottest frame |",
+            "|---|---|---|---:|---:|---:|---|",
+        ]
+        for row in rows:
+            top = row.get("top_frames") or [{"frame": "-"}]
+            lines.append(f"| {row['started_at']} | {row['request']} | {row['mode']} | {row['wall_s']} | "
+                         f"{row['on_cpu_s']} | {row['io_wait_s']} | `{top[0]['frame']}` |")
+        return "\n".join(lines)
+
+
+request_profiler = RequestProfiler(
+    os.getenv("PHARMASSIST_PROFILE", "off").lower(),
+    Path(os.getenv("PHARMASSIST_PROFILE_DIR", CACHE_DIR / "profiles")),
+    int(os.getenv("PHARMASSIST_PROFILE_KEEP", MAX_STORED_PROFILES)),
+)
+
+
+def profiled(name: str) -> Callable:
+    """Profile calls of a handler whenever request profiling is switched on"""
+    def decorator(fn: Callable) -> Callable:
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not request_profiler.enabled:
+                return fn(*args, **kwargs)
+            return request_profiler.profile(name, fn, *args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def render_admin():
+    """
+    Admin panel to switch profiling on and browse recent request profiles.
+
+    The app has no login and is usually served on a public share link, so the
+    panel is only built when PHARMASSIST_PROFILE_ADMIN=true.
+    """
+    if os.getenv("PHARMASSIST_PROFILE_ADMIN", "false").lower() != "true":
+        return
+    with gr.Accordion("🩺 Request Profiling", open=False):
+        mode = gr.Radio(list(MODES), value=request_profiler.mode, label="Profiling mode")
+        report = gr.Markdown(request_profiler.report())
+        refresh = gr.Button("🔄 Refresh")
+
+        def switch(selected):
+            request_profiler.set_mode(selected)
+            return request_profiler.report()
+
+        mode.change(switch, mode, report)
+        refresh.click(request_profiler.report, None, report)
@@ -0,0 +1,112 @@
+"""Prompt construction with a stable, cacheable prefix
+
+OpenAI reuses the longest prompt prefix it has already seen (once a prompt is
+past 1,024 tokens) and bills those cached input tokens at a discount, but only
+when the prefix is byte-identical. Every LLM prompt is therefore assembled in
+one fixed order, static content first:
+
+1. role instructions  - constant per call site
+2. drug brief         - product facts, changes only with the drug profile
+3. output schema      - field descriptions of the structured output
+4. per-request data   - doctor, trial figures, retrieved facts, the question
+
+Only (4) goes in the user message, so repeated calls on a route share
+everything up to it.
+"""
+
+import hashlib
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Type
+
+from pydantic import BaseModel
+
+from .data_files import file_key, flatten, readable
+from .ops_analytics import load_profile
+
+data_dir = Path("data")
+
+# Profile entries every call site may need; ordered so the brief text never shifts
+BRIEF_PATHS = (
+    "efficacy_signals",
+    "safety_profile",
+    "clinical_operations.phase_iib_status",
+    "clinical_operations.phase_iii_requirements",
+    "regulatory_operations.approval_pathway",
+    "regulatory_operations.regulatory_timeline",
+    "regulatory_operations.regulatory_risks",
+    "commercial_operations.competitor_landscape",
+    "commercial_operations.market_entry_strategy",
+    "operational_readiness_summary",
+)
+
+
+def render_brief(profile: Dict[str, Any]) -> str:
+    """Compact brief of one drug profile; same profile, same text"""
+    overview = "; ".join(f"{readable(key)}: {flatten(value)}" for key, value in profile.items()
+                         if not isinstance(value, (dict, list)) or key == "target_market")
+    lines = [f"DRUG BRIEF - {profile.get('name', 'Product')}", f"- Overview: {overview}"]
+    for dotted in BRIEF_PATHS:
+        value: Any = profile
+        for key in dotted.split("."):
+            value = value.get(key) if isinstance(value, dict) else None
+        if value is not None:
+            lines.append(f"- {readable(dotted.split('.')[-1]).capitalize()}: {flatten(value)}")
+    return "\n".join(lines)
+
+
+@lru_cache(maxsize=4)
+def _render_brief(path: str, mtime_ns: int, size: int) -> str:
+    return render_brief(load_profile(Path(path).parent))
+
+
+def drug_brief(data_path: Path = data_dir) -> str:
+    """Brief of the program's drug_profile.json, re-rendered only when the file changes"""
+    return _render_brief(*file_key(data_path / "drug_profile.json"))
+
+
+def describe_schema(schema: Type[BaseModel]) -> str:
+    """Field-by-field description of a structured output model"""
+    lines = [f"OUTPUT FORMAT - respond with a {schema.__name__} object:"]
+    for name, field in schema.model_fields.items():
+        lines.append(f"- {name}: {field.description or name}")
+    return "\n".join(lines)
+
+
+class PromptBuilder:
+    """
+    Builds the messages for one call site.
+
+    The system message holds instructions, drug brief and schema description and
+    is identical for every request on the site; per-request data, history aside,
+    is always the final user message. Callers that analyze several programs pass
+    each program's profile, otherwise the brief comes from data_path.
+    """
+
+    def __init__(self, instructions: str, schema: Optional[Type[BaseModel]] = None,
+                 include_brief: bool = True, data_path: Path = data_dir):
+        self.instructions = instructions.strip()
+        self.schema = schema
+        self.include_brief = include_brief
+        self.data_path = data_path
+
+    def system_prompt(self, profile: Optional[Dict[str, Any]] = None) -> str:
+        parts = [self.instructions]
+        if self.include_brief:
+            parts.append(render_brief(profile) if profile is not None else drug_brief(self.data_path))
+        if self.schema is not None:
+            parts.append(describe_schema(self.schema))
+        return "\n\n".join(parts)
+
+    def version(self, profile: Optional[Dict[str, Any]] = None) -> str:
+        """Hash of the static prefix; changes when instructions, brief or schema do"""
+        return hashlib.sha256(self.system_prompt(profile).encode()).hexdigest()[:16]
+
+    def messages(self, request: str, history: Sequence[Tuple[str, str]] = (),
+                 profile: Optional[Dict[str, Any]] = None) -> List[Dict[str, str]]:
+        messages = [{"role": "system", "content": self.system_prompt(profile)}]
+        for user_msg, assistant_msg in history:
+            messages.append({"role": "user", "content": user_msg})
+            messages.append({"role": "assistant", "content": assistant_msg})
+        messages.append({"role": "user", "content": request.strip()})
+        return messages
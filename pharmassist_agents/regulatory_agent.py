@@ -1,16 +1,165 @@
 import gradio as gr
+import hashlib
+import json
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, NamedTuple, Tuple
+from dotenv import load_dotenv
 
-def generate_brief():
-    # placeholder: later replace with CrewAI+LangGraph+MCP
-    brief = (
-        "# Regulatory Brief (Mock)\n"
-        "- Pathway: Conditional marketing authorisation (EU)\n"
-        "- Key docs: Module 2 summaries, risk plan\n"
-        "- Timeline: 6–12 months (mock)\n"
-    )
+from .data_snapshot import report_store
+from .model_routing import chat_model, model_router
+from .ops_analytics import load_profile
+
+load_dotenv()
+
+data_dir = Path("data")
+
+# ============================================================================
+# STEP 1: Brief Sections and the Profile Subtrees They Depend On
+# ============================================================================
+
+class BriefSection(NamedTuple):
+    key: str
+    title: str
+    paths: Tuple[str, ...]
+    instructions: str
+
+SECTIONS: List[BriefSection] = [
+    BriefSection(
+        "pathway", "🛤️ Regulatory Pathway",
+        ("name", "indication", "mechanism", "stage", "target_market",
+         "regulatory_operations.approval_pathway", "efficacy_signals"),
+        "Explain the recommended EU and US approval pathway, why the product qualifies "
+        "(expedited designations, conditional approval criteria) and the evidence package it relies on.",
+    ),
+    BriefSection(
+        "timeline", "📅 Submission Timeline",
+        ("regulatory_operations.regulatory_timeline", "regulatory_operations.submission_readiness",
+         "clinical_operations.phase_iii_requirements", "operational_readiness_summary.go_no_go_decision_date"),
+        "Lay out the milestones from Phase III initiation to EMA and FDA approval as a dated list, "
+        "and call out which milestones are on the critical path and what could move them.",
+    ),
+    BriefSection(
+        "cmc_gaps", "🏭 CMC Gaps",
+        ("regulatory_operations.cmc_status", "manufacturing_operations"),
+        "Identify the Chemistry, Manufacturing and Controls gaps that must close before submission "
+        "(documentation, capacity scale-up, supply chain, GMP inspection) with an owner-ready action for each.",
+    ),
+    BriefSection(
+        "risk_plan", "⚠️ Risk Management Plan",
+        ("regulatory_operations.regulatory_risks", "safety_profile"),
+        "Draft the risk management plan: important identified and potential risks, routine and "
+        "additional pharmacovigilance activities, and risk minimisation measures for the label.",
+    ),
+]
+
+MAX_PARALLEL_SECTIONS = len(SECTIONS)
+
+def profile_subtree(profile: Dict[str, Any], paths: Tuple[str, ...]) -> Dict[str, Any]:
+    """The parts of the profile a section depends on, keyed by dotted path"""
+    subtree = {}
+    for path in paths:
+        value: Any = profile
+        for key in path.split("."):
+            value = value.get(key) if isinstance(value, dict) else None
+        subtree[path] = value
+    return subtree
+
+def section_version(section: BriefSection, subtree: Dict[str, Any]) -> str:
+    """Hash of the section's profile subtree and instructions; changes only when they do"""
+    payload = json.dumps({"instructions": section.instructions, "profile": subtree}, sort_keys=True)
+    return hashlib.sha256(payload.encode()).hexdigest()[:16]
+
+# ============================================================================
+# STEP 2: Generate One Section
+# ============================================================================
+
+def generate_section(section: BriefSection, subtree: Dict[str, Any]) -> str:
+    """Write one brief section from its profile subtree"""
+    prompt = f"""You are a regulatory affairs lead writing one section of a regulatory brief.
+
+Section: {section.title}
+Task: {section.instructions}
+
+Use only the program data below. Be specific, cite dates and figures from it, and keep the section under 250 words in Markdown (no top-level heading).
+
+Program data:
+{json.dumps(subtree, indent=1)}"""
+
+    with model_router.track(f"regulatory.{section.key}") as call:
+        response = chat_model(call.model).invoke(prompt)
+        call.record_usage(response)
+    return response.content
+
+def cached_section(section: BriefSection, profile: Dict[str, Any]) -> Tuple[str, bool]:
+    """Return (markdown, reused) - regenerated only when the section's subtree changed"""
+    subtree = profile_subtree(profile, section.paths)
+    kind, version = f"regulatory_brief.{section.key}", section_version(section, subtree)
+    cached = report_store.get(kind, version)
+    if cached:
+        return cached.text, True
+    return report_store.get_or_compute(kind, version, lambda: generate_section(section, subtree)).text, False
+
+# ============================================================================
+# STEP 3: Assemble and Stream the Brief
+# ============================================================================
+
+def format_brief(profile: Dict[str, Any], sections: Dict[str, str], footer: str = "") -> str:
+    """Brief Markdown with sections in fixed order; unfinished ones show as pending"""
+    parts = [
+        f"# 📑 Regulatory Brief: {profile.get('name', 'Unknown')}",
+        f"**Indication:** {profile.get('indication', 'n/a')} · **Stage:** {profile.get('stage', 'n/a')}",
+    ]
+    for section in SECTIONS:
+        parts.append(f"## {section.title}\n\n{sections.get(section.key, '⏳ *Generating...*')}")
+    if footer:
+        parts.append(f"---\n{footer}")
+    return "\n\n".join(parts)
+
+def stream_brief(data_path: Path = data_dir) -> Iterator[str]:
+    """Generate all sections concurrently, yielding the brief each time one completes"""
+    profile = load_profile(data_path)
+    sections: Dict[str, str] = {}
+    reused = 0
+    yield format_brief(profile, sections)
+
+    with ThreadPoolExecutor(max_workers=MAX_PARALLEL_SECTIONS, thread_name_prefix="regulatory-brief") as pool:
+        futures = {pool.submit(cached_section, section, profile): section for section in SECTIONS}
+        for future in as_completed(futures):
+            section = futures[future]
+            try:
+                text, was_cached = future.result()
+                reused += was_cached
+            except Exception as e:
+                print(f"❌ Regulatory brief section {section.key} failed: {e}")
+                text = f"❌ Error generating this section: {str(e)}"
+            sections[section.key] = text
+            yield format_brief(profile, sections)
+
+    generated = len(SECTIONS) - reused
+    yield format_brief(profile, sections,
+                       f"♻️ {reused} section(s) reused from cache · ✍️ {generated} regenerated from changed profile data")
+
+def generate_brief(data_path: Path = data_dir) -> str:
+    """Full brief as one Markdown string"""
+    brief = ""
+    for brief in stream_brief(data_path):
+        pass
     return brief
 
+# ============================================================================
+# STEP 4: Gradio Interface
+# ============================================================================
+
 def render_tab():
-    btn = gr.Button("Generate Regulatory Brief")
+    gr.Markdown("""
+    # 📑 Regulatory Brief
+
+    Builds a regulatory brief from `drug_profile.json`. Pathway, timeline, CMC gaps and
+    the risk plan are written in parallel and appear as each one finishes. Sections are
+    cached per profile subtree, so editing one part of the profile only regenerates the
+    sections that depend on it.
+    """)
+    btn = gr.Button("Generate Regulatory Brief", variant="primary")
     out = gr.Markdown()
-    btn.click(generate_brief, None, out)
+    btn.click(stream_brief, None, out)
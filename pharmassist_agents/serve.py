@@ -0,0 +1,180 @@
+"""Production serving mode: several app worker processes behind one local entry point
+
+    python -m pharmassist_agents.serve --workers 4 --port 7860
+
+Each worker is a separate `python app.py` interpreter on its own port, so pandas
+parsing, report formatting and Pydantic validation run in parallel across CPU
+cores. The entry point assigns each new visitor to a worker (round-robin over
+live workers) with a redirect; the browser then talks to that worker directly,
+which keeps Gradio's per-session queue and event stream on one process.
+
+Reports, regulatory sections and trial node outputs are cached in SQLite (WAL)
+under PHARMASSIST_CACHE_DIR, so a cache fill in one worker serves all of them.
+"""
+
+import argparse
+import itertools
+import os
+import signal
+import subprocess
+import sys
+import threading
+import time
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import List, Optional
+
+APP_FILE = Path(__file__).resolve().parent.parent / "app.py"
+
+DEFAULT_PORT = 7860
+DEFAULT_HOST = "127.0.0.1"
+READY_TIMEOUT_SECONDS = 180
+SUPERVISE_INTERVAL_SECONDS = 1.0
+
+
+class Worker:
+    """One app process on a local port, restarted by the supervisor if it exits"""
+
+    def __init__(self, index: int, port: int, host: str, app_args: List[str]):
+        self.index = index
+        self.port = port
+        self.host = host
+        self.app_args = app_args
+        self.process: Optional[subprocess.Popen] = None
+        self.ready = False
+
+    def start(self):
+        args = ["--host", self.host, "--port", str(self.port), "--no-share", *self.app_args]
+        # One watcher is enough: the reports it warms land in the shared cache
+        if self.index > 0:
+            args.append("--no-prewarm")
+        self.process = subprocess.Popen([sys.executable, str(APP_FILE), *args], cwd=APP_FILE.parent)
+        self.ready = False
+        print(f"🚀 Worker {self.index} starting on port {self.port} (pid {self.process.pid})")
+
+    @property
+    def alive(self) -> bool:
+        return self.process is not None and self.process.poll() is None
+
+    def check_ready(self) -> bool:
+        if not self.ready and self.alive:
+            try:
+                with urllib.request.urlopen(f"http://{self.host}:{self.port}/", timeout=2) as response:
+                    self.ready = response.status == 200
+            except OSError:
+                pass
+        return self.ready
+
+    def stop(self):
+        if self.alive:
+            self.process.terminate()
+            try:
+                self.process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+
+
+class WorkerPool:
+    """Starts, health-checks and restarts workers; hands out live ones round-robin"""
+
+    def __init__(self, count: int, base_port: int, host: str, app_args: List[str]):
+        self.workers = [Worker(i, base_port + i, host, app_args) for i in range(count)]
+        self._cycle = itertools.cycle(self.workers)
+        self._lock = threading.Lock()
+
+    def start(self):
+        for worker in self.workers:
+            worker.start()
+
+    def wait_ready(self, timeout: float = READY_TIMEOUT_SECONDS) -> bool:
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if all(worker.check_ready() for worker in self.workers):
+                return True
+            time.sleep(0.5)
+        return False
+
+    def next_worker(self) -> Optional[Worker]:
+        with self._lock:
+            for _ in range(len(self.workers)):
+                worker = next(self._cycle)
+                if worker.ready and worker.alive:
+                    return worker
+        return None
+
+    def supervise(self, stop: threading.Event):
+        while not stop.wait(SUPERVISE_INTERVAL_SECONDS):
+            for worker in self.workers:
+                if not worker.alive:
+                    print(f"⚠️ Worker {worker.index} exited (code {worker.process.returncode}); restarting")
+                    worker.start()
+                worker.check_ready()
+
+    def stop(self):
+        for worker in self.workers:
+            worker.stop()
+
+
+def entry_handler(pool: WorkerPool, public_host: Optional[str]):
+    class EntryHandler(BaseHTTPRequestHandler):
+        """Redirects every request to a live worker, keeping the path and query"""
+
+        def _redirect(self):
+            worker = pool.next_worker()
+            if worker is None:
+                self.send_error(503, "No app workers are ready yet")
+                return
+            host = public_host or (self.headers.get("Host") or worker.host).split(":")[0]
+            self.send_response(307)
+            self.send_header("Location", f"http://{host}:{worker.port}{self.path}")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+        do_GET = do_POST = do_HEAD = _redirect
+
+        def log_message(self, format, *args):
+            pass
+
+    return EntryHandler
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run Pharmassist with several worker processes")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help="Entry point port")
+    parser.add_argument("--worker-base-port", type=int, help="First worker port (default: entry port + 1)")
+    parser.add_argument("--host", default=DEFAULT_HOST, help="Interface for the entry point and workers")
+    parser.add_argument("--public-host", help="Host name to put in redirects (default: the request's Host header)")
+    parser.add_argument("--no-prewarm", action="store_true", help="Don't run the data watcher in any worker")
+    parser.add_argument("--load-test", action="store_true", help="Serve the endpoint used by loadtest_serving.py")
+    args = parser.parse_args()
+
+    app_args = [flag for flag, enabled in [("--no-prewarm", args.no_prewarm), ("--load-test", args.load_test)] if enabled]
+    pool = WorkerPool(args.workers, args.worker_base_port or args.port + 1, args.host, app_args)
+    stop = threading.Event()
+
+    def shutdown(*_):
+        stop.set()
+
+    signal.signal(signal.SIGTERM, shutdown)
+    signal.signal(signal.SIGINT, shutdown)
+
+    pool.start()
+    try:
+        if not pool.wait_ready():
+            print("❌ Workers did not become ready in time")
+            return 1
+        server = ThreadingHTTPServer((args.host, args.port), entry_handler(pool, args.public_host))
+        threading.Thread(target=server.serve_forever, name="entry-point", daemon=True).start()
+        threading.Thread(target=pool.supervise, args=(stop,), name="supervisor", daemon=True).start()
+        print(f"✅ Serving {args.workers} workers at http://{args.host}:{args.port}", flush=True)
+        stop.wait()
+        server.shutdown()
+    finally:
+        pool.stop()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,74 @@
+"""SQLite (WAL) key/value store shared by every app worker process
+
+A value written by one worker is visible to all of them, and short-lived leases
+let a worker claim an expensive computation so the others wait for its result
+instead of repeating it.
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+BUSY_TIMEOUT_SECONDS = 30
+
+
+class SharedCache:
+    """Namespaced key/value rows in one SQLite database, one connection per thread"""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._local = threading.local()
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=BUSY_TIMEOUT_SECONDS, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("""CREATE TABLE IF NOT EXISTS entries (
+                ns TEXT, key TEXT, value TEXT NOT NULL, updated_at REAL NOT NULL,
+                PRIMARY KEY (ns, key))""")
+            conn.execute("""CREATE TABLE IF NOT EXISTS leases (
+                ns TEXT, key TEXT, owner TEXT NOT NULL, expires_at REAL NOT NULL,
+                PRIMARY KEY (ns, key))""")
+            self._local.conn = conn
+        return conn
+
+    @staticmethod
+    def _owner() -> str:
+        return f"{os.getpid()}:{threading.get_ident()}"
+
+    def get(self, ns: str, key: str) -> Optional[str]:
+        row = self._conn().execute("SELECT value FROM entries WHERE ns = ? AND key = ?", (ns, key)).fetchone()
+        return row[0] if row else None
+
+    def put(self, ns: str, key: str, value: str):
+        self._conn().execute(
+            "INSERT INTO entries (ns, key, value, updated_at) VALUES (?, ?, ?, ?) "
+            "ON CONFLICT (ns, key) DO UPDATE SET value = excluded.value, updated_at = excluded.updated_at",
+            (ns, key, value, time.time()),
+        )
+
+    def claim(self, ns: str, key: str, lease_seconds: float) -> bool:
+        """Try to take the lease on (ns, key); expired leases of crashed workers are reclaimed"""
+        now = time.time()
+        conn = self._conn()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.execute("DELETE FROM leases WHERE ns = ? AND key = ? AND expires_at < ?", (ns, key, now))
+            claimed = conn.execute(
+                "INSERT OR IGNORE INTO leases (ns, key, owner, expires_at) VALUES (?, ?, ?, ?)",
+                (ns, key, self._owner(), now + lease_seconds),
+            ).rowcount == 1
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        return claimed
+
+    def release(self, ns: str, key: str):
+        self._conn().execute("DELETE FROM leases WHERE ns = ? AND key = ? AND owner = ?", (ns, key, self._owner()))
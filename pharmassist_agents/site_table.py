@@ -0,0 +1,74 @@
+"""Shared, immutable columnar site tables referenced from graph state"""
+
+import threading
+import numpy as np
+import pandas as pd
+from collections import OrderedDict
+from pathlib import Path
+from types import MappingProxyType
+from typing import Mapping
+
+from .data_snapshot import data_version
+
+MAX_CACHED_TABLES = 32
+
+
+class SiteTable:
+    """
+    Read-only column arrays for one version of a trials.csv file.
+
+    Graph state only carries the table's ref string; nodes that need per-site
+    data resolve it with get_site_table instead of receiving copied records.
+    """
+
+    def __init__(self, ref: str, columns: Mapping[str, np.ndarray]):
+        for values in columns.values():
+            values.setflags(write=False)
+        self.ref = ref
+        self.columns = MappingProxyType(dict(columns))
+
+    def __getitem__(self, column: str) -> np.ndarray:
+        return self.columns[column]
+
+    def __len__(self) -> int:
+        return len(next(iter(self.columns.values()), ()))
+
+    @property
+    def nbytes(self) -> int:
+        return sum(values.nbytes for values in self.columns.values())
+
+
+_tables: "OrderedDict[str, SiteTable]" = OrderedDict()
+_lock = threading.Lock()
+
+
+def _read_table(path: Path, ref: str) -> SiteTable:
+    df = pd.read_csv(path)
+    return SiteTable(ref, {column: df[column].to_numpy() for column in df.columns})
+
+
+def load_site_table(path: Path) -> SiteTable:
+    """Load (or reuse) the site table for the current contents of a trials.csv file"""
+    ref = f"{path}@{data_version(path)}"
+    return get_site_table(ref)
+
+
+def get_site_table(ref: str) -> SiteTable:
+    """Resolve a table ref, re-reading the file if the table was evicted"""
+    with _lock:
+        table = _tables.get(ref)
+        if table is not None:
+            _tables.move_to_end(ref)
+            return table
+
+    path, _, version = ref.rpartition("@")
+    if data_version(Path(path)) != version:
+        raise KeyError(f"Site table {ref} is no longer available: {path} has changed")
+    table = _read_table(Path(path), ref)
+
+    with _lock:
+        table = _tables.setdefault(ref, table)
+        _tables.move_to_end(ref)
+        while len(_tables) > MAX_CACHED_TABLES:
+            _tables.popitem(last=False)
+    return table
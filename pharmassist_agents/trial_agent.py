@@ -1,16 +1,32 @@
 import gradio as gr
+import hashlib
+import io
 import json
+import sqlite3
+import numpy as np
 import pandas as pd
+from contextlib import closing
+from functools import lru_cache
 from pathlib import Path
-from typing import Annotated, Any, Dict, List, Literal
+from typing import Any, Dict, List
 from typing_extensions import TypedDict
 from dotenv import load_dotenv
 
 from langgraph.graph import StateGraph, START, END
-from langgraph.graph.message import add_messages
-from langchain_openai import ChatOpenAI
-from langchain_core.messages import SystemMessage, HumanMessage
+from langgraph.types import CachePolicy
+from langgraph.cache.sqlite import SqliteCache
+from langgraph.checkpoint.sqlite import SqliteSaver
+from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
 from pydantic import BaseModel, Field
+from xxhash import xxh3_128_hexdigest
+
+from .model_routing import chat_model, model_router
+from .ops_analytics import lvef_improvement
+from .profiling import profiled
+from .prompt_builder import PromptBuilder
+from .data_snapshot import PrecomputedReport, cache_path, data_version, report_store
+from .site_table import load_site_table
+from .trial_scoring import top_risk_outliers, format_outliers, OUTLIER_SCORE_THRESHOLD
 
 load_dotenv()
 
@@ -38,8 +54,13 @@ class FinalRecommendation(BaseModel):
     executive_summary: str = Field(description="1-2 sentence summary for leadership")
 
 class State(TypedDict):
-    """LangGraph State for Trial Analysis"""
-    messages: Annotated[List[Any], add_messages]
+    """
+    LangGraph State for Trial Analysis.
+
+    Kept lean: trial_data holds precomputed aggregates, ranked outliers and a
+    site_table_ref pointing at the shared read-only SiteTable, instead of carrying
+    per-site records through every node and checkpoint.
+    """
     trial_data: Dict[str, Any]
     drug_profile: Dict[str, Any]
     
@@ -61,32 +82,92 @@ class State(TypedDict):
 
 data_dir = Path("data")
 
-def load_trial_data() -> Dict[str, Any]:
-    """Load trial CSV data"""
-    df = pd.read_csv(data_dir / "trials.csv")
+HIGH_DROPOUT_RATE = 10
+
+def efficacy_range(sites) -> str:
+    """Min-max LVEF improvement across the program's sites, e.g. '8.9-12.1%'"""
+    lvef = lvef_improvement(sites)
+    return f"{lvef.min():g}-{lvef.max():g}%" if len(lvef) else "n/a"
+
+def load_trial_data(data_path: Path = data_dir) -> Dict[str, Any]:
+    """Load trial CSV data as aggregates plus a reference to the shared site table"""
+    sites = load_site_table(data_path / "trials.csv")
+    risk = top_risk_outliers(sites)
+    enrolled = sites['enrolled'].sum()
+    target = sites['enrollment_target'].sum()
     return {
-        "total_sites": len(df),
-        "total_enrolled": df['enrolled'].sum(),
-        "enrollment_target": df['enrollment_target'].sum(),
-        "enrollment_pct": round(df['enrolled'].sum() / df['enrollment_target'].sum() * 100, 1),
-        "sites": df.to_dict('records'),
-        "high_dropout_sites": df[df['dropout_rate'] > 10]['site_name'].tolist(),
-        "sites_with_violations": df[df['protocol_violations'] > 2]['site_name'].tolist(),
-        "total_saes": df['serious_adverse_events'].sum(),
-        "average_dropout_rate": round(df['dropout_rate'].mean(), 1),
-        "efficacy_range": f"8.9-12.1%"
+        "total_sites": len(sites),
+        "total_enrolled": int(enrolled),
+        "enrollment_target": int(target),
+        "enrollment_pct": round(float(enrolled / target * 100), 1),
+        "site_table_ref": sites.ref,
+        "high_dropout_site_count": int((sites['dropout_rate'] > HIGH_DROPOUT_RATE).sum()),
+        "violation_site_count": int((sites['protocol_violations'] > 2).sum()),
+        "risk_outliers": risk["outliers"],
+        "flagged_site_count": risk["flagged_site_count"],
+        "risk_baseline": risk["baseline"],
+        "total_saes": int(sites['serious_adverse_events'].sum()),
+        "average_dropout_rate": round(float(sites['dropout_rate'].mean()), 1),
+        "efficacy_range": efficacy_range(sites)
     }
 
-def load_drug_profile() -> Dict[str, Any]:
+def load_drug_profile(data_path: Path = data_dir) -> Dict[str, Any]:
     """Load drug profile JSON"""
-    with open(data_dir / "drug_profile.json") as f:
+    with open(data_path / "drug_profile.json") as f:
         return json.load(f)
 
+def build_initial_state(trial_data: Dict[str, Any], drug_profile: Dict[str, Any]) -> State:
+    """Build the graph input for one trial program"""
+    return State(
+        trial_data=trial_data,
+        drug_profile=drug_profile,
+        initial_analysis="",
+        risk_assessment=None,
+        safety_review=None,
+        final_recommendation=None,
+        has_high_risk=False,
+        has_safety_concerns=False,
+        analysis_complete=False
+    )
+
 # ============================================================================
 # STEP 3: Create Nodes (Ed's Pattern - Multiple Specialized Nodes)
 # ============================================================================
 
-llm = ChatOpenAI(model="gpt-4o-mini")
+# Static instructions per node; trial figures always go last (see prompt_builder).
+# Risk and safety read only their own inputs, so a drug brief edit must not
+# invalidate their cached outputs; the final node gets the program's own brief.
+RISK_PROMPT = PromptBuilder(
+    """As a clinical trial risk assessor, evaluate the trial site issues given in the user message.
+Sites are ranked by composite risk score; z-scores are relative to the cohort, positive = riskier.
+Provide a risk assessment and mitigation strategy.""",
+    schema=RiskAssessment,
+    include_brief=False,
+)
+
+SAFETY_PROMPT = PromptBuilder(
+    """As a clinical safety officer, review the trial safety profile given in the user message.
+Provide a safety assessment and monitoring recommendations.""",
+    schema=SafetyReview,
+    include_brief=False,
+)
+
+FINAL_PROMPT = PromptBuilder(
+    """You are the Chief Clinical Officer evaluating Phase III initiation.
+Make a GO/CONDITIONAL_GO/NO_GO recommendation for Phase III with confidence level,
+considering the readiness assessment in the user message and the drug brief.""",
+    schema=FinalRecommendation,
+)
+
+def invoke_structured(route: str, schema: type, messages: List[Dict[str, str]]) -> BaseModel:
+    """Call the model routed for this node and parse the structured output"""
+    with model_router.track(route) as call:
+        structured = chat_model(call.model).with_structured_output(schema, include_raw=True)
+        result = structured.invoke(messages)
+        call.record_usage(result["raw"])
+        if result["parsing_error"]:
+            raise result["parsing_error"]
+        return result["parsed"]
 
 def trial_analyzer_node(state: State) -> State:
     """
@@ -94,23 +175,28 @@ def trial_analyzer_node(state: State) -> State:
     Determines if there are high-risk factors or safety concerns.
     """
     trial_data = state["trial_data"]
+    flagged = [site for site in trial_data['risk_outliers'] if site['flagged']]
     
     analysis = f"""
 📊 TRIAL DATA SNAPSHOT:
 - Enrollment: {trial_data['total_enrolled']}/{trial_data['enrollment_target']} ({trial_data['enrollment_pct']}%)
 - Sites: {trial_data['total_sites']}
-- High-Dropout Sites (>10%): {len(trial_data['high_dropout_sites'])} - {', '.join(trial_data['high_dropout_sites']) if trial_data['high_dropout_sites'] else 'None'}
-- Protocol Violations: {len(trial_data['sites_with_violations'])} sites
+- High-Dropout Sites (>{HIGH_DROPOUT_RATE}%): {trial_data['high_dropout_site_count']}
+- Protocol Violations: {trial_data['violation_site_count']} sites
+- Risk Outliers (score >= {OUTLIER_SCORE_THRESHOLD}): {trial_data['flagged_site_count']} sites
+{chr(10).join(f"  {site['rank']}. {site['site_id']} {site['site_name']} - score {site['risk_score']:+.2f} ({', '.join(site['drivers']) or 'composite'})" for site in flagged) if flagged else '  None'}
 - Total SAEs: {trial_data['total_saes']}
 - Efficacy: {trial_data['efficacy_range']} LVEF improvement
 """
     
-    # Determine routing flags
-    has_high_risk = len(trial_data['high_dropout_sites']) > 0 or len(trial_data['sites_with_violations']) > 0
+    # Determine routing flags: route on ranked outliers, plus the per-site dropout and
+    # violation checks since z-scores cannot flag a cohort that is uniformly bad
+    has_high_risk = (len(flagged) > 0
+                     or trial_data['high_dropout_site_count'] > 0
+                     or trial_data['violation_site_count'] > 0)
     has_safety_concerns = trial_data['total_saes'] > 2
     
     return {
-        "messages": [{"role": "assistant", "content": analysis}],
         "initial_analysis": analysis,
         "has_high_risk": has_high_risk,
         "has_safety_concerns": has_safety_concerns
@@ -121,21 +207,18 @@ def risk_assessment_node(state: State) -> State:
     Node 2: Deep risk assessment for sites with issues.
     Triggered by has_high_risk flag.
     """
-    llm_with_output = llm.with_structured_output(RiskAssessment)
-    
     trial_data = state["trial_data"]
-    prompt = f"""As a clinical trial risk assessor, evaluate these trial site issues:
-
-High-Dropout Sites: {trial_data['high_dropout_sites']}
-Sites with Protocol Violations: {trial_data['sites_with_violations']}
+    baseline = trial_data['risk_baseline']
+    request = f"""Cohort: {trial_data['total_sites']} sites, {trial_data['flagged_site_count']} flagged as risk outliers
+Cohort Baseline (mean ± std): {'; '.join(f"{name} {stats['mean']} ± {stats['std']}" for name, stats in baseline.items())}
 Average Dropout Rate: {trial_data['average_dropout_rate']}%
 
-Provide a risk assessment and mitigation strategy."""
+Highest-Risk Sites:
+{format_outliers(trial_data['risk_outliers'])}"""
     
-    risk_assessment = llm_with_output.invoke(prompt)
+    risk_assessment = invoke_structured("trial.risk_assessment", RiskAssessment, RISK_PROMPT.messages(request))
     
     return {
-        "messages": [{"role": "assistant", "content": f"Risk Level: {risk_assessment.risk_level}"}],
         "risk_assessment": risk_assessment
     }
 
@@ -144,23 +227,16 @@ def safety_review_node(state: State) -> State:
     Node 3: Safety review for trials with adverse events.
     Triggered by has_safety_concerns flag.
     """
-    llm_with_output = llm.with_structured_output(SafetyReview)
-    
     trial_data = state["trial_data"]
     drug_profile = state["drug_profile"]
     
-    prompt = f"""As a clinical safety officer, review this trial safety profile:
-
-Total SAEs: {trial_data['total_saes']}
+    request = f"""Total SAEs: {trial_data['total_saes']}
 SAE Rate: {round(trial_data['total_saes'] / max(trial_data['total_enrolled'], 1) * 100, 2)}%
-Known Safety Issues: {drug_profile.get('safety_profile', {}).get('serious_adverse_events', [])}
-
-Provide a safety assessment and monitoring recommendations."""
+Known Safety Issues: {drug_profile.get('safety_profile', {}).get('serious_adverse_events', [])}"""
     
-    safety_review = llm_with_output.invoke(prompt)
+    safety_review = invoke_structured("trial.safety_review", SafetyReview, SAFETY_PROMPT.messages(request))
     
     return {
-        "messages": [{"role": "assistant", "content": f"Safety Status: {safety_review.safety_status}"}],
         "safety_review": safety_review
     }
 
@@ -169,14 +245,10 @@ def final_recommendation_node(state: State) -> State:
     Node 4: Synthesize all assessments into final Phase III readiness decision.
     Integrates outputs from risk and safety nodes.
     """
-    llm_with_output = llm.with_structured_output(FinalRecommendation)
-    
     trial_data = state["trial_data"]
     drug_profile = state["drug_profile"]
     
-    # Build context
-    context = f"""
-PHASE III READINESS ASSESSMENT
+    request = f"""PHASE III READINESS ASSESSMENT
 
 Enrollment: {trial_data['enrollment_pct']}% complete
 Risk Level: {state['risk_assessment'].risk_level if state['risk_assessment'] else 'N/A'}
@@ -185,20 +257,11 @@ Efficacy Signal: {trial_data['efficacy_range']} LVEF improvement
 
 Manufacturing Readiness: {drug_profile.get('manufacturing_operations', {}).get('manufacturing_readiness', 'UNKNOWN')}
 Regulatory Status: {drug_profile.get('regulatory_operations', {}).get('submission_readiness', 'UNKNOWN')}
-Commercial Readiness: {drug_profile.get('commercial_operations', {}).get('commercial_readiness', 'UNKNOWN')}
-
-Make a GO/CONDITIONAL_GO/NO_GO recommendation for Phase III with confidence level."""
+Commercial Readiness: {drug_profile.get('commercial_operations', {}).get('commercial_readiness', 'UNKNOWN')}"""
     
-    prompt = f"""You are the Chief Clinical Officer evaluating Phase III initiation:
-
-{context}
-
-Provide your final recommendation considering all factors above."""
-    
-    recommendation = llm_with_output.invoke(prompt)
+    recommendation = invoke_structured("trial.final_recommendation", FinalRecommendation, FINAL_PROMPT.messages(request, profile=drug_profile))
     
     return {
-        "messages": [{"role": "assistant", "content": f"DECISION: {recommendation.go_no_go}"}],
         "final_recommendation": recommendation,
         "analysis_complete": True
     }
@@ -231,10 +294,147 @@ def route_to_final_recommendation(state: State) -> str:
     return "final_recommendation"
 
 # ============================================================================
-# STEP 5: Build Graph (Ed's 5-Step Pattern)
+# STEP 5: Checkpointing and Node-Level Reuse
 # ============================================================================
 
-def create_trial_graph():
+DEFAULT_RUN_ID = "default"
+
+def _hash_inputs(*parts: Any) -> str:
+    """Stable hash of the inputs a node actually reads"""
+    return hashlib.sha256(json.dumps(parts, sort_keys=True, default=str).encode()).hexdigest()
+
+def risk_assessment_key(state: State) -> str:
+    """risk_assessment only depends on its prompt, the ranked outliers and cohort figures"""
+    trial_data = state["trial_data"]
+    return _hash_inputs(
+        RISK_PROMPT.version(),
+        trial_data["total_sites"],
+        trial_data["flagged_site_count"],
+        trial_data["risk_baseline"],
+        trial_data["average_dropout_rate"],
+        trial_data["risk_outliers"],
+    )
+
+def safety_review_key(state: State) -> str:
+    """safety_review only depends on its prompt and SAE figures, so dropout changes reuse its output"""
+    trial_data = state["trial_data"]
+    return _hash_inputs(
+        SAFETY_PROMPT.version(),
+        trial_data["total_saes"],
+        trial_data["total_enrolled"],
+        state["drug_profile"].get("safety_profile", {}).get("serious_adverse_events", []),
+    )
+
+def final_recommendation_key(state: State) -> str:
+    """final_recommendation depends on its prompt, upstream verdicts plus readiness fields"""
+    trial_data = state["trial_data"]
+    drug_profile = state["drug_profile"]
+    return _hash_inputs(
+        FINAL_PROMPT.version(drug_profile),
+        trial_data["enrollment_pct"],
+        trial_data["efficacy_range"],
+        state["risk_assessment"].model_dump() if state["risk_assessment"] else None,
+        state["safety_review"].model_dump() if state["safety_review"] else None,
+        drug_profile.get("manufacturing_operations", {}).get("manufacturing_readiness"),
+        drug_profile.get("regulatory_operations", {}).get("submission_readiness"),
+        drug_profile.get("commercial_operations", {}).get("commercial_readiness"),
+    )
+
+def _serializer() -> JsonPlusSerializer:
+    """Serializer that allows the structured node outputs stored in State"""
+    return JsonPlusSerializer(allowed_msgpack_modules=[
+        (__name__, model.__name__) for model in (RiskAssessment, SafetyReview, FinalRecommendation)
+    ])
+
+@lru_cache(maxsize=1)
+def get_checkpointer() -> SqliteSaver:
+    """Local SQLite checkpointer shared by every trial graph run in this process"""
+    conn = sqlite3.connect(cache_path("trial_checkpoints.sqlite"), check_same_thread=False, timeout=30)
+    # WAL lets worker processes in serving mode read while another one writes
+    conn.execute("PRAGMA journal_mode=WAL")
+    return SqliteSaver(conn, serde=_serializer())
+
+NODE_CACHE_FILE = "trial_node_cache.sqlite"
+
+# Key functions of the cached LLM nodes' CachePolicy
+NODE_CACHE_KEYS = (risk_assessment_key, safety_review_key, final_recommendation_key)
+
+@lru_cache(maxsize=1)
+def get_node_cache() -> SqliteCache:
+    """Local SQLite cache for LLM node outputs, keyed on each node's inputs"""
+    return SqliteCache(path=str(cache_path(NODE_CACHE_FILE)), serde=_serializer())
+
+def run_config(run_id: str, version: str) -> Dict[str, Any]:
+    """Checkpoint config for one run of one data version"""
+    return {"configurable": {"thread_id": f"{run_id}:{version}"}}
+
+def prune_superseded(configs: List[Dict[str, Any]]) -> None:
+    """
+    Drop checkpoint threads left by older data versions of the given runs, then the
+    node cache entries no remaining thread would reuse.
+
+    LangGraph stores each node output under the xxh3 hash of its CachePolicy key, so
+    the live entries are those keys recomputed from every remaining thread's state.
+    """
+    checkpointer = get_checkpointer()
+    checkpointer.setup()
+    current = {config["configurable"]["thread_id"] for config in configs}
+    run_ids = {thread_id.rpartition(":")[0] for thread_id in current}
+
+    threads = [row[0] for row in checkpointer.conn.execute("SELECT DISTINCT thread_id FROM checkpoints")]
+    live_threads = []
+    for thread_id in threads:
+        if thread_id not in current and thread_id.rpartition(":")[0] in run_ids:
+            checkpointer.delete_thread(thread_id)
+        else:
+            live_threads.append(thread_id)
+
+    graph = create_trial_graph(checkpointer=checkpointer)
+    live_keys = set()
+    for thread_id in live_threads:
+        values = graph.get_state({"configurable": {"thread_id": thread_id}}).values
+        if values.get("trial_data"):
+            live_keys.update(xxh3_128_hexdigest(key(values).encode()) for key in NODE_CACHE_KEYS)
+
+    get_node_cache()  # creates the cache table on first use
+    with closing(sqlite3.connect(cache_path(NODE_CACHE_FILE), timeout=30)) as conn, conn:
+        stale = [(key,) for (key,) in conn.execute("SELECT DISTINCT key FROM cache") if key not in live_keys]
+        conn.executemany("DELETE FROM cache WHERE key = ?", stale)
+
+def trial_data_version(data_path: Path = data_dir) -> str:
+    """Version of the inputs the trial graph reads"""
+    return data_version(data_path / "trials.csv", data_path / "drug_profile.json")
+
+def pending_nodes(graph, config: Dict[str, Any]) -> tuple:
+    """Nodes still to run for a checkpointed thread; non-empty means the last run failed midway"""
+    return graph.get_state(config).next
+
+def analyze_trials(data_path: Path = data_dir, run_id: str = DEFAULT_RUN_ID) -> Dict[str, Any]:
+    """
+    Run the checkpointed trial graph for one program.
+
+    A run that failed midway resumes from its last completed node; otherwise a
+    new run starts and LLM nodes whose inputs are unchanged reuse cached outputs.
+    Checkpoints and cached outputs of older data versions are pruned afterwards.
+    """
+    graph = create_trial_graph(checkpointer=get_checkpointer(), cache=get_node_cache())
+    version = trial_data_version(data_path)
+    config = run_config(run_id, version)
+
+    if pending_nodes(graph, config):
+        result = graph.invoke(None, config)
+    else:
+        initial_state = build_initial_state(load_trial_data(data_path), load_drug_profile(data_path))
+        result = graph.invoke(initial_state, config)
+
+    prune_superseded([config])
+    return result
+
+# ============================================================================
+# STEP 6: Build Graph (Ed's 5-Step Pattern)
+# ============================================================================
+
+def create_trial_graph(checkpointer: SqliteSaver | None = None, cache: SqliteCache | None = None):
     """
     Creates the LangGraph workflow with branching logic.
     
@@ -249,9 +449,12 @@ def create_trial_graph():
     
     # Step 3: Add Nodes
     graph_builder.add_node("trial_analyzer", trial_analyzer_node)
-    graph_builder.add_node("risk_assessment", risk_assessment_node)
-    graph_builder.add_node("safety_review", safety_review_node)
-    graph_builder.add_node("final_recommendation", final_recommendation_node)
+    graph_builder.add_node("risk_assessment", risk_assessment_node,
+                           cache_policy=CachePolicy(key_func=risk_assessment_key))
+    graph_builder.add_node("safety_review", safety_review_node,
+                           cache_policy=CachePolicy(key_func=safety_review_key))
+    graph_builder.add_node("final_recommendation", final_recommendation_node,
+                           cache_policy=CachePolicy(key_func=final_recommendation_key))
     
     # Step 4: Create Edges with Conditional Routing
     graph_builder.add_edge(START, "trial_analyzer")
@@ -275,67 +478,17 @@ def create_trial_graph():
     graph_builder.add_edge("final_recommendation", END)
     
     # Step 5: Compile the Graph
-    graph = graph_builder.compile()
+    graph = graph_builder.compile(checkpointer=checkpointer, cache=cache)
     
     return graph
 
 # ============================================================================
-# STEP 6: Gradio Interface
+# STEP 7: Report Formatting
 # ============================================================================
 
-def render_tab():
-    """Render the Trial Agent tab in Gradio"""
-    
-    with gr.Group():
-        gr.Markdown("""
-        ## 🔬 Clinical Trials Agent - Phase IIb Analysis
-        
-        **LangGraph Pattern (Week 4)**: Graph-based workflow with conditional branching
-        
-        Demonstrates:
-        - ✅ State management with TypedDict
-        - ✅ Multiple specialized nodes
-        - ✅ Conditional edge routing (branching logic)
-        - ✅ Structured Pydantic outputs
-        - ✅ Graph visualization support
-        """)
-        
-        with gr.Row():
-            analyze_button = gr.Button("📊 Analyze Trial Data", size="lg")
-        
-        output = gr.Textbox(
-            label="Phase III Readiness Assessment",
-            lines=25,
-            interactive=False,
-            placeholder="Click 'Analyze Trial Data' to generate comprehensive assessment..."
-        )
-        
-        def run_trial_analysis():
-            """Execute the LangGraph workflow with branching"""
-            try:
-                # Load data
-                trial_data = load_trial_data()
-                drug_profile = load_drug_profile()
-                
-                # Create and run graph
-                graph = create_trial_graph()
-                initial_state = State(
-                    messages=[],
-                    trial_data=trial_data,
-                    drug_profile=drug_profile,
-                    initial_analysis="",
-                    risk_assessment=None,
-                    safety_review=None,
-                    final_recommendation=None,
-                    has_high_risk=False,
-                    has_safety_concerns=False,
-                    analysis_complete=False
-                )
-                
-                result = graph.invoke(initial_state)
-                
-                # Format comprehensive output
-                output_text = f"""
+def format_trial_report(result: Dict[str, Any]) -> str:
+    """Format the final graph state as the Phase III readiness report"""
+    return f"""
 {'='*70}
 🏥 PHASE III READINESS ASSESSMENT REPORT
 {'='*70}
@@ -367,7 +520,57 @@ Critical Actions:
 
 {'='*70}
 """
-                return output_text
+
+TRIAL_REPORT = "trial_analysis"
+
+def build_trial_report(data_path: Path = data_dir) -> PrecomputedReport:
+    """Return the formatted report for the current data version, running the graph if needed"""
+    return report_store.get_or_compute(
+        TRIAL_REPORT,
+        trial_data_version(data_path),
+        lambda: format_trial_report(analyze_trials(data_path))
+    )
+
+# ============================================================================
+# STEP 8: Gradio Interface
+# ============================================================================
+
+def render_tab():
+    """Render the Trial Agent tab in Gradio"""
+    
+    with gr.Group():
+        gr.Markdown("""
+        ## 🔬 Clinical Trials Agent - Phase IIb Analysis
+        
+        **LangGraph Pattern (Week 4)**: Graph-based workflow with conditional branching
+        
+        Demonstrates:
+        - ✅ State management with TypedDict
+        - ✅ Multiple specialized nodes
+        - ✅ Conditional edge routing (branching logic)
+        - ✅ Structured Pydantic outputs
+        - ✅ Graph visualization support
+        """)
+        
+        with gr.Row():
+            analyze_button = gr.Button("📊 Analyze Trial Data", size="lg")
+        
+        output = gr.Textbox(
+            label="Phase III Readiness Assessment",
+            lines=25,
+            interactive=False,
+            placeholder="Click 'Analyze Trial Data' to generate comprehensive assessment..."
+        )
+        
+        @profiled("run_trial_analysis")
+        def run_trial_analysis():
+            """Execute the LangGraph workflow with branching"""
+            try:
+                # Serve the pre-warmed report if the data has not changed since;
+                # otherwise run the checkpointed graph (resumes failed runs, reuses unchanged nodes)
+                report = build_trial_report()
+                
+                return f"{report.stamp()}\n{report.text}"
                 
             except Exception as e:
                 import traceback
@@ -376,4 +579,48 @@ Critical Actions:
         analyze_button.click(
             fn=run_trial_analysis,
             outputs=output
-        )
\ No newline at end of file
+        )
+
+
+# ============================================================================
+# Load Test Endpoint (serving mode with --load-test only)
+# ============================================================================
+
+LOAD_TEST_SIZES = (1_000, 10_000, 50_000, 100_000)
+
+
+@lru_cache(maxsize=len(LOAD_TEST_SIZES))
+def synthetic_export(n: int) -> str:
+    """trials.csv-shaped CSV text with n synthetic sites, generated once per size"""
+    rng = np.random.default_rng(7)
+    target = rng.integers(40, 150, n)
+    columns = {
+        "site_id": [f"SITE-{i:06d}" for i in range(n)],
+        "site_name": [f"Site {i}" for i in range(n)],
+        "country": rng.choice(["Germany", "Malaysia", "Singapore"], n),
+        "enrollment_target": target,
+        "enrolled": (target * rng.uniform(0.7, 1.0, n)).astype(int),
+        "completion_pct": rng.integers(50, 95, n),
+        "dropout_rate": rng.integers(2, 18, n),
+        "protocol_violations": rng.integers(0, 6, n),
+        "serious_adverse_events": rng.integers(0, 4, n),
+    }
+    return pd.DataFrame(columns).to_csv(index=False)
+
+
+def rank_synthetic_sites(size: float) -> str:
+    """Parse and score a synthetic export: uncached, CPU-bound work with no LLM call"""
+    if int(size) not in LOAD_TEST_SIZES:
+        raise ValueError(f"size must be one of {LOAD_TEST_SIZES}")
+    sites = pd.read_csv(io.StringIO(synthetic_export(int(size))))
+    risk = top_risk_outliers(sites)
+    return (f"**{len(sites):,} sites**, {risk['flagged_site_count']:,} flagged "
+            f"(score >= {OUTLIER_SCORE_THRESHOLD})\n\n```\n{format_outliers(risk['outliers'])}\n```")
+
+
+def render_load_test_endpoint():
+    """API-only endpoint for loadtest_serving.py; the client picks a size, never a file"""
+    size = gr.Number(visible=False)
+    ranking = gr.Markdown(visible=False)
+    gr.Button(visible=False).click(fn=rank_synthetic_sites, inputs=size, outputs=ranking,
+                                   api_name="rank_synthetic_sites")
@@ -0,0 +1,183 @@
+"""Portfolio mode: run the trial graph across many programs with bounded concurrency"""
+
+import argparse
+import gradio as gr
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict, Iterator, List
+
+from .trial_agent import (
+    build_initial_state,
+    create_trial_graph,
+    get_checkpointer,
+    get_node_cache,
+    load_drug_profile,
+    load_trial_data,
+    pending_nodes,
+    prune_superseded,
+    run_config,
+    trial_data_version,
+)
+
+portfolio_dir = Path("data/programs")
+
+DEFAULT_MAX_CONCURRENCY = 4
+DECISIONS = ["GO", "CONDITIONAL_GO", "NO_GO"]
+SUMMARY_COLUMNS = ["program", "drug", "decision", "confidence", "risk_level",
+                   "safety_status", "enrollment_pct", "top_outlier", "error"]
+
+
+def discover_programs(root: Path = portfolio_dir) -> List[Path]:
+    """Find program directories that contain both trials.csv and drug_profile.json"""
+    if not root.is_dir():
+        return []
+    return sorted(
+        path for path in root.iterdir()
+        if path.is_dir() and (path / "trials.csv").is_file() and (path / "drug_profile.json").is_file()
+    )
+
+
+def _summary_row(program: Path, trial_data: Dict[str, Any], drug_profile: Dict[str, Any],
+                 result: Any) -> Dict[str, Any]:
+    """Flatten one program's graph result (or failure) into a summary row"""
+    row = {column: "" for column in SUMMARY_COLUMNS}
+    row["program"] = program.name
+    row["drug"] = drug_profile.get("name", "") if drug_profile else ""
+    if trial_data:
+        row["enrollment_pct"] = float(trial_data["enrollment_pct"])
+        outliers = trial_data["risk_outliers"]
+        row["top_outlier"] = f"{outliers[0]['site_id']} ({outliers[0]['risk_score']:+.2f})" if outliers else ""
+
+    if isinstance(result, Exception):
+        row["decision"] = "FAILED"
+        row["error"] = f"{type(result).__name__}: {result}"
+        return row
+
+    recommendation = result["final_recommendation"]
+    row["decision"] = recommendation.go_no_go
+    row["confidence"] = recommendation.confidence_level
+    row["risk_level"] = result["risk_assessment"].risk_level if result["risk_assessment"] else "N/A"
+    row["safety_status"] = result["safety_review"].safety_status if result["safety_review"] else "ACCEPTABLE"
+    return row
+
+
+def run_portfolio(root: Path = portfolio_dir,
+                  max_concurrency: int = DEFAULT_MAX_CONCURRENCY) -> Iterator[Dict[str, Any]]:
+    """
+    Run the trial graph for every program under root, yielding summary rows as they complete.
+
+    Programs are executed with graph.batch_as_completed, so at most max_concurrency
+    graphs are in flight. A failure in one program becomes a FAILED row instead of
+    aborting the batch. Each program is checkpointed on its own thread, so a
+    re-run resumes programs that failed midway; threads of older data versions
+    are pruned once the batch is done.
+    """
+    graph = create_trial_graph(checkpointer=get_checkpointer(), cache=get_node_cache())
+
+    programs, trial_data, profiles, inputs, configs = [], [], [], [], []
+    for program in discover_programs(root):
+        try:
+            program_trials = load_trial_data(program)
+            program_profile = load_drug_profile(program)
+            config = run_config(f"portfolio/{program.name}", trial_data_version(program))
+        except Exception as e:
+            yield _summary_row(program, {}, {}, e)
+            continue
+        programs.append(program)
+        trial_data.append(program_trials)
+        profiles.append(program_profile)
+        configs.append({**config, "max_concurrency": max_concurrency})
+        inputs.append(None if pending_nodes(graph, config)
+                      else build_initial_state(program_trials, program_profile))
+
+    if not inputs:
+        return
+
+    results = graph.batch_as_completed(inputs, config=configs, return_exceptions=True)
+    for index, result in results:
+        yield _summary_row(programs[index], trial_data[index], profiles[index], result)
+    prune_superseded(configs)
+
+
+def summarize_decisions(rows: List[Dict[str, Any]]) -> str:
+    """One-line tally of decisions across the portfolio"""
+    counts = Counter(row["decision"] for row in rows)
+    parts = [f"{decision}: {counts.get(decision, 0)}" for decision in DECISIONS]
+    if counts.get("FAILED"):
+        parts.append(f"FAILED: {counts['FAILED']}")
+    return f"{len(rows)} programs - " + ", ".join(parts)
+
+
+def format_summary_table(rows: List[Dict[str, Any]]) -> str:
+    """Render summary rows as a plain-text table for the CLI"""
+    columns = [column for column in SUMMARY_COLUMNS if column != "error"]
+    widths = {column: max([len(column)] + [len(str(row[column])) for row in rows]) for column in columns}
+    lines = ["  ".join(column.ljust(widths[column]) for column in columns)]
+    lines.append("  ".join("-" * widths[column] for column in columns))
+    for row in rows:
+        lines.append("  ".join(str(row[column]).ljust(widths[column]) for column in columns))
+    return "\n".join(lines)
+
+
+def render_portfolio():
+    """Render the portfolio section of the Clinical Trials tab"""
+    with gr.Accordion("📁 Portfolio Mode - Analyze All Programs", open=False):
+        gr.Markdown(
+            "Runs the trial graph for every program directory (each with its own "
+            "`trials.csv` and `drug_profile.json`) using bounded concurrency."
+        )
+        with gr.Row():
+            root = gr.Textbox(label="Programs directory", value=str(portfolio_dir))
+            concurrency = gr.Slider(1, 16, value=DEFAULT_MAX_CONCURRENCY, step=1, label="Max concurrency")
+        run_button = gr.Button("📊 Analyze Portfolio")
+        status = gr.Markdown()
+        table = gr.Dataframe(headers=SUMMARY_COLUMNS, interactive=False, wrap=True)
+
+        def analyze_portfolio(root_dir, max_concurrency):
+            """Stream summary rows into the table as programs complete"""
+            path = Path(root_dir)
+            programs = discover_programs(path)
+            if not programs:
+                yield f"❌ No programs found under `{path}`", []
+                return
+
+            rows = []
+            for row in run_portfolio(path, int(max_concurrency)):
+                rows.append(row)
+                yield (f"⏳ {len(rows)}/{len(programs)} complete",
+                       [[r[column] for column in SUMMARY_COLUMNS] for r in rows])
+            yield f"✅ {summarize_decisions(rows)}", [[r[column] for column in SUMMARY_COLUMNS] for r in rows]
+
+        run_button.click(
+            fn=analyze_portfolio,
+            inputs=[root, concurrency],
+            outputs=[status, table]
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run Phase III readiness analysis across a trial portfolio")
+    parser.add_argument("root", nargs="?", type=Path, default=portfolio_dir,
+                        help="Directory containing one sub-directory per program")
+    parser.add_argument("--max-concurrency", type=int, default=DEFAULT_MAX_CONCURRENCY,
+                        help="Maximum number of programs analyzed at once")
+    args = parser.parse_args()
+
+    programs = discover_programs(args.root)
+    if not programs:
+        print(f"❌ No programs found under {args.root}")
+        raise SystemExit(1)
+
+    print(f"🚀 Analyzing {len(programs)} programs (max concurrency {args.max_concurrency})\n")
+    rows = []
+    for row in run_portfolio(args.root, args.max_concurrency):
+        rows.append(row)
+        suffix = f" - {row['error']}" if row["error"] else ""
+        print(f"  [{len(rows)}/{len(programs)}] {row['program']}: {row['decision']}{suffix}")
+
+    print("\n" + format_summary_table(rows))
+    print("\n" + summarize_decisions(rows))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+"""Vectorized site risk scoring for the Clinical Trials graph"""
+
+import numpy as np
+import pandas as pd
+from typing import Any, Dict, List, Tuple, Union
+
+from .site_table import SiteTable
+
+# Anything indexable by column name: a DataFrame or a shared SiteTable
+Sites = Union[pd.DataFrame, SiteTable]
+
+# Metric -> (weight, direction). Direction +1 means a higher value is riskier.
+RISK_METRICS: Dict[str, Tuple[float, int]] = {
+    "dropout_rate": (0.30, 1),
+    "protocol_violations": (0.25, 1),
+    "sae_rate": (0.20, 1),
+    "enrollment_shortfall": (0.15, 1),
+    "completion_pct": (0.10, -1),
+}
+
+DEFAULT_TOP_K = 5
+OUTLIER_SCORE_THRESHOLD = 0.75
+
+
+def site_metrics(sites: Sites) -> Dict[str, np.ndarray]:
+    """Derive the per-site risk metrics as float arrays (one entry per site)"""
+    enrolled = np.asarray(sites["enrolled"], dtype=float)
+    target = np.asarray(sites["enrollment_target"], dtype=float)
+    saes = np.asarray(sites["serious_adverse_events"], dtype=float)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        sae_rate = np.where(enrolled > 0, saes / enrolled * 100, 0.0)
+        shortfall = np.where(target > 0, (target - enrolled) / target * 100, 0.0)
+
+    return {
+        "dropout_rate": np.asarray(sites["dropout_rate"], dtype=float),
+        "protocol_violations": np.asarray(sites["protocol_violations"], dtype=float),
+        "sae_rate": sae_rate,
+        "enrollment_shortfall": np.clip(shortfall, 0.0, None),
+        "completion_pct": np.asarray(sites["completion_pct"], dtype=float),
+    }
+
+
+def compute_risk_scores(metrics: Dict[str, np.ndarray]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Z-score every metric against the cohort and combine them into a composite score.
+
+    Returns (composite, z) where z has one column per RISK_METRICS entry, already
+    oriented so that positive values always mean "riskier than the cohort".
+    """
+    values = np.column_stack([metrics[name] for name in RISK_METRICS])
+    weights = np.array([weight for weight, _ in RISK_METRICS.values()])
+    directions = np.array([direction for _, direction in RISK_METRICS.values()], dtype=float)
+
+    mean = np.nanmean(values, axis=0)
+    std = np.nanstd(values, axis=0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        z = np.where(std > 0, (values - mean) / std, 0.0) * directions
+    z = np.nan_to_num(z, nan=0.0)
+
+    return z @ weights, z
+
+
+def cohort_baseline(metrics: Dict[str, np.ndarray]) -> Dict[str, Dict[str, float]]:
+    """Cohort mean/std per metric, so prompts can state what 'normal' looks like"""
+    return {
+        name: {
+            "mean": round(float(np.nanmean(values)), 2),
+            "std": round(float(np.nanstd(values)), 2),
+        }
+        for name, values in metrics.items()
+    }
+
+
+def top_risk_outliers(sites: Sites, k: int = DEFAULT_TOP_K) -> Dict[str, Any]:
+    """
+    Score all sites and return the top-k outliers plus cohort context.
+
+    Selection uses argpartition, so only the k winners are sorted and turned into
+    Python objects - the output size is constant regardless of site count.
+    """
+    if len(sites) == 0:
+        return {"outliers": [], "flagged_site_count": 0, "baseline": {}}
+
+    metrics = site_metrics(sites)
+    composite, z = compute_risk_scores(metrics)
+
+    k = min(k, len(composite))
+    top = np.argpartition(-composite, k - 1)[:k]
+    top = top[np.argsort(-composite[top], kind="stable")]
+
+    site_ids = np.asarray(sites["site_id"])
+    site_names = np.asarray(sites["site_name"])
+    countries = np.asarray(sites["country"])
+
+    outliers = []
+    for rank, idx in enumerate(top, start=1):
+        site_z = {name: round(float(z[idx, col]), 2) for col, name in enumerate(RISK_METRICS)}
+        outliers.append({
+            "rank": rank,
+            "site_id": str(site_ids[idx]),
+            "site_name": str(site_names[idx]),
+            "country": str(countries[idx]),
+            "risk_score": round(float(composite[idx]), 2),
+            "flagged": bool(composite[idx] >= OUTLIER_SCORE_THRESHOLD),
+            "metrics": {name: round(float(metrics[name][idx]), 2) for name in RISK_METRICS},
+            "z_scores": site_z,
+            "drivers": sorted((name for name, value in site_z.items() if value >= 1.0),
+                              key=lambda name: -site_z[name]),
+        })
+
+    return {
+        "outliers": outliers,
+        "flagged_site_count": int(np.count_nonzero(composite >= OUTLIER_SCORE_THRESHOLD)),
+        "baseline": cohort_baseline(metrics),
+    }
+
+
+def format_outliers(outliers: List[Dict[str, Any]]) -> str:
+    """Render ranked outliers as compact prompt lines"""
+    if not outliers:
+        return "None"
+
+    lines = []
+    for site in outliers:
+        m, z = site["metrics"], site["z_scores"]
+        lines.append(
+            f"{site['rank']}. {site['site_id']} {site['site_name']} ({site['country']}) "
+            f"score {site['risk_score']:+.2f}{' [FLAGGED]' if site['flagged'] else ''} | "
+            f"dropout {m['dropout_rate']}% (z {z['dropout_rate']:+.1f}) | "
+            f"violations {m['protocol_violations']:g} (z {z['protocol_violations']:+.1f}) | "
+            f"SAE rate {m['sae_rate']}% (z {z['sae_rate']:+.1f}) | "
+            f"enrollment shortfall {m['enrollment_shortfall']}% (z {z['enrollment_shortfall']:+.1f}) | "
+            f"completion {m['completion_pct']}% (z {z['completion_pct']:+.1f})"
+        )
+    return "\n".join(lines)
@@ -0,0 +1,69 @@
+"""Tests for the Drug Profile chat fast path"""
+
+import pytest
+
+from pharmassist_agents.chat_fastpath import FastPath
+
+
+@pytest.fixture
+def fast_path():
+    return FastPath()
+
+
+@pytest.mark.parametrize("question, intent", [
+    ("What's the enrollment percentage?", "enrollment"),
+    ("Which sites have >10% dropout?", "dropout_sites"),
+    ("What's the EMA submission date?", "submission_dates"),
+    ("How many SAEs so far?", "sae_count"),
+    ("When does Phase III start?", "phase_iii_start"),
+    ("How many patients do we need for Phase III?", "phase_iii_requirements"),
+    ("What's our manufacturing capacity?", "manufacturing_capacity"),
+    ("When is the go/no-go decision?", "go_no_go_date"),
+])
+def test_factual_questions_match_one_intent(fast_path, question, intent):
+    assert fast_path.match(question).name == intent
+
+
+@pytest.mark.parametrize("question", [
+    "Should we pursue EMA approval first or go straight for FDA?",
+    "How can we differentiate from Entresto?",
+    "We observed mild arrhythmia in 2% of elderly patients. How should this impact our Phase III design?",
+    "hello",
+    "Which sites have the lowest dropout?",
+    "Which sites have 0 dropout?",
+    "Which sites have dropout between 5 and 8%?",
+    "How many sites are in Germany?",
+    "What is the SAE rate at SITE-007?",
+    "How many SAEs in Germany?",
+    "How many KOLs are in Germany?",
+    "Which sites have dropout of 10% or less?",
+    "Which sites have dropout rates not above 10%?",
+    "which sites have no protocol violations?",
+    "how many sites were terminated?",
+    "How many active sites are there?",
+    "what's the LVEF improvement in the placebo arm?",
+    "what's the sae rate for elderly patients?",
+    "How many SAEs were cardiac?",
+    "How many SAEs were arrhythmia?",
+])
+def test_open_ended_questions_fall_through(fast_path, question):
+    assert fast_path.answer(question) is None
+
+
+def test_answers_come_from_the_data(fast_path):
+    assert "600/640 patients (93.8%)" in fast_path.answer("What's the enrollment percentage?")
+
+    dropout = fast_path.answer("Which sites have more than 10% dropout?")
+    assert "SITE-007" in dropout and "SITE-003" in dropout and "SITE-004" not in dropout
+    assert "SITE-003" not in fast_path.answer("Which sites have dropout above 12%?")
+
+    assert "Q2 2028" in fast_path.answer("When is the EMA submission?")
+    assert "Q4 2028" not in fast_path.answer("When is the EMA submission?")
+
+
+def test_report_tracks_hit_rate(fast_path):
+    fast_path.answer("What's the enrollment percentage?")
+    fast_path.answer("What should be my next steps?")
+    report = fast_path.report()
+    assert "1/2 (50%)" in report
+    assert "enrollment 1" in report
@@ -0,0 +1,58 @@
+"""Tests for the data watcher's startup jobs, debounce and job selection"""
+
+import shutil
+import time
+from pathlib import Path
+
+import pytest
+
+from pharmassist_agents import data_watcher
+from pharmassist_agents.data_watcher import DataWatcher
+
+data_dir = Path("data")
+
+
+def wait_for(condition, timeout: float = 5.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+@pytest.fixture
+def watched(tmp_path, monkeypatch):
+    for name in data_watcher.WATCHED_FILES:
+        shutil.copy(data_dir / name, tmp_path / name)
+    calls = []
+    monkeypatch.setattr(data_watcher, "PREWARM_JOBS",
+                        {name: (lambda name=name: calls.append(name)) for name in data_watcher.PREWARM_JOBS})
+    watcher = DataWatcher(tmp_path, poll_interval=0.01, debounce=0.3)
+    watcher.start()
+    yield tmp_path, calls
+    watcher.stop()
+    watcher.join(timeout=5)
+
+
+def test_startup_warms_only_the_llm_free_jobs(watched):
+    _, calls = watched
+    assert wait_for(lambda: len(calls) == 2)
+    time.sleep(0.1)
+    assert calls == ["chat_fastpath", "profile_index"]
+
+
+def test_burst_of_changes_runs_each_affected_job_once(watched):
+    path, calls = watched
+    assert wait_for(lambda: len(calls) == 2)
+    calls.clear()
+
+    doctors = path / "doctors.csv"
+    for i in range(3):
+        doctors.write_text(doctors.read_text() + f"\n# edit {i}")
+        time.sleep(0.05)
+    assert calls == []  # still inside the debounce window
+
+    assert wait_for(lambda: calls)
+    time.sleep(0.1)
+    assert calls == ["chat_fastpath", "ops_readiness"]
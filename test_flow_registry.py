@@ -0,0 +1,83 @@
+"""Tests for the Flow Creator registry and executor"""
+
+import threading
+
+import pytest
+import yaml
+
+from pharmassist_agents import creator_agent, flow_registry as registry_module
+from pharmassist_agents.flow_registry import FlowBusyError, FlowExecutor, FlowRegistry
+
+
+@pytest.fixture
+def config_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(creator_agent, "CONFIG_DIR", tmp_path)
+    return tmp_path
+
+
+def test_created_flows_are_compiled_with_registry_tools(config_dir):
+    registry = FlowRegistry(config_dir)
+    assert registry.names() == []
+
+    assert creator_agent.create_flow("Site Review", "Review sites", "analyze_site_performance").startswith("Created")
+    flow = registry.get("Site Review")
+    assert [tool.name for tool in flow.tools] == ["analyze_site_performance"]
+    assert registry.names() == ["Site Review"]
+
+
+def test_unknown_tools_are_rejected(config_dir):
+    assert creator_agent.create_flow("Bad", "goal", "files,http").startswith("Unknown tools")
+    assert not list(config_dir.iterdir())
+
+    (config_dir / "broken.yaml").write_text(yaml.safe_dump({"name": "Broken", "tools": ["http"]}))
+    registry = FlowRegistry(config_dir)
+    with pytest.raises(KeyError, match="invalid"):
+        registry.get("Broken")
+    assert "broken" in registry.errors()
+
+
+def test_flows_whose_name_does_not_match_their_file_are_rejected(config_dir):
+    creator_agent.create_flow("Site Review", "Review sites", "analyze_site_performance")
+    (config_dir / "site_review.yaml").rename(config_dir / "renamed.yaml")
+
+    registry = FlowRegistry(config_dir)
+    assert registry.names() == []
+    assert "site_review.yaml" in registry.errors()["renamed"]
+    with pytest.raises(KeyError):
+        registry.get("Site Review")
+
+
+def test_only_edited_flows_are_recompiled(config_dir):
+    for i in range(3):
+        creator_agent.create_flow(f"Flow {i}", f"goal {i}", "read_regulatory_timeline")
+    registry = FlowRegistry(config_dir)
+    registry.names()
+    assert registry.compiles == 3
+
+    registry.get("Flow 1")
+    assert registry.compiles == 3
+
+    path = config_dir / "flow_1.yaml"
+    path.write_text(path.read_text().replace("goal 1", "a longer edited goal"))
+    assert registry.get("Flow 1").goal == "a longer edited goal"
+    assert registry.compiles == 4
+
+    path.unlink()
+    with pytest.raises(KeyError):
+        registry.get("Flow 1")
+    assert registry.names() == ["Flow 0", "Flow 2"]
+
+
+def test_executor_is_bounded(config_dir, monkeypatch):
+    creator_agent.create_flow("Slow", "goal", "")
+    release = threading.Event()
+    monkeypatch.setattr(registry_module, "synthesize", lambda flow, request, outputs: release.wait(5) and request)
+
+    executor = FlowExecutor(FlowRegistry(config_dir), workers=1, queue_depth=1)
+    futures = [executor.submit("Slow", "a"), executor.submit("Slow", "b")]
+    with pytest.raises(FlowBusyError):
+        executor.submit("Slow", "c")
+
+    release.set()
+    assert [future.result() for future in futures] == ["a", "b"]
+    assert executor.run("Slow", "d") == "d"
@@ -0,0 +1,112 @@
+"""Tests for per-route model selection, SLO fallback and the cost report"""
+
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from pharmassist_agents.model_routing import ModelRouter, load_routes
+
+
+@pytest.fixture
+def router():
+    return ModelRouter({
+        "tiers": {
+            "fast": {"model": "small-model", "input_cost_per_1m": 1.0, "output_cost_per_1m": 2.0},
+            "strong": {"model": "big-model", "input_cost_per_1m": 10.0, "output_cost_per_1m": 20.0,
+                       "fallback": "fast"},
+        },
+        "defaults": {"tier": "fast", "latency_slo_ms": 10, "window": 5, "cooldown_seconds": 60},
+        "routes": {"trial.final_recommendation": {"tier": "strong"}},
+    })
+
+
+def test_shipped_routes_reference_known_tiers():
+    config = load_routes()
+    for route, settings in config["routes"].items():
+        assert settings.get("tier", config["defaults"]["tier"]) in config["tiers"], route
+    for tier in config["tiers"].values():
+        assert tier.get("fallback", "fast") in config["tiers"]
+
+
+def test_routes_pick_their_tier_and_env_overrides(router, monkeypatch):
+    assert router.model_for("trial.final_recommendation") == "big-model"
+    assert router.model_for("unlisted.route") == "small-model"
+    monkeypatch.setenv("PHARMASSIST_ROUTE_TRIAL_FINAL_RECOMMENDATION", "fast")
+    assert router.model_for("trial.final_recommendation") == "small-model"
+
+
+def test_usage_and_cost_are_recorded(router):
+    with router.track("trial.final_recommendation") as call:
+        call.record_usage(SimpleNamespace(usage_metadata={"input_tokens": 1000, "output_tokens": 500}))
+    with router.track("unlisted.route") as call:
+        call.record_usage(SimpleNamespace(usage=SimpleNamespace(prompt_tokens=2000, completion_tokens=0)))
+
+    report = router.report()
+    assert "| trial.final_recommendation | big-model | 1 | 0 |" in report
+    assert "0.0200" in report  # 1000 * $10/1M + 500 * $20/1M
+    assert "**Total cost:** $0.0220" in report
+
+
+def test_slo_breach_falls_back_then_recovers(router, monkeypatch):
+    for _ in range(5):
+        with router.track("trial.final_recommendation"):
+            time.sleep(0.02)
+    assert router.model_for("trial.final_recommendation") == "small-model"
+    assert "trial.final_recommendation" in router.report().split("Degraded")[1]
+
+    expired = time.monotonic() + 61
+    monkeypatch.setattr("pharmassist_agents.model_routing.time.monotonic", lambda: expired)
+    assert router.model_for("trial.final_recommendation") == "big-model"
+
+
+def test_errors_are_counted_and_reraised(router):
+    with pytest.raises(RuntimeError):
+        with router.track("unlisted.route"):
+            raise RuntimeError("boom")
+    assert "| unlisted.route | small-model | 1 | 1 |" in router.report()
+
+
+def test_cached_tokens_are_reported_and_discounted(router):
+    router.tiers["fast"]["cached_input_cost_per_1m"] = 0.5
+    with router.track("unlisted.route") as call:
+        call.record_usage(SimpleNamespace(usage_metadata={
+            "input_tokens": 2000, "output_tokens": 0, "input_token_details": {"cache_read": 1000}}))
+    with router.track("unlisted.route") as call:
+        call.record_usage(SimpleNamespace(usage=SimpleNamespace(
+            prompt_tokens=2000, completion_tokens=0, prompt_tokens_details=SimpleNamespace(cached_tokens=1024))))
+
+    report = router.report()
+    assert "| 4,000 | 2,024 | 0 |" in report
+    assert "0.0030" in report  # 1976 * $1/1M + 2024 * $0.50/1M
+    assert "**Prompt cache hit rate:** 51% of input tokens" in report
+
+
+def test_slow_crew_route_is_recorded_and_falls_back(router, monkeypatch):
+    from datetime import datetime, timedelta, timezone
+    from crewai.events.types.llm_events import LLMCallCompletedEvent, LLMCallStartedEvent, LLMCallType
+    from pharmassist_agents import ops_team_agent
+
+    router.routes["ops_crew.ops_manager"] = {"tier": "strong"}
+    tracker = ops_team_agent.CrewCallTracker(router)
+    tracker.register("Chief Operations Officer", "ops_crew.ops_manager")
+
+    start = datetime.now(timezone.utc)
+    for i in range(5):
+        common = {"call_id": f"call-{i}", "agent_role": "Chief Operations Officer", "model": "big-model"}
+        finished = LLMCallCompletedEvent(**common, response="ok", call_type=LLMCallType.LLM_CALL,
+                                         usage={"prompt_tokens": 1000, "completion_tokens": 100},
+                                         timestamp=start + timedelta(seconds=2))
+        # The bus may deliver the completion first
+        tracker.on_event(None, finished)
+        tracker.on_event(None, LLMCallStartedEvent(**common, timestamp=start))
+
+    report = router.report()
+    assert "| ops_crew.ops_manager | big-model | 5 | 0 | 2.00 | 2.00 | 5,000 | 0 | 500 |" in report
+    assert router.model_for("ops_crew.ops_manager") == "small-model"
+
+    # The next crew is built on the fallback tier
+    monkeypatch.setattr(ops_team_agent, "model_router", router)
+    crew = ops_team_agent.create_ops_crew()
+    manager = next(agent for agent in crew.agents if agent.role.startswith("Chief Operations Officer"))
+    assert manager.llm.model == "small-model"
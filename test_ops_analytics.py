@@ -0,0 +1,90 @@
+"""Tests for the Ops Team analytic tools"""
+
+import json
+import shutil
+import yaml
+import pytest
+from pathlib import Path
+
+from pharmassist_agents import ops_analytics as analytics
+from pharmassist_agents.ops_team_tools import TOOL_REGISTRY, resolve_tools
+
+config_dir = Path("pharmassist_agents/ops_team_config")
+data_dir = Path("data")
+
+
+def test_every_declared_tool_is_registered():
+    with open(config_dir / "agents.yaml") as f:
+        agents = yaml.safe_load(f)
+
+    for agent in agents.values():
+        assert len(resolve_tools(agent.get("tools", []))) == len(agent.get("tools", []))
+
+
+def test_unknown_tool_name_fails_loudly():
+    with pytest.raises(KeyError):
+        resolve_tools(["read_trials_data", "no_such_tool"])
+
+
+def test_scorecard_ranks_site_007_last():
+    card = analytics.site_scorecard(analytics.load_trials())
+
+    assert card["best_sites"][-1]["site_id"] == "SITE-007"
+    assert card["delayed_sites"] == ["SITE-007"]
+
+
+def test_enrollment_and_sae_figures_match_the_csv():
+    trials = analytics.load_trials()
+    profile = analytics.load_profile()
+
+    enrollment = analytics.enrollment_projection(trials, profile)
+    saes = analytics.sae_rates(trials, profile)
+
+    assert enrollment["enrolled"] == trials["enrolled"].sum()
+    assert enrollment["target"] == trials["enrollment_target"].sum()
+    assert saes["total_saes"] == trials["serious_adverse_events"].sum()
+
+
+def test_analytic_tools_return_compact_json():
+    raw = {"read_trials_data", "read_drug_profile", "read_kol_database"}
+    for name, registered in TOOL_REGISTRY.items():
+        if name in raw:
+            continue
+        output = registered.run()
+        assert isinstance(json.loads(output), dict)
+        assert len(output) < 4000, name
+
+
+def test_task_prompts_render_current_figures():
+    from pharmassist_agents.ops_team_agent import PLACEHOLDER, ops_data_version, render_configs
+
+    agents, tasks = render_configs(ops_data_version())
+    facts = analytics.fact_sheet()
+
+    for config in (agents, tasks):
+        for entry in config.values():
+            for value in entry.values():
+                assert not PLACEHOLDER.search(str(value)), value
+    assert f"{facts['enrolled']}/{facts['enrollment_target']}" in tasks["analyze_trial_sites_task"]["description"]
+    assert (f"{facts['months_to_phase_iii']} months available before Phase III launch {facts['phase_iii_start']}"
+            in tasks["evaluate_manufacturing_capacity_task"]["description"])
+
+
+def test_literal_braces_in_prompts_are_kept():
+    from pharmassist_agents.ops_team_agent import fill_placeholders
+
+    text = 'Return JSON like {"site": "{risk_site}", "actions": []} for {risk_site}'
+    assert fill_placeholders(text, {"risk_site": "SITE-007"}) == \
+        'Return JSON like {"site": "SITE-007", "actions": []} for SITE-007'
+
+
+def test_fact_sheet_handles_an_empty_trials_table(tmp_path):
+    for name in ["doctors.csv", "drug_profile.json"]:
+        shutil.copy(data_dir / name, tmp_path / name)
+    (tmp_path / "trials.csv").write_text((data_dir / "trials.csv").read_text().splitlines()[0] + "\n")
+
+    facts = analytics.fact_sheet(tmp_path)
+
+    assert analytics.riskiest_site(analytics.load_trials(tmp_path)) is None
+    assert facts["site_count"] == 0 and facts["risk_site"] == "n/a" and facts["lvef_min"] == "n/a"
+    assert analytics.riskiest_site(analytics.load_trials())["site_id"] == "SITE-007"
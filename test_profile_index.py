@@ -0,0 +1,103 @@
+"""Tests for the Drug Profile chat retrieval index"""
+
+import json
+import shutil
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from pharmassist_agents import data_snapshot
+from pharmassist_agents.profile_index import (
+    MAX_SITE_CHUNKS,
+    ProfileIndex,
+    ProfileRetriever,
+    build_chunks,
+    profile_chunks,
+)
+from pharmassist_agents.ops_analytics import load_profile
+
+data_dir = Path("data")
+
+
+@pytest.fixture
+def program(tmp_path, monkeypatch):
+    monkeypatch.setattr(data_snapshot, "CACHE_DIR", tmp_path / "cache")
+    source = tmp_path / "data"
+    source.mkdir()
+    for name in ["drug_profile.json", "trials.csv"]:
+        shutil.copy(data_dir / name, source / name)
+    return source
+
+
+def test_chunks_cover_profile_sections_and_sites(program):
+    ids = [chunk_id for chunk_id, _ in build_chunks(program)]
+    assert "profile.regulatory_operations.regulatory_timeline" in ids
+    assert "profile.manufacturing_operations.current_capacity" in ids
+    assert "trials.SITE-007" in ids
+    assert "trials.country.Germany" in ids
+    assert len(ids) == len(set(ids))
+
+
+def test_search_returns_relevant_top_k(program):
+    retriever = ProfileRetriever(program)
+    hits = retriever.search("What is the EMA submission timeline?", k=3)
+    assert len(hits) <= 3
+    assert hits[0]["id"] == "profile.regulatory_operations.regulatory_timeline"
+
+    site = retriever.search("Hamburg University Medical dropout", k=1)
+    assert site[0]["id"] == "trials.SITE-007"
+
+
+def test_edit_re_embeds_only_changed_chunks(program):
+    retriever = ProfileRetriever(program)
+    first = retriever.refresh()
+
+    path = program / "drug_profile.json"
+    profile = json.loads(path.read_text())
+    profile["safety_profile"]["discontinuation_rate"] = "5%"
+    path.write_text(json.dumps(profile))
+
+    second = retriever.refresh()
+    changed = [i for i, (a, b) in enumerate(zip(first.digests, second.digests)) if a != b]
+    assert [second.ids[i] for i in changed] == ["profile.safety_profile.discontinuation_rate"]
+    assert "5%" in retriever.search("discontinuation rate", k=1)[0]["text"]
+
+
+def test_index_is_persisted_and_reloaded(program):
+    ProfileRetriever(program).refresh()
+    index, sources = ProfileIndex.load(data_snapshot.cache_path("profile_index.npz"))
+    assert index is not None and len(sources) == 2
+
+    reloaded = ProfileRetriever(program).refresh()
+    assert reloaded.ids == index.ids
+
+
+def test_index_stays_small_for_large_site_counts(program):
+    n = 20_000
+    rng = np.random.default_rng(3)
+    target = rng.integers(40, 150, n)
+    pd.DataFrame({
+        "site_id": [f"SITE-{i:06d}" for i in range(n)],
+        "site_name": [f"Site {i}" for i in range(n)],
+        "country": rng.choice(["Germany", "Malaysia", "Singapore"], n),
+        "enrollment_target": target,
+        "enrolled": (target * 0.9).astype(int),
+        "completion_pct": rng.integers(50, 95, n),
+        "dropout_rate": rng.integers(2, 18, n),
+        "protocol_violations": rng.integers(0, 6, n),
+        "adverse_events_total": rng.integers(0, 20, n),
+        "serious_adverse_events": rng.integers(0, 4, n),
+        "efficacy_lvef_improvement": "9.5%",
+        "status": "Active",
+    }).to_csv(program / "trials.csv", index=False)
+
+    index = ProfileRetriever(program).refresh()
+    assert len(index.ids) == len(profile_chunks(load_profile(program))) + 3 + MAX_SITE_CHUNKS
+    assert data_snapshot.cache_path("profile_index.npz").stat().st_size < 100_000
+    assert not list(data_snapshot.CACHE_DIR.glob("*.tmp.npz"))
+
+    hits = ProfileRetriever(program).search("How many trial sites are in Germany?", k=1)
+    assert hits[0]["id"] == "trials.country.Germany"
+    assert hits[0]["text"].endswith("more")
@@ -0,0 +1,106 @@
+"""Tests for on-demand request profiling"""
+
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from pharmassist_agents import profiling
+from pharmassist_agents.profiling import RequestProfiler, profiled
+
+
+def busy(seconds):
+    end = time.thread_time() + seconds
+    while time.thread_time() < end:
+        pass
+
+
+def handler():
+    busy(0.15)
+    time.sleep(0.15)
+    return "done"
+
+
+def pooled_handler():
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="helper") as pool:
+        return pool.submit(handler).result()
+
+
+@pytest.fixture
+def profiler(tmp_path, monkeypatch):
+    profiler = RequestProfiler("off", tmp_path)
+    monkeypatch.setattr(profiling, "request_profiler", profiler)
+    return profiler
+
+
+def test_disabled_profiling_saves_nothing(profiler, tmp_path):
+    assert profiled("handler")(handler)() == "done"
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_sampling_splits_on_cpu_and_io_wait(profiler, tmp_path):
+    profiler.set_mode("sample")
+    assert profiled("handler")(handler)() == "done"
+
+    summary = json.loads(next(tmp_path.glob("*-handler-*.json")).read_text())
+    assert summary["wall_s"] >= 0.3
+    assert 0.1 <= summary["on_cpu_s"] <= 0.25
+    assert 0.1 <= summary["io_wait_s"] <= 0.3
+
+    folded = next(tmp_path.glob("*.folded")).read_text().splitlines()
+    on_cpu = [line for line in folded if line.startswith("[on-cpu]") and "busy (" in line]
+    off_cpu = [line for line in folded if line.startswith("[off-cpu]") and "handler (" in line]
+    assert on_cpu and off_cpu
+    assert all(line.rsplit(" ", 1)[1].isdigit() for line in folded)
+
+
+def test_sampling_covers_work_on_helper_threads(profiler, tmp_path):
+    profiler.set_mode("sample")
+    assert profiled("pooled")(pooled_handler)() == "done"
+
+    summary = json.loads(next(tmp_path.glob("*-pooled-*.json")).read_text())
+    assert 0.1 <= summary["on_cpu_s"] <= 0.25
+    assert summary["request_thread_cpu_s"] < 0.05
+
+    folded = next(tmp_path.glob("*.folded")).read_text().splitlines()
+    assert any(line.startswith("[on-cpu];helper") and "busy (" in line for line in folded)
+    assert any(line.startswith("[off-cpu];MainThread (request)") and "pooled_handler (" in line for line in folded)
+    assert any(frame["frame"].startswith("[on-cpu] busy (") for frame in summary["top_frames"])
+
+
+def test_only_the_newest_profiles_are_kept(profiler, tmp_path):
+    profiler.set_mode("sample")
+    profiler.keep = 2
+    for _ in range(3):
+        profiled("quick")(lambda: None)()
+
+    assert len(list(tmp_path.glob("*.json"))) == 2
+    assert len(list(tmp_path.glob("*.folded"))) == 2
+
+
+def test_admin_panel_needs_the_env_flag(monkeypatch):
+    import gradio as gr
+
+    with gr.Blocks() as hidden:
+        profiling.render_admin()
+    monkeypatch.setenv("PHARMASSIST_PROFILE_ADMIN", "true")
+    with gr.Blocks() as shown:
+        profiling.render_admin()
+
+    assert not hidden.fns and shown.fns
+
+
+def test_deterministic_mode_writes_cprofile_stats(profiler, tmp_path):
+    profiler.set_mode("deterministic")
+    profiled("handler")(handler)()
+
+    assert next(tmp_path.glob("*.prof")).stat().st_size > 0
+    summary = json.loads(next(tmp_path.glob("*.json")).read_text())
+    assert any("busy" in frame["frame"] for frame in summary["top_frames"])
+    assert "handler" in profiler.report()
+
+
+def test_unknown_mode_is_rejected(profiler):
+    with pytest.raises(ValueError):
+        profiler.set_mode("fast")
@@ -0,0 +1,105 @@
+"""Tests for prompt prefix stability across the outreach, trial and chat call sites"""
+
+import json
+import shutil
+from pathlib import Path
+from types import SimpleNamespace
+
+from pharmassist_agents import data_snapshot, drug_profile_agent, outreach_agent, trial_agent
+from pharmassist_agents.profile_index import ProfileRetriever
+from pharmassist_agents.prompt_builder import PromptBuilder, drug_brief
+from pharmassist_agents.trial_agent import RiskAssessment
+
+data_dir = Path("data")
+
+
+def test_static_sections_come_first_in_a_fixed_order():
+    builder = PromptBuilder("Assess the risk.", schema=RiskAssessment)
+    system = builder.messages("per-request data")[0]["content"]
+    assert system.index("Assess the risk.") < system.index("DRUG BRIEF") < system.index("OUTPUT FORMAT")
+    assert "mitigation_strategy: How to mitigate risks" in system
+    assert builder.messages("per-request data")[-1] == {"role": "user", "content": "per-request data"}
+
+
+def test_brief_and_version_follow_the_drug_profile(tmp_path):
+    shutil.copy(data_dir / "drug_profile.json", tmp_path / "drug_profile.json")
+    builder = PromptBuilder("Assess the risk.", data_path=tmp_path)
+    before = builder.version()
+    assert "LVEF" in drug_brief(tmp_path) and before == builder.version()
+
+    profile = json.loads((tmp_path / "drug_profile.json").read_text())
+    profile["regulatory_operations"]["approval_pathway"] = "Standard EMA review"
+    (tmp_path / "drug_profile.json").write_text(json.dumps(profile))
+    assert "Standard EMA review" in drug_brief(tmp_path)
+    assert builder.version() != before
+
+
+def test_outreach_prefix_is_shared_across_doctors():
+    first = outreach_agent.formal_prompt.messages(outreach_agent.doctor_details("Tan", "Cardiology"))
+    second = outreach_agent.formal_prompt.messages(outreach_agent.doctor_details("Mueller", "Nephrology"))
+    assert first[:-1] == second[:-1]
+    assert "Tan" in first[-1]["content"] and "Tan" not in first[0]["content"]
+
+
+def test_trial_prefix_is_shared_across_programs(monkeypatch):
+    sent = []
+    monkeypatch.setattr(trial_agent, "invoke_structured",
+                        lambda route, schema, messages: sent.append(messages))
+    state = trial_agent.build_initial_state(trial_agent.load_trial_data(data_dir),
+                                            trial_agent.load_drug_profile(data_dir))
+    trial_agent.risk_assessment_node(state)
+    state["trial_data"] = {**state["trial_data"], "average_dropout_rate": 42.0}
+    trial_agent.risk_assessment_node(state)
+
+    assert sent[0][:-1] == sent[1][:-1]
+    assert "42.0%" in sent[1][-1]["content"] and "42.0%" not in sent[1][0]["content"]
+
+
+def test_final_prompt_uses_each_programs_own_brief(monkeypatch):
+    sent = []
+    monkeypatch.setattr(trial_agent, "invoke_structured",
+                        lambda route, schema, messages: sent.append(messages))
+    profile = json.loads((data_dir / "drug_profile.json").read_text())
+    profile["name"] = "NeuroCalm"
+    state = trial_agent.build_initial_state(trial_agent.load_trial_data(data_dir), profile)
+    trial_agent.final_recommendation_node(state)
+
+    system = sent[0][0]["content"]
+    assert "DRUG BRIEF - NeuroCalm" in system and "CardioRelief" not in system
+
+
+def test_unrelated_brief_edit_keeps_risk_and_safety_cache_keys():
+    profile = json.loads((data_dir / "drug_profile.json").read_text())
+    state = trial_agent.build_initial_state(trial_agent.load_trial_data(data_dir), profile)
+    before = [key(state) for key in (trial_agent.risk_assessment_key, trial_agent.safety_review_key,
+                                     trial_agent.final_recommendation_key)]
+
+    edited = json.loads(json.dumps(profile))
+    edited["commercial_operations"]["competitor_landscape"] = []
+    state["drug_profile"] = edited
+    after = [key(state) for key in (trial_agent.risk_assessment_key, trial_agent.safety_review_key,
+                                    trial_agent.final_recommendation_key)]
+
+    assert after[:2] == before[:2]
+    assert after[2] != before[2]  # the final node's prompt carries the brief
+
+
+def test_chat_keeps_retrieved_facts_out_of_the_system_prompt(tmp_path, monkeypatch):
+    monkeypatch.setattr(data_snapshot, "CACHE_DIR", tmp_path / "cache")
+    monkeypatch.setattr(drug_profile_agent, "profile_retriever", ProfileRetriever(data_dir))
+    sent = []
+
+    def create(**kwargs):
+        sent.append(kwargs["messages"])
+        return SimpleNamespace(usage=None, choices=[SimpleNamespace(message=SimpleNamespace(content="ok"))])
+
+    monkeypatch.setattr(drug_profile_agent, "client",
+                        SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create))))
+    history = [("Hi", "Hello, how can I help?")]
+    drug_profile_agent.respond("What does the arrhythmia signal mean for Phase III design?", history)
+    drug_profile_agent.respond("How does our Entresto competitor pricing compare?", history)
+
+    assert sent[0][:-1] == sent[1][:-1]
+    assert sent[0][0]["content"] == drug_profile_agent.advisor_prompt.system_prompt()
+    assert "Relevant facts" in sent[0][-1]["content"]
+    assert sent[0][-1]["content"].endswith("Question: What does the arrhythmia signal mean for Phase III design?")
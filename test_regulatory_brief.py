@@ -0,0 +1,62 @@
+"""Tests for the Regulatory Brief section hashing, caching and streaming"""
+
+import copy
+import threading
+import time
+
+import pytest
+
+from pharmassist_agents import regulatory_agent
+from pharmassist_agents.data_snapshot import ReportStore
+from pharmassist_agents.ops_analytics import load_profile
+from pharmassist_agents.regulatory_agent import SECTIONS, profile_subtree, section_version
+
+
+def versions(profile):
+    return {section.key: section_version(section, profile_subtree(profile, section.paths)) for section in SECTIONS}
+
+
+def test_profile_edit_changes_only_dependent_section_hashes():
+    profile = load_profile()
+    edited = copy.deepcopy(profile)
+    edited["regulatory_operations"]["cmc_status"] = "CMC documentation 90% complete"
+
+    before, after = versions(profile), versions(edited)
+    assert [key for key in before if before[key] != after[key]] == ["cmc_gaps"]
+
+
+@pytest.fixture
+def fake_sections(monkeypatch):
+    monkeypatch.setattr(regulatory_agent, "report_store", ReportStore())
+    calls = []
+    active, peak = [0], [0]
+    lock = threading.Lock()
+
+    def generate(section, subtree):
+        with lock:
+            calls.append(section.key)
+            active[0] += 1
+            peak[0] = max(peak[0], active[0])
+        time.sleep(0.05)
+        with lock:
+            active[0] -= 1
+        return f"{section.key} body"
+
+    monkeypatch.setattr(regulatory_agent, "generate_section", generate)
+    return calls, peak
+
+
+def test_sections_stream_in_parallel_and_are_reused(fake_sections):
+    calls, peak = fake_sections
+    updates = list(regulatory_agent.stream_brief())
+
+    assert "⏳" in updates[0] and "⏳" not in updates[-1]
+    assert len(updates) == len(SECTIONS) + 2
+    assert sorted(calls) == sorted(section.key for section in SECTIONS)
+    assert peak[0] > 1
+
+    calls.clear()
+    brief = regulatory_agent.generate_brief()
+    assert calls == []
+    assert f"♻️ {len(SECTIONS)} section(s) reused" in brief
+    assert brief.index("## 🛤️ Regulatory Pathway") < brief.index("## ⚠️ Risk Management Plan")
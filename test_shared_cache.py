@@ -0,0 +1,49 @@
+"""Tests for the cross-worker shared cache behind the report store"""
+
+import threading
+import time
+
+from pharmassist_agents.data_snapshot import ReportStore
+from pharmassist_agents.shared_cache import SharedCache
+
+
+def worker_stores(tmp_path, n=2):
+    """Report stores as separate worker processes would have them: own memory, one database"""
+    return [ReportStore(SharedCache(tmp_path / "shared.sqlite")) for _ in range(n)]
+
+
+def test_report_put_by_one_worker_is_served_by_another(tmp_path):
+    first, second = worker_stores(tmp_path)
+    first.put("trial_analysis", "v1", "report text")
+
+    assert second.get("trial_analysis", "v1").text == "report text"
+    assert second.get("trial_analysis", "v2") is None
+
+
+def test_concurrent_workers_compute_once(tmp_path):
+    stores = worker_stores(tmp_path, 4)
+    calls = []
+
+    def compute():
+        calls.append(threading.get_ident())
+        time.sleep(0.3)
+        return "computed once"
+
+    results = []
+    threads = [threading.Thread(target=lambda s=s: results.append(s.get_or_compute("ops", "v1", compute).text))
+               for s in stores]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert results == ["computed once"] * 4
+
+
+def test_expired_lease_is_reclaimed(tmp_path):
+    crashed, alive = SharedCache(tmp_path / "shared.sqlite"), SharedCache(tmp_path / "shared.sqlite")
+    assert crashed.claim("reports", "ops@v1", lease_seconds=0.05)
+    assert not alive.claim("reports", "ops@v1", lease_seconds=10)
+    time.sleep(0.1)
+    assert alive.claim("reports", "ops@v1", lease_seconds=10)
@@ -0,0 +1,99 @@
+"""Tests for trial graph checkpoint resume and node-level output reuse"""
+
+import shutil
+import sqlite3
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from pharmassist_agents import data_snapshot, trial_agent
+
+data_dir = Path("data")
+
+
+def offline_structured(route, schema, messages):
+    """Fixed structured outputs instead of API calls"""
+    if schema is trial_agent.RiskAssessment:
+        return schema(risk_level="HIGH", risk_factors=["test"], mitigation_strategy="n/a")
+    if schema is trial_agent.SafetyReview:
+        return schema(safety_status="ACCEPTABLE", adverse_events_summary="n/a", monitoring_recommendations=["n/a"])
+    return schema(go_no_go="GO", confidence_level="HIGH", critical_actions=["n/a"], executive_summary="n/a")
+
+
+@pytest.fixture
+def program(tmp_path, monkeypatch):
+    monkeypatch.setattr(data_snapshot, "CACHE_DIR", tmp_path / "cache")
+    trial_agent.get_checkpointer.cache_clear()
+    trial_agent.get_node_cache.cache_clear()
+    source = tmp_path / "data"
+    source.mkdir()
+    for name in ["drug_profile.json", "trials.csv"]:
+        shutil.copy(data_dir / name, source / name)
+    yield source
+
+    trial_agent.get_checkpointer.cache_clear()
+    trial_agent.get_node_cache.cache_clear()
+
+
+def test_failed_run_resumes_at_the_failed_node(program, monkeypatch):
+    routes, failures = [], ["trial.final_recommendation"]
+
+    def structured(route, schema, messages):
+        routes.append(route)
+        if route in failures:
+            failures.remove(route)
+            raise RuntimeError("API timeout")
+        return offline_structured(route, schema, messages)
+
+    monkeypatch.setattr(trial_agent, "invoke_structured", structured)
+    with pytest.raises(RuntimeError, match="API timeout"):
+        trial_agent.analyze_trials(program)
+    assert sorted(routes) == ["trial.final_recommendation", "trial.risk_assessment", "trial.safety_review"]
+
+    routes.clear()
+    result = trial_agent.analyze_trials(program)
+    assert routes == ["trial.final_recommendation"]
+    assert result["final_recommendation"].go_no_go == "GO"
+
+
+def test_dropout_only_edit_reruns_only_risk_assessment(program, monkeypatch):
+    routes = []
+    monkeypatch.setattr(trial_agent, "invoke_structured",
+                        lambda route, schema, messages: routes.append(route) or offline_structured(route, schema, messages))
+    trial_agent.analyze_trials(program)
+    assert len(routes) == 3
+
+    trials = pd.read_csv(program / "trials.csv")
+    trials.loc[trials["site_id"] == "SITE-001", "dropout_rate"] += 1
+    trials.to_csv(program / "trials.csv", index=False)
+
+    routes.clear()
+    trial_agent.analyze_trials(program)
+    assert routes == ["trial.risk_assessment"]
+
+
+def test_new_data_version_prunes_old_threads_and_unused_node_outputs(program, monkeypatch):
+    monkeypatch.setattr(trial_agent, "invoke_structured", offline_structured)
+    trial_agent.analyze_trials(program)
+    trial_agent.analyze_trials(program, run_id="other")
+
+    trials = pd.read_csv(program / "trials.csv")
+    trials.loc[trials["site_id"] == "SITE-001", "dropout_rate"] += 1
+    trials.to_csv(program / "trials.csv", index=False)
+    trial_agent.analyze_trials(program)
+
+    checkpointer = trial_agent.get_checkpointer()
+    threads = sorted(row[0] for row in checkpointer.conn.execute("SELECT DISTINCT thread_id FROM checkpoints"))
+    assert len(threads) == 2
+    assert threads[0] == f"default:{trial_agent.trial_data_version(program)}"
+    assert threads[1].startswith("other:")
+
+    # "other" still uses the old risk output; safety and final are shared by both threads
+    with sqlite3.connect(data_snapshot.cache_path(trial_agent.NODE_CACHE_FILE)) as conn:
+        assert conn.execute("SELECT COUNT(*) FROM cache").fetchone()[0] == 4
+
+    checkpointer.delete_thread(threads[1])
+    trial_agent.prune_superseded([trial_agent.run_config("default", trial_agent.trial_data_version(program))])
+    with sqlite3.connect(data_snapshot.cache_path(trial_agent.NODE_CACHE_FILE)) as conn:
+        assert conn.execute("SELECT COUNT(*) FROM cache").fetchone()[0] == 3
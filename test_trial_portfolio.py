@@ -0,0 +1,112 @@
+"""Tests for portfolio mode: discovery, per-program failures and streamed rows"""
+
+import json
+import shutil
+from pathlib import Path
+
+import pytest
+
+from pharmassist_agents import data_snapshot, trial_agent
+from pharmassist_agents.trial_portfolio import discover_programs, run_portfolio, summarize_decisions
+
+data_dir = Path("data")
+
+
+def offline_structured(route, schema, messages):
+    """Fixed structured outputs instead of API calls"""
+    if schema is trial_agent.RiskAssessment:
+        return schema(risk_level="HIGH", risk_factors=["test"], mitigation_strategy="n/a")
+    if schema is trial_agent.SafetyReview:
+        return schema(safety_status="ACCEPTABLE", adverse_events_summary="n/a", monitoring_recommendations=["n/a"])
+    return schema(go_no_go="GO", confidence_level="HIGH", critical_actions=["n/a"], executive_summary="n/a")
+
+
+@pytest.fixture
+def portfolio(tmp_path, monkeypatch):
+    monkeypatch.setattr(data_snapshot, "CACHE_DIR", tmp_path / "cache")
+    monkeypatch.setattr(trial_agent, "invoke_structured", offline_structured)
+    trial_agent.get_checkpointer.cache_clear()
+    trial_agent.get_node_cache.cache_clear()
+
+    root = tmp_path / "programs"
+    for name in ["alpha", "beta", "gamma"]:
+        (root / name).mkdir(parents=True)
+        shutil.copy(data_dir / "drug_profile.json", root / name / "drug_profile.json")
+        shutil.copy(data_dir / "trials.csv", root / name / "trials.csv")
+    (root / "gamma" / "trials.csv").write_text("site_id,unexpected\nSITE-001,1\n")
+    (root / "notes").mkdir()  # no program files: not discovered
+    yield root
+
+    trial_agent.get_checkpointer.cache_clear()
+    trial_agent.get_node_cache.cache_clear()
+
+
+def test_discovers_only_complete_program_directories(portfolio):
+    assert [path.name for path in discover_programs(portfolio)] == ["alpha", "beta", "gamma"]
+    assert discover_programs(portfolio / "missing") == []
+
+
+def test_broken_program_becomes_a_failed_row(portfolio, monkeypatch):
+    routes = []
+    monkeypatch.setattr(trial_agent, "invoke_structured",
+                        lambda route, schema, messages: routes.append(route) or offline_structured(route, schema, messages))
+    stream = run_portfolio(portfolio, max_concurrency=2)
+
+    # Rows are streamed: the load failure arrives before any graph has run
+    rows = [next(stream)]
+    assert rows[0]["program"] == "gamma" and routes == []
+    rows.extend(stream)
+
+    by_program = {row["program"]: row for row in rows}
+    assert sorted(by_program) == ["alpha", "beta", "gamma"]
+    assert by_program["gamma"]["decision"] == "FAILED"
+    assert "KeyError" in by_program["gamma"]["error"]
+    for name in ["alpha", "beta"]:
+        assert by_program[name]["decision"] == "GO"
+        assert by_program[name]["top_outlier"].startswith("SITE-007")
+        assert by_program[name]["error"] == ""
+    assert summarize_decisions(rows) == "3 programs - GO: 2, CONDITIONAL_GO: 0, NO_GO: 0, FAILED: 1"
+
+
+def test_graph_failure_in_one_program_does_not_abort_the_batch(portfolio, monkeypatch):
+    profile = json.loads((portfolio / "beta" / "drug_profile.json").read_text())
+    profile["safety_profile"]["serious_adverse_events"] = ["beta-only event"]
+    (portfolio / "beta" / "drug_profile.json").write_text(json.dumps(profile))
+
+    def flaky_structured(route, schema, messages):
+        if "beta-only event" in messages[-1]["content"]:
+            raise RuntimeError("safety review unavailable")
+        return offline_structured(route, schema, messages)
+
+    monkeypatch.setattr(trial_agent, "invoke_structured", flaky_structured)
+    by_program = {row["program"]: row for row in run_portfolio(portfolio, max_concurrency=2)}
+
+    assert by_program["alpha"]["decision"] == "GO"
+    assert by_program["beta"]["decision"] == "FAILED"
+    assert "safety review unavailable" in by_program["beta"]["error"]
+
+
+def test_each_program_gets_its_own_efficacy_range(portfolio, monkeypatch):
+    import pandas as pd
+
+    trials = pd.read_csv(portfolio / "beta" / "trials.csv")
+    trials["efficacy_lvef_improvement"] = [f"{3 + i * 0.5:.1f}%" for i in range(len(trials))]
+    trials.to_csv(portfolio / "beta" / "trials.csv", index=False)
+    profile = json.loads((portfolio / "beta" / "drug_profile.json").read_text())
+    profile["name"] = "BetaDrug"
+    (portfolio / "beta" / "drug_profile.json").write_text(json.dumps(profile))
+
+    final_requests = {}
+
+    def structured(route, schema, messages):
+        if route == "trial.final_recommendation":
+            drug = "beta" if "DRUG BRIEF - BetaDrug" in messages[0]["content"] else "alpha"
+            final_requests[drug] = messages[-1]["content"]
+        return offline_structured(route, schema, messages)
+
+    monkeypatch.setattr(trial_agent, "invoke_structured", structured)
+    list(run_portfolio(portfolio, max_concurrency=2))
+
+    last = 3 + (len(trials) - 1) * 0.5
+    assert "Efficacy Signal: 8.9-12.1% LVEF improvement" in final_requests["alpha"]
+    assert f"Efficacy Signal: 3-{last:g}% LVEF improvement" in final_requests["beta"]
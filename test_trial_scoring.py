@@ -0,0 +1,116 @@
+"""Tests for the vectorized site risk scoring engine"""
+
+import time
+import numpy as np
+import pandas as pd
+from pathlib import Path
+
+from pharmassist_agents.trial_scoring import (
+    DEFAULT_TOP_K,
+    RISK_METRICS,
+    compute_risk_scores,
+    format_outliers,
+    site_metrics,
+    top_risk_outliers,
+)
+
+data_dir = Path("data")
+
+
+def synthetic_sites(n: int, seed: int = 7) -> pd.DataFrame:
+    """Generate a trials.csv-shaped frame with n sites"""
+    rng = np.random.default_rng(seed)
+    target = rng.integers(40, 150, n)
+    enrolled = np.minimum(target, (target * rng.uniform(0.7, 1.0, n)).astype(int))
+    return pd.DataFrame({
+        "site_id": [f"SITE-{i:06d}" for i in range(n)],
+        "site_name": [f"Site {i}" for i in range(n)],
+        "country": rng.choice(["Germany", "Malaysia", "Singapore"], n),
+        "enrollment_target": target,
+        "enrolled": enrolled,
+        "completion_pct": rng.integers(50, 95, n),
+        "dropout_rate": rng.integers(2, 18, n),
+        "protocol_violations": rng.integers(0, 6, n),
+        "serious_adverse_events": rng.integers(0, 4, n),
+    })
+
+
+def test_site_007_ranks_first_on_sample_data():
+    df = pd.read_csv(data_dir / "trials.csv")
+    risk = top_risk_outliers(df)
+
+    assert risk["outliers"][0]["site_id"] == "SITE-007"
+    assert risk["outliers"][0]["flagged"]
+    assert risk["flagged_site_count"] >= 1
+    assert [site["rank"] for site in risk["outliers"]] == list(range(1, DEFAULT_TOP_K + 1))
+
+
+def test_constant_metric_contributes_zero():
+    df = synthetic_sites(50)
+    df["protocol_violations"] = 3
+
+    _, z = compute_risk_scores(site_metrics(df))
+
+    assert np.all(z[:, list(RISK_METRICS).index("protocol_violations")] == 0)
+
+
+def test_low_completion_is_riskier():
+    df = synthetic_sites(2)
+    for column in ["enrollment_target", "enrolled", "dropout_rate", "protocol_violations", "serious_adverse_events"]:
+        df[column] = df[column].iloc[0]
+    df["completion_pct"] = [90, 60]
+
+    composite, _ = compute_risk_scores(site_metrics(df))
+
+    assert composite[1] > composite[0]
+
+
+def test_scales_to_100k_sites_with_constant_prompt_size():
+    small = format_outliers(top_risk_outliers(synthetic_sites(1_000))["outliers"])
+    df = synthetic_sites(100_000)
+
+    start = time.perf_counter()
+    risk = top_risk_outliers(df)
+    elapsed = time.perf_counter() - start
+
+    assert len(risk["outliers"]) == DEFAULT_TOP_K
+    assert elapsed < 1.0
+    assert abs(len(format_outliers(risk["outliers"])) - len(small)) < 200
+
+
+def test_uniformly_bad_cohort_still_routes_to_risk_assessment(tmp_path):
+    from pharmassist_agents import trial_agent
+
+    df = synthetic_sites(20)
+    for column in ["enrollment_target", "enrolled", "completion_pct", "dropout_rate", "serious_adverse_events"]:
+        df[column] = df[column].iloc[0]
+    df["dropout_rate"] = 5
+    df["protocol_violations"] = 5
+    df.to_csv(tmp_path / "trials.csv", index=False)
+
+    trial_data = trial_agent.load_trial_data(tmp_path)
+    state = trial_agent.build_initial_state(trial_data, {})
+    result = trial_agent.trial_analyzer_node(state)
+
+    assert trial_data["flagged_site_count"] == 0
+    assert result["has_high_risk"]
+
+
+def test_high_dropout_sites_route_to_risk_assessment_below_the_average(tmp_path):
+    from pharmassist_agents import trial_agent
+
+    df = synthetic_sites(40)
+    for column in ["enrollment_target", "enrolled", "completion_pct", "serious_adverse_events"]:
+        df[column] = df[column].iloc[0]
+    df["dropout_rate"] = [12] * 20 + [7] * 20
+    df["protocol_violations"] = 1
+    df.to_csv(tmp_path / "trials.csv", index=False)
+
+    trial_data = trial_agent.load_trial_data(tmp_path)
+    state = trial_agent.build_initial_state(trial_data, {})
+    result = trial_agent.trial_analyzer_node(state)
+
+    assert trial_data["flagged_site_count"] == 0
+    assert trial_data["average_dropout_rate"] < trial_agent.HIGH_DROPOUT_RATE
+    assert trial_data["high_dropout_site_count"] == 20
+    assert result["has_high_risk"]